@@ -415,4 +415,27 @@ class TestRoleManagement:
         # Verify action buttons are present
         add_button = page.is_element_present(page.ADD_ROLE_BTN)
         assert add_button, "Add Role button should be present"
-        print("✅ Role management UI elements verified")
\ No newline at end of file
+        print("✅ Role management UI elements verified")
+    
+    @pytest.mark.parametrize("mode", ["bulk", "keystroke"])
+    def test_fill_role_form_modes_skip_unknown_permissions(self, admin_page, slow_action_fixture, mode):
+        """Bulk and keystroke form fill check the same boxes and skip permissions the form does not offer"""
+        page = AdministrationPage(admin_page)
+        
+        page.click_role_management_nav()
+        slow_action_fixture()
+        page.click_add_role_button()
+        slow_action_fixture()
+        
+        available = {checkbox.get_attribute('value') for checkbox in page.driver.find_elements(*page.PERMISSIONS_CHECKBOXES)}
+        requested = ["dashboard", "alerts", "not_a_permission"]
+        page.fill_role_form(
+            role_name="Fill Mode Role",
+            description="Same input in both fill modes",
+            permissions=requested,
+            mode=mode
+        )
+        
+        selected = set(page.get_selected_permissions())
+        assert selected == set(requested) & available, f"{mode} fill selected {sorted(selected)}"
+        print(f"✅ {mode} fill selected {sorted(selected)}")
\ No newline at end of file
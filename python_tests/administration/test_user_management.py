@@ -23,8 +23,15 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from page_objects.administration_page import AdministrationPage
+from helpers.mock_driver import driver_mode
 from helpers.test_data import TestDataHelper
 
+# The page object expects ID/Department columns and <select> filters that the prototype does not have yet
+# (see HTML_ID_MODIFICATION_PLAN.md). The DOM mock reads the actual prototype, so these tests fail there.
+prototype_user_table_mismatch = pytest.mark.xfail(
+    "driver_mode() == 'dom'", strict=True,
+    reason="Prototype user table has no ID/Department columns and its role filter is not a <select>")
+
 @pytest.mark.user_management
 class TestUserManagement:
     """Test suite for User Management functionality"""
@@ -52,6 +59,23 @@ class TestUserManagement:
         rows_count = page.get_user_table_rows_count()
         print(f"📊 Found {rows_count} user rows in table")
         
+    def test_user_table_snapshot_matches_per_cell_read(self, admin_page, slow_action_fixture):
+        """Verify the single-script table read returns the same users as the per-cell read"""
+        page = AdministrationPage(admin_page)
+        
+        # Navigate to User Management
+        page.click_user_management_nav()
+        slow_action_fixture()
+        
+        snapshot = page.get_tables_snapshot()
+        if snapshot is None:
+            pytest.skip("Driver cannot read tables in the browser")
+        
+        per_cell_users = page.get_user_table_data_per_cell()
+        assert len(per_cell_users) > 0, "User table should have rows to compare"
+        assert snapshot['users'] == per_cell_users, "Batched extraction must match per-cell extraction"
+        print(f"✅ Batched read matches per-cell read for {len(per_cell_users)} users")
+    
     def test_ep23_add_new_user_valid_data(self, admin_page, slow_action_fixture):
         """EP-23: Add new user with valid data"""
         page = AdministrationPage(admin_page)
@@ -144,7 +168,7 @@ class TestUserManagement:
             print(f"📝 Editing first user: {users[0]}")
             
             # Click edit button for first user (assuming edit button exists)
-            edit_btn = page.driver.find_elements(By.CSS_SELECTOR, ".edit-user-btn")
+            edit_btn = page.find_elements_now((By.CSS_SELECTOR, ".edit-user-btn"))
             if edit_btn:
                 edit_btn[0].click()
                 slow_action_fixture()
@@ -269,6 +293,7 @@ class TestUserManagement:
         cleared_count = page.get_user_table_rows_count()
         print(f"🔄 Users after clearing filters: {cleared_count}")
     
+    @prototype_user_table_mismatch
     def test_ep27_filter_users_by_role(self, admin_page, slow_action_fixture):
         """EP-27: Filter users by role"""
         page = AdministrationPage(admin_page)
@@ -295,6 +320,7 @@ class TestUserManagement:
         page.clear_all_filters()
         slow_action_fixture()
     
+    @prototype_user_table_mismatch
     def test_ep28_search_users_by_name(self, admin_page, slow_action_fixture):
         """EP-28: Search users by name"""
         page = AdministrationPage(admin_page)
@@ -323,6 +349,7 @@ class TestUserManagement:
         else:
             pytest.skip("No users available for search test")
     
+    @prototype_user_table_mismatch
     def test_ep28_search_users_by_email(self, admin_page, slow_action_fixture):
         """EP-28: Search users by email"""
         page = AdministrationPage(admin_page)
@@ -364,6 +391,7 @@ class TestUserManagement:
         # Note: Actual file upload testing would require additional setup
         # and file handling which depends on the specific implementation
     
+    @prototype_user_table_mismatch
     def test_user_status_filter_active(self, admin_page, slow_action_fixture):
         """Filter users by Active status"""
         page = AdministrationPage(admin_page)
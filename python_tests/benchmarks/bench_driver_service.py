@@ -0,0 +1,88 @@
+"""
+Benchmark: per-test browser startup with a per-test vs. a shared driver service
+Launches and quits N headless browser sessions, first spawning a new
+msedgedriver/chromedriver per session (the old conftest behaviour), then against
+one shared driver process, and reports the startup time saved per test.
+
+Needs the real browser and driver installed; browsers that are not found are skipped.
+
+Usage:
+    python python_tests/benchmarks/bench_driver_service.py [--sessions 10] [--browsers edge chrome]
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# Add the parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from selenium import webdriver
+from selenium.webdriver.chrome.options import Options as ChromeOptions
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.edge.options import Options as EdgeOptions
+from selenium.webdriver.edge.service import Service as EdgeService
+
+from helpers.driver_resolver import browser_executable, resolve_driver_path
+from helpers.driver_service import shared_service, shutdown_services
+
+BROWSERS = {
+    "edge": (webdriver.Edge, EdgeService, EdgeOptions),
+    "chrome": (webdriver.Chrome, ChromeService, ChromeOptions),
+}
+
+
+def make_options(options_class):
+    options = options_class()
+    options.add_argument("--headless")
+    options.add_argument("--no-sandbox")
+    options.add_argument("--disable-dev-shm-usage")
+    return options
+
+
+def time_sessions(browser, sessions, shared):
+    """Startup and quit times (ms) of sessions launched one after another"""
+    driver_class, service_class, options_class = BROWSERS[browser]
+    startups, quits = [], []
+    for _ in range(sessions):
+        if shared:
+            service = shared_service(browser, service_class)
+        else:
+            service = service_class(resolve_driver_path(browser))
+        start = time.perf_counter()
+        driver = driver_class(service=service, options=make_options(options_class))
+        startups.append((time.perf_counter() - start) * 1000)
+        start = time.perf_counter()
+        driver.quit()
+        quits.append((time.perf_counter() - start) * 1000)
+    if shared:
+        shutdown_services()
+    return startups, quits
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--sessions', type=int, default=10, help='Browser sessions per mode')
+    parser.add_argument('--browsers', nargs='+', choices=sorted(BROWSERS), default=sorted(BROWSERS))
+    args = parser.parse_args()
+
+    print(f"{'Browser':>8} | {'Mode':>10} | {'Start p50':>10} | {'Quit p50':>9} | {'Total/test':>10}")
+    print("-" * 60)
+    for browser in args.browsers:
+        if browser_executable(browser) is None:
+            print(f"{browser:>8} | skipped (browser not installed)")
+            continue
+        totals = {}
+        for mode, shared in (("per-test", False), ("shared", True)):
+            startups, quits = time_sessions(browser, args.sessions, shared)
+            totals[mode] = statistics.mean(s + q for s, q in zip(startups, quits))
+            print(f"{browser:>8} | {mode:>10} | {statistics.median(startups):>8.0f}ms | "
+                  f"{statistics.median(quits):>7.0f}ms | {totals[mode]:>8.0f}ms")
+        saved = totals["per-test"] - totals["shared"]
+        print(f"{browser:>8} | {'saved':>10} | {saved:>8.0f}ms per test "
+              f"({saved / totals['per-test']:.0%} of launch + quit)")
+
+
+if __name__ == "__main__":
+    main()
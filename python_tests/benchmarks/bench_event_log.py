@@ -0,0 +1,62 @@
+"""
+Benchmark: mocked-suite time with streamed vs. buffered event logging
+Runs the administration tests against the mock driver, once with every mock and
+fixture event printed as it happens (--event-log-level=DEBUG, the old print
+behaviour) and once with the default buffered event log, and compares the session
+time pytest reports (interpreter start-up and collection excluded). Runs of the
+two modes alternate after one unmeasured warm-up run, so disk-cache and CPU
+frequency drift do not favour whichever mode runs last.
+
+Usage:
+    python python_tests/benchmarks/bench_event_log.py [--repeat 15] [--no-capture]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MODES = {
+    "streamed": ["--event-log-level=DEBUG"],
+    "buffered": [],
+}
+
+
+def run_suite(extra_args, no_capture):
+    """Seconds pytest reports for one mocked run of the administration tests"""
+    command = [sys.executable, "-m", "pytest", "administration", "-q", "-p", "no:cacheprovider", *extra_args]
+    if no_capture:
+        command.append("-s")
+    output = subprocess.run(command, cwd=TESTS_DIR, capture_output=True, text=True).stdout
+    durations = re.findall(r" in ([0-9.]+)s", output)
+    if not durations:
+        raise RuntimeError(f"Could not find the session time in pytest output:\n{output[-2000:]}")
+    return float(durations[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--repeat', type=int, default=15, help='Runs per mode')
+    parser.add_argument('--no-capture', action='store_true', help='Run with -s (events go straight to the terminal)')
+    args = parser.parse_args()
+
+    print(f"{'Mode':>9} | {'Median':>8} | {'Min':>8} | {'Max':>8}")
+    print("-" * 42)
+    run_suite(MODES["buffered"], args.no_capture)  # warm-up
+    times = {mode: [] for mode in MODES}
+    for _ in range(args.repeat):
+        for mode, extra_args in MODES.items():
+            times[mode].append(run_suite(extra_args, args.no_capture))
+    medians = {}
+    for mode, mode_times in times.items():
+        medians[mode] = statistics.median(mode_times)
+        print(f"{mode:>9} | {medians[mode]:>7.2f}s | {min(mode_times):>7.2f}s | {max(mode_times):>7.2f}s")
+    saved = medians["streamed"] - medians["buffered"]
+    print(f"Buffered logging saves {saved:.2f}s per run ({saved / medians['streamed']:.0%})")
+
+
+if __name__ == "__main__":
+    main()
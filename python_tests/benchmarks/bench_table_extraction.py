@@ -0,0 +1,94 @@
+"""
+Benchmark: WebDriver round trips for user table extraction
+Compares the per-cell path (find_elements + .text per cell) with the batched
+single execute_script path at 10, 100 and 1000 rows.
+
+Uses an in-process counting driver, so it runs without a browser. Each counted
+call is one HTTP round trip to msedgedriver/chromedriver in a real run; pass
+--latency-ms to estimate wall-clock cost at a given round-trip latency. Both paths
+read the same synthetic rows, so this only counts round trips; that they return the
+same users is checked in a browser by test_user_table_snapshot_matches_per_cell_read.
+
+Usage:
+    python python_tests/benchmarks/bench_table_extraction.py [--latency-ms 3]
+"""
+import argparse
+import os
+import sys
+
+# Add the parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_objects.administration_page import AdministrationPage
+
+ROW_COUNTS = [10, 100, 1000]
+COLUMNS = ["", "U{:04d}", "User {}", "user{}@company.com", "IT", "Administrator", "Active", "Hong Kong", "Edit"]
+
+
+class CountingCell:
+    def __init__(self, driver, text):
+        self._driver = driver
+        self._text = text
+
+    @property
+    def text(self):
+        self._driver.round_trips += 1
+        return self._text
+
+
+class CountingRow:
+    def __init__(self, driver, cells):
+        self._driver = driver
+        self._cells = cells
+
+    def find_elements(self, by, value):
+        self._driver.round_trips += 1
+        return [CountingCell(self._driver, text) for text in self._cells]
+
+
+class CountingDriver:
+    """Fake driver holding a synthetic user table; counts every WebDriver call"""
+
+    def __init__(self, row_count, batched):
+        self.round_trips = 0
+        self._batched = batched
+        self._rows = [[column.format(i) for column in COLUMNS] for i in range(row_count)]
+
+    def find_elements(self, by, value):
+        self.round_trips += 1
+        if value == AdministrationPage.USER_TABLE_ROWS[1]:
+            return [CountingRow(self, cells) for cells in self._rows]
+        return []
+
+    def execute_script(self, script, *args):
+        self.round_trips += 1
+        if not self._batched:
+            return None
+        headers = ["", "User ID", "Name", "Email", "Department", "Role", "Status", "Location", "Actions"]
+        return [{'headers': headers, 'rows': self._rows}, {'headers': [], 'rows': []}]
+
+
+def measure(row_count, batched):
+    driver = CountingDriver(row_count, batched)
+    page = AdministrationPage(driver)
+    page.get_user_table_data() if batched else page.get_user_table_data_per_cell()
+    return driver.round_trips
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--latency-ms', type=float, default=3.0, help='Assumed WebDriver round-trip latency')
+    args = parser.parse_args()
+
+    print(f"{'Rows':>6} | {'Per-cell trips':>14} | {'Batched trips':>13} | "
+          f"{'Per-cell est.':>13} | {'Batched est.':>12}")
+    print("-" * 72)
+    for row_count in ROW_COUNTS:
+        per_cell_trips = measure(row_count, batched=False)
+        batched_trips = measure(row_count, batched=True)
+        print(f"{row_count:>6} | {per_cell_trips:>14} | {batched_trips:>13} | "
+              f"{per_cell_trips * args.latency_ms / 1000:>12.2f}s | {batched_trips * args.latency_ms / 1000:>11.3f}s")
+
+
+if __name__ == "__main__":
+    main()
@@ -10,6 +10,7 @@ class TestConfig:
     # Base paths
     PROJECT_ROOT = Path(__file__).parent.parent
     HTML_FILES_PATH = PROJECT_ROOT
+    RESULTS_DIR = PROJECT_ROOT / "test_results"  # Root of every generated artifact (git-ignored)
     
     # HTML file paths (convert to file:// URLs)
     ADMIN_PROTOTYPE_URL = f"file://{HTML_FILES_PATH}/admin-prototype.html"
@@ -21,17 +22,80 @@ class TestConfig:
     BROWSER = "edge"  # Options: edge, chrome, firefox
     HEADLESS = False  # Set to True to run tests in background
     IMPLICIT_WAIT = 10  # Seconds to wait for elements
+    IMPLICIT_WAIT_STALL_DETECTION = True  # Report element lookups that blocked on the implicit wait
+    IMPLICIT_WAIT_STALL_MS = 250  # An empty lookup slower than this counts as an implicit-wait stall
+    COMMAND_INSTRUMENTATION = True  # Count and time every WebDriver command per test (JSON report metrics)
     PAGE_LOAD_TIMEOUT = 30  # Seconds to wait for page load
     SLOW_MOTION = True  # Add delays between actions for visibility
     SLOW_MOTION_DELAY = 0.5  # Seconds delay between actions
+    TURBO_MODE = True  # Wait for the page to settle instead of sleeping (set False for visible demos)
+    SETTLE_QUIET_MS = 100  # DOM must be unchanged this long to count as settled
+    SETTLE_TIMEOUT = 5  # Seconds before a settle wait gives up
+    IDLE_TRACKING = True  # Inject the timer/animation idle tracker into prototype pages
+    IDLE_TIMEOUT = 10  # Seconds before wait_until_idle gives up
+    IDLE_MAX_TIMER_MS = 2500  # Longer timers (e.g. banner auto-hide) do not count as pending work
+    WAIT_POLL_INITIAL = 0.025  # First poll interval (seconds) of explicit waits
+    WAIT_POLL_MAX = 0.5  # Poll interval backs off up to this (Selenium's default)
+    WAIT_POLL_BACKOFF = 1.5  # Poll interval multiplier after each unsatisfied poll
+    FORM_FILL_MODE = "bulk"  # "bulk" (one script call per form) or "keystroke" (type into each field)
+    
+    # Paginated table reader settings
+    TABLE_MAX_PAGES = 50  # Safety limit when streaming paginated tables
+    TABLE_PAGE_CHANGE_TIMEOUT = 1  # Seconds to wait for rows to change after clicking next
+    
+    # Browser pool settings
+    REUSE_BROWSER = True  # Share browsers across tests and reset them between tests
+    BROWSER_WARM_SPARES = 1  # Browsers launched ahead when REUSE_BROWSER is off (0 = launch on demand)
+    BROWSER_LAUNCH_TIMEOUT = 60  # Seconds before a background launch is abandoned and replaced
+    
+    # Driver settings
+    DRIVER_MANIFEST_PATH = RESULTS_DIR / "driver-manifest.json"  # Cached driver binary per browser
+    SHARE_DRIVER_SERVICE = True  # Start msedgedriver/chromedriver once per session; tests only open browser sessions
+    
+    # Fast-launch profile settings
+    FAST_LAUNCH_PROFILE = True  # Clone a pre-initialised profile per browser and trim startup work (enables real headless runs)
+    PROFILE_TEMPLATE_DIR = (Path(os.environ.get("LOCALAPPDATA") or os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+                            / "e2e-communication-platform" / "profile-templates")  # User cache; one template per browser version
+    
+    # Event log settings
+    EVENT_LOG_LEVEL = "WARNING"  # Mock/fixture events printed as they happen; the rest are shown only for failures
+    EVENT_LOG_BUFFER = 500  # Events kept per test for failure reports
+    
+    # Mock driver settings
+    MOCK_VIRTUAL_TIME = True  # With the mock driver, sleeps and wait timeouts advance a virtual clock instead of real time
+    MOCK_DRIVER = "placeholder"  # Mock used without a browser: "placeholder" (any locator matches), "dom" (real prototype markup) or "replay" (recorded cassettes)
+    
+    # Cassette settings (--record-cassettes / --replay)
+    RECORD_CASSETTES = False  # Save each passing test's WebDriver commands and responses to CASSETTE_DIR (--record-cassettes)
+    CASSETTE_DIR = PROJECT_ROOT / "python_tests" / "cassettes"  # One .jsonl cassette per test, replayed with --replay
+    
+    # Locator check settings
+    LOCATOR_CHECK = "mark"  # Tests using page-object locators missing from the prototype HTML: "off", "mark", "skip" or "fail" (before any browser starts)
+    LOCATOR_INDEX_PATH = RESULTS_DIR / "locator-index.json"  # Cached id/class/selector index, rebuilt per file content hash
+    
+    # Duration-aware scheduling (--schedule-by-duration with -n)
+    SCHEDULE_DEFAULT_DURATION_MS = 5000  # Estimate for tests with no history and no timed section
+    SCHEDULE_AFFINITY_SLACK = 0.1  # Keep a section on one worker if the makespan grows by at most 10%
     
     # Screenshot settings
     TAKE_SCREENSHOTS = True
     SCREENSHOT_ON_FAILURE = True
-    SCREENSHOT_PATH = PROJECT_ROOT / "test_results" / "screenshots"
+    SCREENSHOT_PATH = RESULTS_DIR / "screenshots"
     
     # Report settings
-    HTML_REPORT_PATH = PROJECT_ROOT / "test_results" / "report.html"
+    HTML_REPORT_PATH = RESULTS_DIR / "report.html"
+    JSON_REPORT_PATH = RESULTS_DIR / "pytest-results.json"  # --json-report summary; tests stream to the .jsonl beside it
+    RESULTS_STREAM_FSYNC_EVERY = 20  # fsync the JSONL results stream after this many tests...
+    RESULTS_STREAM_FSYNC_SECONDS = 1.0  # ...or this many seconds, whichever comes first
+    RESULTS_STORE_ENABLED = True  # Append every --json-report run to the SQLite history store
+    RESULTS_STORE_PATH = RESULTS_DIR / "results-history.db"
+    
+    # Performance regression gate (--perf-baseline)
+    PERF_BASELINE_PATH = RESULTS_DIR / "perf-baseline.json"
+    PERF_BASELINE_RUNS = 10  # Store runs sampled into a new baseline
+    PERF_REGRESSION_THRESHOLD = 0.25  # A test is slower when its median grows by more than 25%...
+    PERF_REGRESSION_MIN_DELTA_MS = 200  # ...by at least this many ms...
+    PERF_REGRESSION_NOISE_K = 3  # ...and beyond the baseline median + 3 sigma (MAD-based)
     LOG_LEVEL = "INFO"  # DEBUG, INFO, WARNING, ERROR
     
     # Test data
@@ -43,7 +107,7 @@ class TestConfig:
         """Create necessary directories"""
         cls.SCREENSHOT_PATH.mkdir(parents=True, exist_ok=True)
         cls.CSV_TEST_DATA_PATH.mkdir(parents=True, exist_ok=True)
-        (cls.PROJECT_ROOT / "test_results").mkdir(parents=True, exist_ok=True)
+        cls.RESULTS_DIR.mkdir(parents=True, exist_ok=True)
     
     @classmethod
     def get_html_file_url(cls, filename):
@@ -2,19 +2,33 @@
 Pytest configuration file for E2E Communication Platform tests
 """
 import pytest
-import time
 import os
 from pathlib import Path
 
 from config import TestConfig
+from helpers import event_log, run_metrics
+from helpers.browser_pool import BrowserPool
+from helpers.browser_profile import apply_fast_launch, real_headless_browser_available, remove_profile_clones
+from helpers.cassette import cassette_for, install_cassette_recorder
+from helpers.command_metrics import install_command_instrumentation
+from helpers.idle_tracker import install_idle_tracker
+from helpers.implicit_wait import install_implicit_wait_tracking, install_stall_detector
+from helpers.mock_clock import MockClock
+from helpers.settle import action_pause
+from helpers.virtual_clock import VirtualClock
+from helpers.workers import artifact_name, worker_artifact_dir
+
+log = event_log.get_logger("fixtures")
 
 # Import performance reporter for JSON output
-pytest_plugins = ['helpers.pytest_json_reporter']
+pytest_plugins = ['helpers.pytest_json_reporter', 'helpers.fixture_timing', 'helpers.duration_scheduler', 'helpers.regression_gate', 'helpers.locator_index']
 
-# Check for headless environment and apply mocks if needed
+# Check for headless environment and apply mocks if needed (fast-launch mode runs a real headless browser instead)
 from helpers.mock_driver import is_headless_environment, apply_mocks
 
-if is_headless_environment():
+USE_MOCK_DRIVER = (TestConfig.MOCK_DRIVER == "replay"
+                   or is_headless_environment() and not real_headless_browser_available())
+if USE_MOCK_DRIVER:
     apply_mocks()
 
 # Now import webdriver after mocks are applied
@@ -23,8 +37,8 @@ from selenium.webdriver.edge.service import Service
 from selenium.webdriver.edge.options import Options as EdgeOptions
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.chrome.options import Options as ChromeOptions
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
-from webdriver_manager.chrome import ChromeDriverManager
+from helpers.driver_resolver import invalidate as invalidate_driver_cache
+from helpers.driver_service import driver_service, shutdown_services
 
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment():
@@ -35,92 +49,195 @@ def setup_test_environment():
     print(f"🌐 Browser: {TestConfig.BROWSER}")
     print(f"👁️ Headless: {TestConfig.HEADLESS}")
     yield
+    shutdown_services()
+    remove_profile_clones()
     print(f"\n✅ Test environment cleanup completed")
 
-@pytest.fixture(scope="function")
-def driver():
-    """Create and configure WebDriver instance"""
-    print(f"\n🌐 Starting {TestConfig.BROWSER} browser...")
+def launch_browser():
+    """Launch and configure a new WebDriver instance"""
+    log.info("🌐 Starting %s browser...", TestConfig.BROWSER)
     
-    driver_instance = None
     headless = is_headless_environment()
     
-    if headless:
-        print(f"⚠️  Headless environment detected - using MOCK webdriver")
+    if USE_MOCK_DRIVER:
+        log.info("⚠️  Headless environment detected - using MOCK webdriver")
+    elif headless:
+        log.info("⚡ Headless environment detected - using real headless browser with fast-launch profile")
     
-    try:
-        if TestConfig.BROWSER.lower() == "edge":
-            options = EdgeOptions()
-            if TestConfig.HEADLESS or headless:
-                options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-web-security")
-            options.add_argument("--allow-running-insecure-content")
-            options.add_argument("--disable-features=VizDisplayCompositor")
-            
-            try:
-                service = Service(EdgeChromiumDriverManager().install())
-            except Exception as e:
-                print(f"⚠️  Failed to setup real Edge driver: {str(e)}")
-                print(f"    Using mock driver instead")
-                service = Service("/mock/edge/driver")
-            
+    if TestConfig.BROWSER.lower() == "edge":
+        options = EdgeOptions()
+        if TestConfig.HEADLESS or headless:
+            options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-web-security")
+        options.add_argument("--allow-running-insecure-content")
+        options.add_argument("--disable-features=VizDisplayCompositor")
+        if TestConfig.FAST_LAUNCH_PROFILE and not USE_MOCK_DRIVER:
+            apply_fast_launch(options, "edge", TestConfig.HEADLESS or headless)
+        
+        try:
+            with run_metrics.timed('driverInstallMs'):
+                service = driver_service("edge", Service)
+        except Exception as e:
+            log.warning("⚠️  Failed to setup real Edge driver: %s - using mock driver instead", e)
+            service = Service("/mock/edge/driver")
+        
+        with run_metrics.timed('browserStartMs'):
             driver_instance = webdriver.Edge(service=service, options=options)
-            
-        elif TestConfig.BROWSER.lower() == "chrome":
-            options = ChromeOptions()
-            if TestConfig.HEADLESS or headless:
-                options.add_argument("--headless")
-            options.add_argument("--no-sandbox")
-            options.add_argument("--disable-dev-shm-usage")
-            options.add_argument("--disable-web-security")
-            options.add_argument("--allow-running-insecure-content")
-            
-            try:
-                service = ChromeService(ChromeDriverManager().install())
-            except Exception as e:
-                print(f"⚠️  Failed to setup real Chrome driver: {str(e)}")
-                print(f"    Using mock driver instead")
-                service = ChromeService("/mock/chrome/driver")
-            
-            driver_instance = webdriver.Chrome(service=service, options=options)
         
-        else:
-            raise ValueError(f"Unsupported browser: {TestConfig.BROWSER}")
+    elif TestConfig.BROWSER.lower() == "chrome":
+        options = ChromeOptions()
+        if TestConfig.HEADLESS or headless:
+            options.add_argument("--headless")
+        options.add_argument("--no-sandbox")
+        options.add_argument("--disable-dev-shm-usage")
+        options.add_argument("--disable-web-security")
+        options.add_argument("--allow-running-insecure-content")
+        if TestConfig.FAST_LAUNCH_PROFILE and not USE_MOCK_DRIVER:
+            apply_fast_launch(options, "chrome", TestConfig.HEADLESS or headless)
+        
+        try:
+            with run_metrics.timed('driverInstallMs'):
+                service = driver_service("chrome", ChromeService)
+        except Exception as e:
+            log.warning("⚠️  Failed to setup real Chrome driver: %s - using mock driver instead", e)
+            service = ChromeService("/mock/chrome/driver")
         
-        # Configure driver timeouts
+        with run_metrics.timed('browserStartMs'):
+            driver_instance = webdriver.Chrome(service=service, options=options)
+    
+    else:
+        raise ValueError(f"Unsupported browser: {TestConfig.BROWSER}")
+    
+    # Configure driver timeouts
+    with run_metrics.timed('browserConfigureMs'):
+        install_implicit_wait_tracking(driver_instance)
         driver_instance.implicitly_wait(TestConfig.IMPLICIT_WAIT)
         driver_instance.set_page_load_timeout(TestConfig.PAGE_LOAD_TIMEOUT)
         driver_instance.maximize_window()
-        
-        yield driver_instance
+        install_idle_tracker(driver_instance)
+        install_cassette_recorder(driver_instance)
+        install_stall_detector(driver_instance)
+        install_command_instrumentation(driver_instance)
+    
+    return driver_instance
+
+def uses_browser_pool():
+    """Browsers come from the session pool (reused, or warm spares) instead of one launch per test"""
+    return bool(TestConfig.REUSE_BROWSER or TestConfig.BROWSER_WARM_SPARES)
+
+@pytest.fixture(scope="session")
+def browser_pool():
+    """Session-wide pool of reusable browsers"""
+    # Warm spares only pay off when tests take fresh browsers; with reuse they would sit unused
+    warm_spares = 0 if TestConfig.REUSE_BROWSER else TestConfig.BROWSER_WARM_SPARES
+    pool = BrowserPool(launch_browser, TestConfig.ADMIN_PROTOTYPE_URL, TestConfig.IMPLICIT_WAIT,
+                       warm_spares=warm_spares, launch_timeout=TestConfig.BROWSER_LAUNCH_TIMEOUT)
+    yield pool
+    pool.shutdown()
+
+@pytest.fixture(scope="function")
+def driver(request):
+    """Provide a clean WebDriver instance for the test"""
+    if uses_browser_pool():
+        # Without reuse, the pool hands out warm (never used) browsers and quits them afterwards
+        pool = request.getfixturevalue("browser_pool")
+        driver_instance = pool.acquire(fresh=not TestConfig.REUSE_BROWSER)
+        try:
+            with cassette_for(request.node, driver_instance):
+                yield driver_instance
+        finally:
+            pool.release(driver_instance, discard=not TestConfig.REUSE_BROWSER)
+        return
+    
+    driver_instance = None
+    try:
+        driver_instance = launch_browser()
+        with cassette_for(request.node, driver_instance):
+            yield driver_instance
         
     except Exception as e:
-        print(f"❌ Error setting up browser: {str(e)}")
+        log.error("❌ Error setting up browser: %s", e)
         raise
     finally:
         if driver_instance:
-            print(f"🔒 Closing browser...")
+            log.info("🔒 Closing browser...")
             driver_instance.quit()
 
 @pytest.fixture(scope="function")
 def admin_page(driver):
     """Navigate to admin prototype page"""
-    print(f"📄 Loading admin prototype page...")
-    driver.get(TestConfig.ADMIN_PROTOTYPE_URL)
+    # Pooled browsers, reused or warm spares, are already on the admin page after their reset
+    if not uses_browser_pool():
+        log.info("📄 Loading admin prototype page...")
+        driver.get(TestConfig.ADMIN_PROTOTYPE_URL)
     
-    # Add slow motion delay if enabled
-    if TestConfig.SLOW_MOTION:
-        time.sleep(TestConfig.SLOW_MOTION_DELAY)
+    # Wait for the page to settle (turbo) or add slow motion delay
+    action_pause(driver)
     
     return driver
 
+@pytest.fixture(scope="function")
+def virtual_clock(request, driver):
+    """Opt-in fake browser clock; page objects can then advance(ms) through prototype delays"""
+    if request.node.get_closest_marker("real_timing"):
+        yield None
+        return
+    
+    clock = VirtualClock.install(driver)
+    if clock is None:
+        log.warning("⚠️  Virtual clock not supported by this driver - using real time")
+    yield clock
+    if clock is not None:
+        clock.uninstall()
+
+@pytest.fixture(autouse=True)
+def _virtual_clock_for_all_tests(request):
+    """Apply the virtual clock to every browser test when --virtual-clock is given"""
+    if request.config.getoption("virtual_clock") and "driver" in request.fixturenames:
+        request.getfixturevalue("virtual_clock")
+
+@pytest.fixture(autouse=True)
+def _mock_virtual_time(request):
+    """Run sleeps and wait timeouts on virtual time while the mock driver is active"""
+    if not (USE_MOCK_DRIVER and TestConfig.MOCK_VIRTUAL_TIME) or request.node.get_closest_marker("real_timing"):
+        yield None
+        return
+    
+    clock = MockClock.install()
+    yield clock
+    clock.uninstall()
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    """Start a fresh per-test metrics set and event buffer before fixtures run"""
+    run_metrics.reset()
+    event_log.start_test()
+
+@pytest.fixture(scope="function")
+def outage_history_page(driver):
+    """Navigate to outage history prototype page"""
+    log.info("📄 Loading outage history page...")
+    driver.get(TestConfig.OUTAGE_HISTORY_URL)
+    action_pause(driver)
+    return driver
+
+@pytest.fixture(scope="function")
+def notification_management_page(driver):
+    """Navigate to notification management prototype page"""
+    log.info("📄 Loading notification management page...")
+    driver.get(TestConfig.NOTIFICATION_MANAGEMENT_URL)
+    action_pause(driver)
+    return driver
+
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
 def pytest_runtest_makereport(item, call):
-    """Take screenshot on test failure"""
+    """Take screenshot and attach the buffered events on test failure"""
     outcome = yield
     rep = outcome.get_result()
+    # Phase outcomes for fixture teardown (cassettes are only kept for passing tests)
+    setattr(item, f"rep_{rep.when}", rep)
     
     if rep.when == "call" and rep.failed:
         driver = None
@@ -130,13 +247,18 @@ def pytest_runtest_makereport(item, call):
                 driver = item.funcargs.get('driver')
             
             if driver and TestConfig.TAKE_SCREENSHOTS and TestConfig.SCREENSHOT_ON_FAILURE:
-                test_name = item.name
-                screenshot_path = TestConfig.SCREENSHOT_PATH / f"{test_name}_failure.png"
+                screenshot_dir = worker_artifact_dir(TestConfig.SCREENSHOT_PATH)
+                screenshot_path = screenshot_dir / artifact_name(item.nodeid, "_failure.png")
                 driver.save_screenshot(str(screenshot_path))
-                print(f"📸 Screenshot saved: {screenshot_path}")
+                log.info("📸 Screenshot saved: %s", screenshot_path)
                 
         except Exception as e:
-            print(f"❌ Failed to take screenshot: {str(e)}")
+            log.error("❌ Failed to take screenshot: %s", e)
+    
+    if rep.failed:
+        events = event_log.dump()
+        if events:
+            rep.sections.append(("e2e events", events))
 
 def pytest_configure(config):
     """Configure pytest settings"""
@@ -144,18 +266,81 @@ def pytest_configure(config):
     config.addinivalue_line("markers", "user_management: Tests for user management functionality")
     config.addinivalue_line("markers", "role_management: Tests for role management functionality") 
     config.addinivalue_line("markers", "settings: Tests for settings functionality")
+    config.addinivalue_line("markers", "outage_history: Tests for outage history functionality")
     config.addinivalue_line("markers", "smoke: Smoke tests")
     config.addinivalue_line("markers", "regression: Regression tests")
     config.addinivalue_line("markers", "slow: Slow running tests")
+    config.addinivalue_line("markers", "real_timing: Tests that assert on real timing (never use the virtual clock)")
+    
+    event_log.configure(config.getoption("event_log_level"))
+    
+    if config.getoption("mock_dom"):
+        TestConfig.MOCK_DRIVER = "dom"
+    
+    global USE_MOCK_DRIVER
+    if config.getoption("record_cassettes"):
+        if config.getoption("replay") or USE_MOCK_DRIVER:
+            raise pytest.UsageError("--record-cassettes needs a real browser (no --replay, Edge/Chrome installed)")
+        TestConfig.RECORD_CASSETTES = True
+    if config.getoption("replay"):
+        TestConfig.MOCK_DRIVER = "replay"
+        if not USE_MOCK_DRIVER:
+            apply_mocks()
+            USE_MOCK_DRIVER = True
+    
+    if config.getoption("refresh_driver") and not hasattr(config, "workerinput"):
+        invalidate_driver_cache()
 
-def slow_action(seconds=None):
-    """Helper function to add delays between actions"""
-    if TestConfig.SLOW_MOTION:
-        delay = seconds if seconds else TestConfig.SLOW_MOTION_DELAY
-        time.sleep(delay)
+def pytest_addoption(parser):
+    """Add command line options"""
+    parser.addoption(
+        '--virtual-clock',
+        action='store_true',
+        default=False,
+        help='Run prototype timers on a virtual clock in every browser test'
+    )
+    parser.addoption(
+        '--refresh-driver',
+        action='store_true',
+        default=False,
+        help='Ignore the cached WebDriver binary manifest and resolve drivers again'
+    )
+    parser.addoption(
+        '--event-log-level',
+        default=None,
+        help='Print mock/fixture events at or above this level as they happen (default: TestConfig.EVENT_LOG_LEVEL; '
+             'DEBUG streams every event). All events are kept per test and shown for failures'
+    )
+    parser.addoption(
+        '--mock-dom',
+        action='store_true',
+        default=False,
+        help='Without a browser, run against the prototype HTML parsed into an in-memory DOM instead of placeholder elements'
+    )
+    parser.addoption(
+        '--record-cassettes',
+        action='store_true',
+        default=False,
+        help='Record the WebDriver commands and responses of each passing test to TestConfig.CASSETTE_DIR (real browser only)'
+    )
+    parser.addoption(
+        '--replay',
+        action='store_true',
+        default=False,
+        help='Run without a browser by replaying the recorded cassettes; fails when a test sends different commands'
+    )
+
+def slow_action(seconds=None, driver=None):
+    """Helper function to add delays (or settle waits in turbo mode) between actions"""
+    action_pause(driver, seconds)
 
 # Make slow_action available to tests
 @pytest.fixture
-def slow_action_fixture():
-    """Fixture to provide slow action helper"""
-    return slow_action
\ No newline at end of file
+def slow_action_fixture(request):
+    """Fixture to provide slow action helper bound to the test's browser"""
+    driver = request.getfixturevalue("driver") if "driver" in request.fixturenames else None
+    
+    def bound_slow_action(seconds=None):
+        slow_action(seconds, driver)
+    
+    return bound_slow_action
\ No newline at end of file
@@ -0,0 +1,201 @@
+"""
+Session-scoped browser pool
+Keeps browsers alive across tests and resets them to a clean state instead of
+launching a new browser process for every test. With warm spares, the next
+browsers are launched (and loaded with the start page) in background threads
+while tests run, so a test needing a new browser rarely waits for one.
+"""
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError, wait
+
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+
+from helpers import run_metrics
+from helpers.event_log import get_logger
+
+log = get_logger("pool")
+
+# Clears web storage for the currently loaded origin
+CLEAR_STORAGE_SCRIPT = """
+try { window.localStorage.clear(); } catch (e) {}
+try { window.sessionStorage.clear(); } catch (e) {}
+"""
+
+
+class BrowserPool:
+    """Pool of reusable WebDriver instances"""
+
+    def __init__(self, launch_browser, start_url, implicit_wait, warm_spares=0, launch_timeout=None):
+        self._launch_browser = launch_browser
+        self.start_url = start_url
+        self.implicit_wait = implicit_wait
+        self.warm_spares = warm_spares
+        self.launch_timeout = launch_timeout
+        self._idle = []
+        self._in_use = []
+        self._warming = deque()  # (future, submitted at) of background launches, oldest first
+        self._quitting = []
+        self._closed = False
+        self.launches = 0
+        self.resets = 0
+        self.replacements = 0
+        self.warm_hits = 0
+        self.launch_timeouts = 0
+        self._top_up()
+
+    def acquire(self, fresh=False):
+        """
+        Hand out a clean browser, replacing it only if the reset fails.
+        fresh=True never reuses a browser another test has used.
+        """
+        launched = False
+        needs_reset = True
+        if self._idle and not fresh:
+            driver = self._idle.pop()
+        else:
+            # Warm spares were already reset in the background
+            driver = self._take_spare()
+            launched = True
+            needs_reset = driver is None
+            if driver is None:
+                driver = self._launch()
+
+        start = time.perf_counter()
+        try:
+            if needs_reset:
+                self.reset(driver)
+        except WebDriverException as e:
+            log.warning("⚠️  Browser reset failed, replacing browser: %s", str(e).splitlines()[0])
+            self._discard(driver)
+            self.replacements += 1
+            driver = self._take_spare() or self._launch()
+            launched = True
+            try:
+                self.reset(driver)
+            except WebDriverException:
+                self._discard(driver)
+                raise
+        reset_ms = (time.perf_counter() - start) * 1000
+        self._top_up()
+
+        self.resets += 1
+        run_metrics.record('browserResetMs', round(reset_ms, 1))
+        run_metrics.record('browserLaunched', launched)
+
+        self._in_use.append(driver)
+        return driver
+
+    def release(self, driver, discard=False):
+        """Return a browser to the pool for the next test, or quit it (in the background) with discard=True"""
+        if driver in self._in_use:
+            self._in_use.remove(driver)
+        if not discard:
+            self._idle.append(driver)
+            return
+        thread = threading.Thread(target=self._discard, args=(driver,), name="browser-quit", daemon=True)
+        thread.start()
+        self._quitting.append(thread)
+
+    def reset(self, driver):
+        """Bring a browser back to a freshly loaded start page"""
+        self._close_extra_windows(driver)
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+        driver.delete_all_cookies()
+        driver.execute_script(CLEAR_STORAGE_SCRIPT)
+        driver.implicitly_wait(self.implicit_wait)
+        driver.get(self.start_url)
+
+    def shutdown(self):
+        """Quit every browser owned by the pool, waiting up to the launch timeout for background launches"""
+        self._closed = True
+        futures = [future for future, _ in self._warming]
+        self._warming.clear()
+        wait(futures, timeout=self.launch_timeout)
+        for future in futures:
+            future.add_done_callback(self._discard_launched)
+        for driver in self._idle + self._in_use:
+            self._discard(driver)
+        for thread in self._quitting:
+            thread.join(self.launch_timeout)
+        self._idle = []
+        self._in_use = []
+        self._quitting = []
+        warm = f", {self.warm_hits} warm, {self.launch_timeouts} timed out" if self.warm_spares else ""
+        log.info("🔒 Browser pool closed (%d launched, %d resets, %d replaced%s)",
+                 self.launches, self.resets, self.replacements, warm)
+
+    def _launch(self):
+        self.launches += 1
+        return self._launch_browser()
+
+    def _top_up(self):
+        """Start background launches until warm_spares browsers are ready or on the way"""
+        while not self._closed and len(self._warming) < self.warm_spares:
+            self.launches += 1
+            future = Future()
+            threading.Thread(target=self._warm_launch, args=(future,), name="browser-warmup", daemon=True).start()
+            self._warming.append((future, time.monotonic()))
+
+    def _warm_launch(self, future):
+        """Launch and load a browser off the test thread; its launch metrics stay out of the running test"""
+        start = time.perf_counter()
+        try:
+            with run_metrics.collecting():
+                driver = self._launch_browser()
+                self.reset(driver)
+        except Exception as e:
+            future.set_exception(e)
+        else:
+            future.set_result((driver, (time.perf_counter() - start) * 1000))
+
+    def _take_spare(self):
+        """Oldest warm spare that launches within the launch timeout, or None"""
+        while self._warming:
+            future, submitted = self._warming.popleft()
+            start = time.perf_counter()
+            timeout = None
+            if self.launch_timeout is not None:
+                timeout = max(self.launch_timeout - (time.monotonic() - submitted), 0)
+            try:
+                driver, launch_ms = future.result(timeout=timeout)
+            except FutureTimeoutError:
+                self.launch_timeouts += 1
+                log.warning("⚠️  Background browser launch exceeded %ss, replacing it", self.launch_timeout)
+                future.add_done_callback(self._discard_launched)
+                continue
+            except Exception as e:
+                log.warning("⚠️  Background browser launch failed: %r", e)
+                continue
+            self.warm_hits += 1
+            run_metrics.record('browserWarmWaitMs', round((time.perf_counter() - start) * 1000, 1))
+            run_metrics.record('browserWarmLaunchMs', round(launch_ms, 1))
+            return driver
+        return None
+
+    def _discard_launched(self, future):
+        """Quit a background-launched browser nobody will use (late or after shutdown)"""
+        if not future.cancelled() and future.exception() is None:
+            self._discard(future.result()[0])
+
+    @staticmethod
+    def _close_extra_windows(driver):
+        handles = driver.window_handles
+        if len(handles) <= 1:
+            return
+        main_handle = handles[0]
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(main_handle)
+
+    @staticmethod
+    def _discard(driver):
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
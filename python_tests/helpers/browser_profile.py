@@ -0,0 +1,162 @@
+"""
+Fast-launch browser profiles
+A fresh Edge/Chrome profile pays first-run initialisation, component updater and
+extension setup on every launch. In fast-launch mode a minimal profile is
+initialised once per installed browser version (a template kept in the user
+cache, PROFILE_TEMPLATE_DIR), each browser session gets a cheap copy of it, and
+the browser starts with startup-trimming switches and the new headless mode.
+Parallel workers build the template under a file lock, one at a time.
+"""
+import hashlib
+import json
+import os
+import shutil
+import subprocess
+import tempfile
+import threading
+from pathlib import Path
+
+from config import TestConfig
+from helpers.driver_resolver import BROWSER_EXECUTABLES, browser_executable, browser_fingerprint
+from helpers.event_log import get_logger
+from helpers.workers import interprocess_lock
+
+log = get_logger("profile")
+
+# Switches that skip first-run work and background services not needed by tests
+FAST_LAUNCH_SWITCHES = [
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--disable-extensions",
+    "--disable-component-update",
+    "--disable-background-networking",
+    "--disable-sync",
+    "--disable-default-apps",
+    "--disable-client-side-phishing-detection",
+    "--disable-domain-reliability",
+    "--disable-breakpad",
+    "--disable-hang-monitor",
+    "--disable-renderer-backgrounding",
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--metrics-recording-only",
+    "--password-store=basic",
+    "--use-mock-keychain",
+    "--mute-audio",
+]
+
+# Features switched off in addition to any --disable-features already on the options
+FAST_LAUNCH_DISABLED_FEATURES = ["Translate", "MediaRouter", "OptimizationHints", "AutofillServerCommunication"]
+
+# Profile entries that are per-instance or only caches; never copied into the template
+PROFILE_EXCLUDES = ["Singleton*", "*Cache*", "Crashpad", "BrowserMetrics*", "*.log", "lockfile"]
+
+_template_lock = threading.Lock()
+_clone_root = None
+_failed_builds = set()
+
+
+def template_dir(browser):
+    """Template location for the installed browser version (a new directory per fingerprint)"""
+    fingerprint = hashlib.sha1(browser_fingerprint(browser).encode("utf-8")).hexdigest()[:12]
+    return Path(TestConfig.PROFILE_TEMPLATE_DIR) / f"{browser}-{fingerprint}"
+
+
+def build_template(browser, no_sandbox=False):
+    """
+    Initialise a profile once with the browser itself (headless, blank page, exit) and install
+    it as the template. Callers hold the template lock, so only one process builds; the template
+    is staged and renamed into its versioned directory, never replaced while others copy it.
+    Returns False (and installs nothing) when the browser fails to initialise a profile.
+    """
+    executable = browser_executable(browser)
+    target = template_dir(browser)
+    target.parent.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=f".{browser}-", dir=target.parent))
+    profile = staging / "profile"
+    command = [executable, "--headless=new", f"--user-data-dir={profile}", *FAST_LAUNCH_SWITCHES]
+    if no_sandbox:
+        command.append("--no-sandbox")
+    try:
+        result = subprocess.run([*command, "--dump-dom", "about:blank"], capture_output=True, timeout=60)
+        if result.returncode != 0 or not profile.is_dir() or not any(profile.iterdir()):
+            error = result.stderr.decode(errors="replace").strip().splitlines()
+            log.warning("⚠️  Could not build %s profile template (exit %s): %s",
+                        browser, result.returncode, error[-1] if error else "no profile written")
+            return False
+        shutil.copytree(profile, staging / "template", ignore=shutil.ignore_patterns(*PROFILE_EXCLUDES))
+        (staging / "template" / "template.json").write_text(
+            json.dumps({"browserFingerprint": browser_fingerprint(browser)}), encoding="utf-8"
+        )
+        os.replace(staging / "template", target)
+    except (OSError, subprocess.SubprocessError) as e:
+        log.warning("⚠️  Could not build %s profile template: %s", browser, e)
+        return False
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+    # Templates of earlier browser versions are no longer used by anyone
+    for old in target.parent.glob(f"{browser}-*"):
+        if old != target and old.is_dir():
+            shutil.rmtree(old, ignore_errors=True)
+    log.info("🧰 Built %s fast-launch profile template: %s", browser, target)
+    return True
+
+
+def clone_profile(browser, no_sandbox=False):
+    """
+    Fresh user-data directory copied from the (built on demand) template,
+    or None when no template can be built for this browser
+    """
+    global _clone_root
+    with _template_lock:
+        if browser in _failed_builds:
+            return None
+        target = template_dir(browser)
+        if not (target / "template.json").exists():
+            with interprocess_lock(target.parent / f".{browser}.lock"):
+                # Another worker may have built it while this one waited for the lock
+                if not (target / "template.json").exists() and not build_template(browser, no_sandbox):
+                    _failed_builds.add(browser)
+                    return None
+        if _clone_root is None:
+            _clone_root = tempfile.mkdtemp(prefix="e2e-profiles-")
+    clone = Path(tempfile.mkdtemp(prefix=f"{browser}-", dir=_clone_root))
+    shutil.copytree(target, clone, dirs_exist_ok=True)
+    return clone
+
+
+def remove_profile_clones():
+    """Delete every profile copy made by this process (end of the test session)"""
+    global _clone_root
+    if _clone_root is not None:
+        shutil.rmtree(_clone_root, ignore_errors=True)
+        _clone_root = None
+
+
+def real_headless_browser_available():
+    """True when fast-launch mode can run the configured browser for real without a display"""
+    browser = TestConfig.BROWSER.lower()
+    return (TestConfig.FAST_LAUNCH_PROFILE and browser in BROWSER_EXECUTABLES
+            and browser_executable(browser) is not None)
+
+
+def apply_fast_launch(options, browser, headless):
+    """
+    Add the cloned profile and the startup-trimming switches to browser options; headless
+    runs use the new headless mode (the full browser, as used in CI and Codespaces on Linux).
+    Without a template the browser starts with its own fresh profile.
+    """
+    profile = clone_profile(browser, no_sandbox="--no-sandbox" in options.arguments)
+    if profile is not None:
+        options.add_argument(f"--user-data-dir={profile}")
+    for switch in FAST_LAUNCH_SWITCHES:
+        options.add_argument(switch)
+    disabled = list(FAST_LAUNCH_DISABLED_FEATURES)
+    for argument in list(options.arguments):
+        if argument.startswith("--disable-features="):
+            options.arguments.remove(argument)
+            disabled = argument.split("=", 1)[1].split(",") + disabled
+    options.add_argument(f"--disable-features={','.join(disabled)}")
+    if headless:
+        options.arguments[:] = [argument for argument in options.arguments if argument != "--headless"]
+        options.add_argument("--headless=new")
@@ -0,0 +1,287 @@
+"""
+Recorded WebDriver sessions ("cassettes") for browser-free regression runs
+With --record-cassettes every WebDriver command a passing test sends to a real
+browser, and the browser's response, is saved to CASSETTE_DIR (one JSON Lines
+file per test: a header line, then one interaction per line). With --replay the
+driver fixture serves those responses instead of starting a browser, so the page
+objects run exactly as they did against the browser. A replay that sends a
+different command, different arguments, fewer or more commands than were recorded
+fails with CassetteDivergence naming the page-object method that diverged.
+"""
+import hashlib
+import json
+import time
+from contextlib import contextmanager
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+import selenium.common.exceptions as selenium_exceptions
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.file_detector import LocalFileDetector
+from selenium.webdriver.remote.switch_to import SwitchTo
+from selenium.webdriver.remote.webdriver import WebDriver as RemoteWebDriver
+from selenium.webdriver.remote.webelement import WebElement
+
+from config import TestConfig
+from helpers.command_metrics import page_object_method
+from helpers.event_log import get_logger
+from helpers.mock_clock import simulate_wait
+from helpers.workers import artifact_name
+
+log = get_logger("cassette")
+
+CASSETTE_VERSION = 1
+ELEMENT_KEY = "$element"
+SCRIPT_PREFIX = "$script:"
+
+# Answers for commands sent while no cassette is loaded (launch, pool reset, quit)
+IDLE_RESPONSES = {
+    Command.W3C_GET_WINDOW_HANDLES: ["replay"],
+    Command.W3C_GET_CURRENT_WINDOW_HANDLE: "replay",
+}
+
+
+class CassetteDivergence(AssertionError):
+    """The replayed test no longer sends the commands that were recorded"""
+
+
+def cassette_path(nodeid):
+    return Path(TestConfig.CASSETTE_DIR) / artifact_name(nodeid, ".jsonl")
+
+
+class ElementAliases:
+    """
+    Maps browser element ids to stable names (e1, e2, ...) in order of first appearance,
+    so a cassette does not depend on the ids a particular browser session handed out
+    """
+
+    def __init__(self):
+        self._aliases = {}
+
+    def alias(self, element_id):
+        if element_id not in self._aliases:
+            self._aliases[element_id] = f"e{len(self._aliases) + 1}"
+        return self._aliases[element_id]
+
+    def register(self, alias):
+        """Replay side: element ids are the aliases themselves"""
+        self._aliases.setdefault(alias, alias)
+
+    def __contains__(self, element_id):
+        return element_id in self._aliases
+
+
+class Cassette:
+    """The interactions of one test, with element ids aliased and scripts stored once"""
+
+    def __init__(self, test, browser=None, interactions=None, scripts=None, recorded_at=None):
+        self.test = test
+        self.browser = browser or TestConfig.BROWSER.lower()
+        self.interactions = interactions if interactions is not None else []
+        self.scripts = scripts if scripts is not None else {}
+        self.recorded_at = recorded_at
+        self.elements = ElementAliases()
+
+    def encode(self, value, key=None):
+        """JSON-ready copy of command params or a response value"""
+        if isinstance(value, WebElement):
+            return {ELEMENT_KEY: self.elements.alias(value.id)}
+        if isinstance(value, dict):
+            return {k: self.encode(v, k) for k, v in value.items() if k != "sessionId"}
+        if isinstance(value, (list, tuple)):
+            return [self.encode(v) for v in value]
+        if key == "id" and isinstance(value, str) and value in self.elements:
+            return {ELEMENT_KEY: self.elements.alias(value)}
+        if key == "script" and isinstance(value, str):
+            digest = hashlib.sha1(value.encode("utf-8")).hexdigest()[:12]
+            self.scripts.setdefault(digest, value)
+            return SCRIPT_PREFIX + digest
+        return value
+
+    def append(self, command, params, value=None, error=None, caller=None, elapsed_ms=0.0):
+        interaction = {"cmd": command, "params": params, "value": self.encode(value),
+                       "by": caller, "ms": round(elapsed_ms, 1)}
+        if error is not None:
+            interaction["error"] = {"type": type(error).__name__, "message": error.msg}
+        self.interactions.append(interaction)
+
+    def save(self, path):
+        header = {"version": CASSETTE_VERSION, "test": self.test, "browser": self.browser,
+                  "recordedAt": datetime.now().isoformat(), "interactions": len(self.interactions),
+                  "scripts": self.scripts}
+        path.parent.mkdir(parents=True, exist_ok=True)
+        lines = [json.dumps(header)] + [json.dumps(i, separators=(",", ":")) for i in self.interactions]
+        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    @classmethod
+    def load(cls, path):
+        header, *lines = path.read_text(encoding="utf-8").splitlines()
+        header = json.loads(header)
+        if header.get("version") != CASSETTE_VERSION:
+            raise ValueError(f"{path.name}: unsupported cassette version {header.get('version')}")
+        return cls(header["test"], header.get("browser"), [json.loads(line) for line in lines if line],
+                   header.get("scripts", {}), header.get("recordedAt"))
+
+
+def install_cassette_recorder(driver):
+    """
+    Wrap driver.execute (innermost, so the cassette holds exactly what reached the browser)
+    to append every command to the cassette started for the current test
+    """
+    if not TestConfig.RECORD_CASSETTES or not hasattr(driver, "execute"):
+        return False
+    execute = driver.execute
+    driver.cassette = None
+
+    def execute_with_recording(driver_command, params=None):
+        cassette = driver.cassette
+        if cassette is None:
+            return execute(driver_command, params)
+        encoded = json.loads(json.dumps(cassette.encode(params or {})))
+        start = time.perf_counter()
+        try:
+            response = execute(driver_command, params)
+        except WebDriverException as e:
+            cassette.append(driver_command, encoded, error=e, caller=page_object_method(),
+                            elapsed_ms=(time.perf_counter() - start) * 1000)
+            raise
+        cassette.append(driver_command, encoded, (response or {}).get("value"), caller=page_object_method(),
+                        elapsed_ms=(time.perf_counter() - start) * 1000)
+        return response
+
+    driver.execute = execute_with_recording
+    return True
+
+
+class ReplayWebDriver(RemoteWebDriver):
+    """WebDriver that answers from a cassette instead of a browser session"""
+
+    def __init__(self, *args, **kwargs):
+        # No remote end: set up what RemoteWebDriver.__init__ would, without starting a session
+        self.command_executor = SimpleNamespace(close=lambda: None)
+        self._is_remote = False
+        self.session_id = "replay"
+        self.caps = {"browserName": TestConfig.BROWSER.lower()}
+        self.pinned_scripts = {}
+        self.error_handler = None
+        self._switch_to = SwitchTo(self)
+        self._mobile = None
+        self.file_detector = LocalFileDetector()
+        self._authenticator_id = None
+        self.cassette = None
+        self.position = 0
+        self.divergence = None
+        log.debug("Replay driver created")
+
+    def load(self, cassette):
+        self.cassette = cassette
+        self.position = 0
+        self.divergence = None
+
+    def eject(self, test_passed):
+        """
+        Unload the cassette. A passing test fails here if it swallowed a divergence or left
+        interactions unplayed; a failed test has already reported its divergence.
+        """
+        cassette, self.cassette = self.cassette, None
+        if not test_passed:
+            return
+        if self.divergence is not None:
+            raise self.divergence
+        if self.position < len(cassette.interactions):
+            raise self._diverged(cassette, None, None, None)
+
+    def execute(self, driver_command, params=None):
+        cassette = self.cassette
+        if cassette is None:
+            return {"value": IDLE_RESPONSES.get(driver_command)}
+        if self.divergence is not None:
+            raise self.divergence
+
+        caller = page_object_method()
+        encoded = json.loads(json.dumps(cassette.encode(params or {})))
+        expected = cassette.interactions[self.position] if self.position < len(cassette.interactions) else None
+        if expected is None or expected["cmd"] != driver_command or expected["params"] != encoded:
+            self.divergence = self._diverged(cassette, driver_command, encoded, caller)
+            raise self.divergence
+
+        self.position += 1
+        simulate_wait(expected.get("ms", 0) / 1000)
+        error = expected.get("error")
+        if error is not None:
+            exception = getattr(selenium_exceptions, error["type"], WebDriverException)(error["message"])
+            exception.msg = error["message"]  # as recorded, without a second documentation link
+            raise exception
+        return {"value": self._decode(expected["value"])}
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        return self.execute("executeCdpCommand", {"cmd": cmd, "params": cmd_args})["value"]
+
+    def save_screenshot(self, filename):
+        log.debug("Screenshot skipped (replay, no browser): %s", filename)
+        return False
+
+    def _decode(self, value):
+        if isinstance(value, dict):
+            if set(value) == {ELEMENT_KEY}:
+                self.cassette.elements.register(value[ELEMENT_KEY])
+                return self.create_web_element(value[ELEMENT_KEY])
+            return {k: self._decode(v) for k, v in value.items()}
+        if isinstance(value, list):
+            return [self._decode(v) for v in value]
+        return value
+
+    def _diverged(self, cassette, command, params, caller):
+        total = len(cassette.interactions)
+        expected = cassette.interactions[self.position] if self.position < total else None
+        if expected is None:
+            wanted = "end of the recording"
+        else:
+            wanted = f"{expected['cmd']} {json.dumps(expected['params'])} from {expected['by']}"
+        got = "end of the test" if command is None else f"{command} {json.dumps(params)} from {caller}"
+        return CassetteDivergence(
+            f"Replay of {cassette.test} diverged at interaction {self.position + 1} of {total}:\n"
+            f"  recorded: {wanted}\n"
+            f"  replayed: {got}\n"
+            f"Re-record with --record-cassettes if the change is intended."
+        )
+
+
+@contextmanager
+def cassette_for(item, driver):
+    """
+    Record (--record-cassettes) or replay (--replay) the test's WebDriver session around its body.
+    Recordings are kept only for tests that pass; a test with no recording is skipped on replay.
+    """
+    if isinstance(driver, ReplayWebDriver):
+        path = cassette_path(item.nodeid)
+        if not path.exists():
+            pytest.skip(f"No cassette recorded for this test ({path.name})")
+        driver.load(Cassette.load(path))
+        try:
+            yield
+        finally:
+            driver.eject(_passed(item))
+        return
+
+    if not hasattr(driver, "cassette"):
+        # Recorder not installed (not recording)
+        yield
+        return
+    driver.cassette = Cassette(item.nodeid)
+    try:
+        yield
+    finally:
+        cassette, driver.cassette = driver.cassette, None
+        if _passed(item):
+            cassette.save(cassette_path(item.nodeid))
+            log.info("📼 Recorded %d interactions: %s", len(cassette.interactions), cassette_path(item.nodeid).name)
+
+
+def _passed(item):
+    """True when setup and call of the test passed (reports stored on the item by conftest)"""
+    reports = [getattr(item, f"rep_{when}", None) for when in ("setup", "call")]
+    return all(rep is not None and rep.passed for rep in reports)
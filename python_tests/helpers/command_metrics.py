@@ -0,0 +1,50 @@
+"""
+WebDriver command instrumentation
+Wraps driver.execute so every WebDriver command (real or [MOCK]) is counted and
+timed per test, grouped by command type and by the page-object method that issued it
+"""
+import sys
+import time
+from pathlib import Path
+
+from config import TestConfig
+from helpers import run_metrics
+
+PAGE_OBJECTS_DIR = str(Path(__file__).resolve().parent.parent / "page_objects")
+
+# Commands issued outside any page-object method (fixtures, tests, helpers)
+DIRECT_CALLER = "(direct)"
+
+
+def page_object_method():
+    """Outermost page-object method on the call stack, as 'ClassName.method'"""
+    caller = None
+    frame = sys._getframe(2)
+    while frame is not None:
+        if frame.f_code.co_filename.startswith(PAGE_OBJECTS_DIR):
+            owner = frame.f_locals.get("self")
+            name = frame.f_code.co_name
+            caller = f"{type(owner).__name__}.{name}" if owner is not None else name
+        frame = frame.f_back
+    return caller or DIRECT_CALLER
+
+
+def install_command_instrumentation(driver):
+    """Wrap driver.execute so each command is recorded in the current test's metrics"""
+    if not TestConfig.COMMAND_INSTRUMENTATION or not hasattr(driver, "execute"):
+        return False
+    execute = driver.execute
+
+    def execute_with_metrics(driver_command, params=None):
+        start = time.perf_counter()
+        try:
+            return execute(driver_command, params)
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            run_metrics.increment('commandCount')
+            run_metrics.increment('commandMs', elapsed_ms)
+            run_metrics.add_timing('commandsByType', driver_command, elapsed_ms)
+            run_metrics.add_timing('commandsByPageMethod', page_object_method(), elapsed_ms)
+
+    driver.execute = execute_with_metrics
+    return True
@@ -0,0 +1,176 @@
+"""
+Cached WebDriver binary resolution
+webdriver-manager probes the browser version, checks its cache and may go to the
+network on every install() call. The resolver calls it once, records the driver
+path with the browser's version and executable fingerprint in a local manifest,
+and later launches/runs reuse that entry with no network access or version probing.
+The entry is invalidated when the browser executable changes (update), when the
+driver binary disappears, or explicitly (--refresh-driver or the CLI below).
+
+Usage:
+    python python_tests/helpers/driver_resolver.py show
+    python python_tests/helpers/driver_resolver.py invalidate [edge|chrome]
+"""
+import argparse
+import json
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from datetime import datetime
+from pathlib import Path
+
+# Add the parent directory to Python path for imports when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TestConfig
+from helpers.event_log import get_logger
+from helpers.workers import interprocess_lock
+
+log = get_logger("driver")
+
+# Executables checked (in order) to fingerprint the installed browser
+BROWSER_EXECUTABLES = {
+    "edge": [
+        r"C:\Program Files (x86)\Microsoft\Edge\Application\msedge.exe",
+        r"C:\Program Files\Microsoft\Edge\Application\msedge.exe",
+        "/Applications/Microsoft Edge.app/Contents/MacOS/Microsoft Edge",
+        "microsoft-edge", "microsoft-edge-stable", "msedge",
+    ],
+    "chrome": [
+        r"C:\Program Files\Google\Chrome\Application\chrome.exe",
+        r"C:\Program Files (x86)\Google\Chrome\Application\chrome.exe",
+        "/Applications/Google Chrome.app/Contents/MacOS/Google Chrome",
+        "google-chrome", "google-chrome-stable", "chromium", "chromium-browser",
+    ],
+}
+
+# Drivers resolved in this process: browser -> driver path
+_resolved = {}
+
+
+def browser_executable(browser):
+    """Path of the installed browser executable, or None"""
+    for candidate in BROWSER_EXECUTABLES[browser]:
+        path = candidate if os.path.isabs(candidate) else shutil.which(candidate)
+        if path and os.path.exists(path):
+            return path
+    return None
+
+
+def browser_fingerprint(browser):
+    """Cheap identity of the installed browser (path, size, mtime) that changes when it is updated"""
+    path = browser_executable(browser)
+    if path is None:
+        return None
+    stat = os.stat(path)
+    return f"{path}|{stat.st_size}|{int(stat.st_mtime)}"
+
+
+def browser_version(browser):
+    """Browser version reported by the executable (only called when re-resolving)"""
+    path = browser_executable(browser)
+    if path is None:
+        return None
+    try:
+        output = subprocess.run([path, "--version"], capture_output=True, text=True, timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+    match = re.search(r"\d+(\.\d+)+", output)
+    return match.group(0) if match else None
+
+
+def load_manifest():
+    try:
+        return json.loads(Path(TestConfig.DRIVER_MANIFEST_PATH).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def manifest_lock():
+    """Held across xdist workers while the manifest is read, changed and written back"""
+    path = Path(TestConfig.DRIVER_MANIFEST_PATH)
+    return interprocess_lock(path.with_name(f".{path.name}.lock"))
+
+
+def save_manifest(manifest):
+    path = Path(TestConfig.DRIVER_MANIFEST_PATH)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    # Write then rename, so concurrent workers never read a partial manifest
+    handle, staging = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    with os.fdopen(handle, "w", encoding="utf-8") as staged:
+        json.dump(manifest, staged, indent=2)
+    os.replace(staging, path)
+
+
+def invalidate(browser=None):
+    """Forget the resolved driver for one browser (or all) so the next launch resolves it again"""
+    with manifest_lock():
+        manifest = load_manifest()
+        for name in [browser] if browser else list(manifest):
+            manifest.pop(name, None)
+            _resolved.pop(name, None)
+        save_manifest(manifest)
+
+
+def _install(browser):
+    if browser == "edge":
+        from webdriver_manager.microsoft import EdgeChromiumDriverManager
+        return EdgeChromiumDriverManager().install()
+    from webdriver_manager.chrome import ChromeDriverManager
+    return ChromeDriverManager().install()
+
+
+def resolve_driver_path(browser):
+    """
+    Driver binary for browser ('edge' or 'chrome'): from this process, then the
+    manifest, and only when neither is valid from webdriver-manager
+    """
+    browser = browser.lower()
+    if browser in _resolved:
+        return _resolved[browser]
+
+    fingerprint = browser_fingerprint(browser)
+    entry = load_manifest().get(browser)
+    if (entry and entry.get("browserFingerprint") == fingerprint
+            and os.path.exists(entry.get("driverPath", ""))):
+        _resolved[browser] = entry["driverPath"]
+        return entry["driverPath"]
+
+    driver_path = _install(browser)
+    _resolved[browser] = driver_path
+    if os.path.exists(driver_path):
+        entry = {
+            "driverPath": driver_path,
+            "browserVersion": browser_version(browser),
+            "browserFingerprint": fingerprint,
+            "resolvedAt": datetime.now().isoformat(),
+        }
+        # Re-read under the lock so entries other workers wrote meanwhile are kept
+        with manifest_lock():
+            manifest = load_manifest()
+            manifest[browser] = entry
+            save_manifest(manifest)
+        log.info("📌 Resolved %s driver %s (browser %s)", browser, driver_path, entry["browserVersion"])
+    return driver_path
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show or invalidate cached WebDriver binaries")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("show", help="Print the manifest")
+    invalidate_parser = commands.add_parser("invalidate", help="Force the next run to resolve drivers again")
+    invalidate_parser.add_argument("browser", nargs="?", choices=sorted(BROWSER_EXECUTABLES))
+    args = parser.parse_args()
+    if args.command == "show":
+        print(json.dumps(load_manifest(), indent=2))
+    else:
+        invalidate(args.browser)
+        print(f"🗑️  Invalidated {args.browser or 'all'} driver entries in {TestConfig.DRIVER_MANIFEST_PATH}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,75 @@
+"""
+Shared WebDriver service
+Each webdriver.Edge/Chrome normally spawns its own msedgedriver/chromedriver
+process and polls it until it accepts connections. The shared service starts the
+driver process once per pytest process (per xdist worker); every later launch
+only opens a browser session against it over ChromiumRemoteConnection's
+kept-alive HTTP connection, and quit() closes the session but leaves the driver
+running until the end of the test session.
+"""
+import threading
+
+from config import TestConfig
+from helpers import run_metrics
+from helpers.driver_resolver import resolve_driver_path
+
+# Shared services started in this process: browser -> service
+_services = {}
+# Guards _services and service start-up against concurrent launches (warm-spare threads)
+_lock = threading.RLock()
+
+
+class SharedServiceMixin:
+    """Service whose start() is idempotent and whose stop() only runs at shutdown()"""
+
+    def is_running(self):
+        process = getattr(self, 'process', None)
+        return process is not None and process.poll() is None
+
+    def start(self):
+        with _lock:
+            if not self.is_running():
+                super().start()
+                run_metrics.increment('driverServiceStarts')
+
+    def stop(self):
+        """Called by WebDriver.quit(); the driver process outlives the browser session"""
+
+    def shutdown(self):
+        with _lock:
+            if self.is_running():
+                super().stop()
+
+    def __del__(self):
+        try:
+            self.shutdown()
+        except Exception:
+            pass
+
+
+def shared_service(browser, service_class):
+    """Session-wide driver service for browser, built from service_class on first use"""
+    browser = browser.lower()
+    with _lock:
+        service = _services.get(browser)
+        if service is None:
+            shared_class = type(f"Shared{service_class.__name__}", (SharedServiceMixin, service_class), {})
+            service = shared_class(resolve_driver_path(browser))
+            _services[browser] = service
+    return service
+
+
+def driver_service(browser, service_class):
+    """Service for a new browser: the shared one, or a per-browser one when sharing is disabled"""
+    if TestConfig.SHARE_DRIVER_SERVICE:
+        return shared_service(browser, service_class)
+    return service_class(resolve_driver_path(browser))
+
+
+def shutdown_services():
+    """Stop every shared driver process (end of the test session)"""
+    with _lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.shutdown()
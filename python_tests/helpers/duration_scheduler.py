@@ -0,0 +1,187 @@
+"""
+Duration-aware pytest-xdist scheduling
+Reads per-test durations from a previous pytest-results.json and packs the tests
+longest-first onto the workers (LPT), keeping tests of the same section (test
+class/module) on one worker where that does not stretch the makespan.
+Enable with --schedule-by-duration together with -n.
+"""
+import json
+import statistics
+from pathlib import Path
+
+import pytest
+
+from config import TestConfig
+
+try:
+    from xdist.scheduler import LoadScopeScheduling
+except ImportError:  # pytest-xdist not installed: the plugin only adds its options
+    LoadScopeScheduling = None
+
+DEFAULT_HISTORY_PATH = TestConfig.JSON_REPORT_PATH
+
+
+def section_of(nodeid):
+    """Section a test belongs to: its class, or its module for plain test functions"""
+    return nodeid.rsplit('::', 1)[0]
+
+
+def load_durations(history_path):
+    """{nodeid: duration ms} from a JSON performance report; empty if there is none"""
+    try:
+        report = json.loads(Path(history_path).read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return {}
+    return {
+        test['fullTitle'].split('@')[0]: test['duration']
+        for test in report.get('tests', [])
+        if test.get('status') != 'skipped'
+    }
+
+
+def estimate_durations(nodeids, history):
+    """Duration per test: history, else the section median, else the suite median, else the default"""
+    known = [history[nodeid] for nodeid in nodeids if nodeid in history]
+    suite_median = statistics.median(known) if known else TestConfig.SCHEDULE_DEFAULT_DURATION_MS
+    section_times = {}
+    for nodeid in nodeids:
+        if nodeid in history:
+            section_times.setdefault(section_of(nodeid), []).append(history[nodeid])
+    estimates = {}
+    for nodeid in nodeids:
+        if nodeid in history:
+            estimates[nodeid] = history[nodeid]
+        else:
+            section = section_times.get(section_of(nodeid))
+            estimates[nodeid] = statistics.median(section) if section else suite_median
+    return estimates
+
+
+def plan_bins(estimates, bin_count, affinity_slack=None):
+    """
+    Longest-processing-time-first packing of tests into bin_count bins.
+    A test joins a bin already holding its section instead of the least-loaded bin
+    when the resulting bin load stays within affinity_slack of the makespan so far.
+    Returns a list of {'tests': [...], 'predictedMs': load}.
+    """
+    affinity_slack = TestConfig.SCHEDULE_AFFINITY_SLACK if affinity_slack is None else affinity_slack
+    bins = [{'tests': [], 'predictedMs': 0.0, 'sections': set()} for _ in range(max(bin_count, 1))]
+    makespan = 0.0
+    for nodeid, duration in sorted(estimates.items(), key=lambda item: (-item[1], item[0])):
+        section = section_of(nodeid)
+        target = min(bins, key=lambda b: b['predictedMs'])
+        affine = [b for b in bins if section in b['sections']]
+        if affine:
+            candidate = min(affine, key=lambda b: b['predictedMs'])
+            limit = max(makespan, target['predictedMs'] + duration) * (1 + affinity_slack)
+            if candidate['predictedMs'] + duration <= limit:
+                target = candidate
+        target['tests'].append(nodeid)
+        target['predictedMs'] += duration
+        target['sections'].add(section)
+        makespan = max(makespan, target['predictedMs'])
+    for b in bins:
+        del b['sections']
+    return [b for b in bins if b['tests']]
+
+
+if LoadScopeScheduling is not None:
+    class DurationScheduling(LoadScopeScheduling):
+        """LoadScope scheduling where each scope is one pre-planned bin of tests"""
+
+        def __init__(self, config, log=None, history=None):
+            super().__init__(config, log)
+            self.history = history or {}
+            self.bins = []
+            self.bin_of = {}
+
+        def schedule(self):
+            if self.collection is None and self.collection_is_completed:
+                collection = next(iter(self.registered_collections.values()))
+                estimates = estimate_durations(collection, self.history)
+                self.bins = plan_bins(estimates, len(self.nodes))
+                self.bin_of = {nodeid: f"bin{index}" for index, b in enumerate(self.bins) for nodeid in b['tests']}
+            super().schedule()
+
+        def _split_scope(self, nodeid):
+            return self.bin_of.get(nodeid) or super()._split_scope(nodeid)
+
+
+class DurationSchedulerPlugin:
+    """Plans the xdist distribution and compares the predicted with the actual makespan"""
+
+    def __init__(self, history_path):
+        self.history_path = history_path
+        self.history = load_durations(history_path)
+        self.scheduler = None
+        self.actual_ms = {}
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """Replace the default xdist scheduler with the duration-aware one"""
+        if LoadScopeScheduling is None:
+            return None
+        self.scheduler = DurationScheduling(config, log, self.history)
+        return self.scheduler
+
+    def pytest_collection_modifyitems(self, config, items):
+        """Order tests by section, longest first, so each worker runs a section's tests back to back"""
+        estimates = estimate_durations([item.nodeid for item in items], self.history)
+        section_totals = {}
+        for nodeid, duration in estimates.items():
+            section_totals[section_of(nodeid)] = section_totals.get(section_of(nodeid), 0) + duration
+        items.sort(key=lambda item: (-section_totals[section_of(item.nodeid)], section_of(item.nodeid),
+                                     -estimates[item.nodeid], item.nodeid))
+
+    def pytest_runtest_logreport(self, report):
+        """Sum the call time each bin actually took (on the controller)"""
+        if report.when != 'call' or self.scheduler is None:
+            return
+        scope = self.scheduler.bin_of.get(report.nodeid)
+        if scope is not None:
+            self.actual_ms[scope] = self.actual_ms.get(scope, 0.0) + report.duration * 1000
+
+    def pytest_terminal_summary(self, terminalreporter):
+        """Print and save predicted versus actual makespan"""
+        if self.scheduler is None or not self.scheduler.bins:
+            return
+        bins = [
+            {'bin': f"bin{index}", 'tests': len(b['tests']), 'predictedMs': b['predictedMs'],
+             'actualMs': self.actual_ms.get(f"bin{index}", 0.0)}
+            for index, b in enumerate(self.scheduler.bins)
+        ]
+        summary = {
+            'historyTests': len(self.history),
+            'predictedMakespanMs': max(b['predictedMs'] for b in bins),
+            'actualMakespanMs': max(b['actualMs'] for b in bins),
+            'bins': bins,
+        }
+        terminalreporter.write_line(
+            f"⏱️  Duration scheduling: predicted makespan {summary['predictedMakespanMs'] / 1000:.2f}s, "
+            f"actual {summary['actualMakespanMs'] / 1000:.2f}s across {len(bins)} workers"
+        )
+        summary_path = Path(self.history_path).parent / 'schedule-summary.json'
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        summary_path.write_text(json.dumps(summary, indent=2), encoding='utf-8')
+
+
+def pytest_configure(config):
+    """Register the scheduler when --schedule-by-duration is given"""
+    if config.getoption('schedule_by_duration'):
+        history_path = config.getoption('schedule_history') or DEFAULT_HISTORY_PATH
+        config.pluginmanager.register(DurationSchedulerPlugin(history_path), 'duration_scheduler')
+
+
+def pytest_addoption(parser):
+    """Add command line options"""
+    parser.addoption(
+        '--schedule-by-duration',
+        action='store_true',
+        default=False,
+        help='With -n, distribute tests longest-first using durations from a previous JSON report'
+    )
+    parser.addoption(
+        '--schedule-history',
+        default=None,
+        help='JSON performance report to read past durations from (default: test_results/pytest-results.json)'
+    )
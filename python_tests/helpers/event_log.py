@@ -0,0 +1,75 @@
+"""
+Buffered event log for mock driver, fixture and pool events
+Events are logged under the "e2e" logger (e2e.mock, e2e.fixtures, e2e.pool, e2e.reporter)
+and kept in a per-test ring buffer instead of being printed. Only events at or above
+EVENT_LOG_LEVEL reach the terminal as they happen; the buffered events of a failing
+test are attached to its report as an "e2e events" section.
+Use --event-log-level=DEBUG to stream every event (the old print behaviour).
+"""
+import logging
+from collections import deque
+
+from config import TestConfig
+
+ROOT_LOGGER = "e2e"
+EVENT_FORMAT = "%(relativeCreated)9.0fms %(levelname)-7s %(name)s: %(message)s"
+
+
+class RingBufferHandler(logging.Handler):
+    """Keeps the last `capacity` records; formats them only when dumped"""
+
+    def __init__(self, capacity):
+        super().__init__(logging.DEBUG)
+        self.records = deque(maxlen=capacity)
+
+    def emit(self, record):
+        self.records.append(record)
+
+    def clear(self):
+        self.records.clear()
+
+    def dump(self):
+        return "\n".join(self.format(record) for record in self.records)
+
+
+class TerminalHandler(logging.Handler):
+    """Prints records to the current sys.stdout (so pytest's capture applies, as for print)"""
+
+    def emit(self, record):
+        print(self.format(record))
+
+
+_buffer = RingBufferHandler(TestConfig.EVENT_LOG_BUFFER)
+_terminal = TerminalHandler()
+
+
+def get_logger(name):
+    """Logger for one event source (mock, fixtures, pool, reporter)"""
+    return logging.getLogger(f"{ROOT_LOGGER}.{name}")
+
+
+def configure(level=None, capacity=None):
+    """Attach the ring buffer and the terminal handler (events at or above level) to the e2e logger"""
+    level = (level or TestConfig.EVENT_LOG_LEVEL).upper()
+    if capacity is not None:
+        _buffer.records = deque(_buffer.records, maxlen=capacity)
+    formatter = logging.Formatter(EVENT_FORMAT)
+    _buffer.setFormatter(formatter)
+    _terminal.setFormatter(formatter)
+    _terminal.setLevel(level)
+    logger = logging.getLogger(ROOT_LOGGER)
+    logger.setLevel(logging.DEBUG)
+    logger.propagate = False
+    for handler in (_buffer, _terminal):
+        if handler not in logger.handlers:
+            logger.addHandler(handler)
+
+
+def start_test():
+    """Forget the previous test's events"""
+    _buffer.clear()
+
+
+def dump():
+    """Buffered events of the current test as text ('' when there are none)"""
+    return _buffer.dump()
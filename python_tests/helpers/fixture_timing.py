@@ -0,0 +1,41 @@
+"""
+Fixture cost breakdown
+Times the setup and teardown of every fixture and records them in the per-test
+metrics (fixtureSetupMs / fixtureTeardownMs). Setup times are exclusive: a
+fixture that requests another one inside its body (e.g. driver -> browser_pool)
+is not charged for the inner fixture's setup.
+"""
+import time
+
+import pytest
+
+from helpers import run_metrics
+
+# [fixture name, start, ms spent in nested fixture setups] for fixtures being set up
+_setup_stack = []
+# fixture name -> teardown start, for fixtures being torn down
+_teardown_started = {}
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef, request):
+    """Time the fixture's own setup"""
+    frame = [fixturedef.argname, time.perf_counter(), 0.0]
+    _setup_stack.append(frame)
+    try:
+        yield
+    finally:
+        _setup_stack.pop()
+        elapsed_ms = (time.perf_counter() - frame[1]) * 1000
+        if _setup_stack:
+            _setup_stack[-1][2] += elapsed_ms
+        run_metrics.add_timing('fixtureSetupMs', fixturedef.argname, elapsed_ms - frame[2])
+        # Finalizers run last-in first-out, so this one runs right before the fixture's own teardown
+        fixturedef.addfinalizer(lambda: _teardown_started.__setitem__(fixturedef.argname, time.perf_counter()))
+
+
+def pytest_fixture_post_finalizer(fixturedef, request):
+    """Record the teardown time once all of the fixture's finalizers have run"""
+    started = _teardown_started.pop(fixturedef.argname, None)
+    if started is not None:
+        run_metrics.add_timing('fixtureTeardownMs', fixturedef.argname, (time.perf_counter() - started) * 1000)
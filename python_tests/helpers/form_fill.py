@@ -0,0 +1,112 @@
+"""
+Bulk form population
+Applies a whole set of field values in one execute_script call while firing the
+same input/change events a user would, so the prototype's validation and
+onchange handlers still run
+"""
+from selenium.common.exceptions import NoSuchElementException
+
+from helpers.table_extract import css_selector
+
+# arguments[0]: list of {name, selector, value}. Returns {fields: {name: state}, missing: [...]}.
+# - text inputs/textareas: value set through the native setter, then input + change
+# - <select>: option chosen by visible text or value, then input + change
+# - checkboxes (a single box, several matched boxes, or a container such as the
+#   role multi-select): a boolean sets a single box, a list checks the boxes whose
+#   value is in the list and clears the rest; values with no box are ignored, as in
+#   the keystroke path. Hidden boxes are toggled through their clickable wrapper
+#   (e.g. the role permission cards) so visual state follows.
+FORM_FILL_SCRIPT = """
+var fields = arguments[0];
+var result = {fields: {}, missing: []};
+
+function fire(element, type) { element.dispatchEvent(new Event(type, {bubbles: true})); }
+function visible(element) { return element.getClientRects().length > 0; }
+function setChecked(box, checked) {
+    if (box.checked === checked) { return; }
+    var target = visible(box) ? box : (box.closest('[onclick]') || box);
+    target.click();
+    if (box.checked !== checked) {
+        box.checked = checked;
+        fire(box, 'input');
+        fire(box, 'change');
+    }
+}
+function setText(element, value) {
+    var proto = element.tagName === 'TEXTAREA' ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    element.focus();
+    Object.getOwnPropertyDescriptor(proto, 'value').set.call(element, value);
+    fire(element, 'input');
+    fire(element, 'change');
+    element.blur();
+}
+function fieldState(elements) {
+    var first = elements[0];
+    var boxes = checkboxesOf(elements);
+    var state = {
+        valid: elements.every(function (el) { return !el.validity || el.validity.valid; }),
+        validationMessage: first.validationMessage || ''
+    };
+    if (first.tagName === 'SELECT') {
+        state.value = first.value;
+        state.selected = Array.prototype.filter.call(first.options, function (o) { return o.selected; })
+            .map(function (o) { return o.text.trim(); });
+    } else if (boxes.length) {
+        state.checked = boxes.filter(function (b) { return b.checked; }).map(function (b) { return b.value; });
+    } else {
+        state.value = first.value;
+    }
+    return state;
+}
+function checkboxesOf(elements) {
+    if (elements.length === 1 && !elements[0].matches('input, select, textarea')) {
+        return Array.prototype.slice.call(elements[0].querySelectorAll('input[type=checkbox], input[type=radio]'));
+    }
+    return elements.filter(function (el) { return el.type === 'checkbox' || el.type === 'radio'; });
+}
+
+fields.forEach(function (field) {
+    var elements = Array.prototype.slice.call(document.querySelectorAll(field.selector));
+    if (!elements.length) { result.missing.push(field.name); return; }
+    var first = elements[0];
+    var values = Array.isArray(field.value) ? field.value.map(String) : [String(field.value)];
+    var boxes = checkboxesOf(elements);
+
+    if (first.tagName === 'SELECT') {
+        var option = Array.prototype.find.call(first.options, function (o) {
+            return values.indexOf(o.text.trim()) !== -1 || values.indexOf(o.value) !== -1;
+        });
+        if (!option) { result.missing.push(field.name + ': ' + values.join(', ')); return; }
+        first.value = option.value;
+        fire(first, 'input');
+        fire(first, 'change');
+    } else if (boxes.length === 1 && typeof field.value === 'boolean') {
+        setChecked(boxes[0], field.value);
+    } else if (boxes.length) {
+        boxes.forEach(function (b) { setChecked(b, values.indexOf(b.value) !== -1); });
+    } else {
+        setText(first, values.join(''));
+    }
+    result.fields[field.name] = fieldState(elements);
+});
+return result;
+"""
+
+
+def bulk_fill(driver, fields):
+    """
+    Apply {name: (locator, value)} in one round trip and return {name: post-fill state}.
+    Returns None when the driver cannot run scripts; raises NoSuchElementException
+    for fields or <select> options that do not exist on the page (checkbox values
+    without a box are skipped, as the keystroke path does).
+    """
+    script_fields = [
+        {'name': name, 'selector': css_selector(locator), 'value': value}
+        for name, (locator, value) in fields.items()
+    ]
+    result = driver.execute_script(FORM_FILL_SCRIPT, script_fields)
+    if not isinstance(result, dict):
+        return None
+    if result['missing']:
+        raise NoSuchElementException(f"Form fields or options not found: {', '.join(result['missing'])}")
+    return result['fields']
@@ -0,0 +1,69 @@
+"""
+Prototype "app idle" detection
+Injects helpers/js/idle_tracker.js before page scripts run so tests can wait
+for the page's pending timers, animation frames and CSS transitions to finish
+instead of guessing a fixed timeout
+"""
+import time
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+from config import TestConfig
+from helpers import run_metrics
+from helpers.event_log import get_logger
+
+log = get_logger("waits")
+
+IDLE_TRACKER_SCRIPT = (Path(__file__).parent / "js" / "idle_tracker.js").read_text(encoding="utf-8")
+
+WAIT_FOR_IDLE_SCRIPT = """
+var done = arguments[arguments.length - 1];
+if (!window.__e2eIdle) { done(null); return; }
+window.__e2eIdle.whenIdle(arguments[0], arguments[1], done);
+"""
+
+
+def install_idle_tracker(driver):
+    """Register the tracker so it runs before page scripts on every new document"""
+    if not TestConfig.IDLE_TRACKING or not hasattr(driver, "execute_cdp_cmd"):
+        return False
+    try:
+        driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": IDLE_TRACKER_SCRIPT})
+        return True
+    except WebDriverException as e:
+        log.warning("⚠️  Could not register idle tracker: %s", str(e).splitlines()[0])
+        return False
+
+
+def wait_until_idle(driver, timeout=None, max_timer_ms=None):
+    """
+    Wait until the page has no pending work.
+    Returns True when idle, False on timeout and None when the driver cannot report idleness.
+    Timers longer than max_timer_ms (e.g. a banner auto-hide) are not treated as pending work.
+    """
+    timeout = TestConfig.IDLE_TIMEOUT if timeout is None else timeout
+    max_timer_ms = TestConfig.IDLE_MAX_TIMER_MS if max_timer_ms is None else max_timer_ms
+
+    start = time.perf_counter()
+    try:
+        clock = getattr(driver, "virtual_clock", None)
+        if clock is not None:
+            # Under the virtual clock short timers only run when time is moved forward
+            clock.flush(max_timer_ms)
+        result = driver.execute_async_script(WAIT_FOR_IDLE_SCRIPT, timeout * 1000, max_timer_ms)
+        if result is None and TestConfig.IDLE_TRACKING:
+            # Document was loaded before the tracker was registered: track from now on
+            driver.execute_script(IDLE_TRACKER_SCRIPT)
+            result = driver.execute_async_script(WAIT_FOR_IDLE_SCRIPT, timeout * 1000, max_timer_ms)
+    except WebDriverException as e:
+        log.warning("⚠️  Idle wait failed: %s", str(e).splitlines()[0])
+        return None
+    finally:
+        run_metrics.increment('idleWaitMs', round((time.perf_counter() - start) * 1000, 1))
+
+    if not isinstance(result, dict):
+        return None
+    if not result.get('idle'):
+        log.warning("⚠️  Page not idle after %ss, pending: %s", timeout, result.get('pending'))
+    return bool(result.get('idle'))
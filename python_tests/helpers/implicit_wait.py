@@ -0,0 +1,114 @@
+"""
+Implicit wait control and stall detection
+With an implicit wait configured, every lookup for an element the page does not
+render blocks for the full wait before returning. no_implicit_wait() suspends it
+for negative checks, and the stall detector records every lookup that paid it.
+The wait in force is tracked on the driver, so a suspended wait is restored to
+what it was (e.g. a test that lowered it), not to TestConfig.IMPLICIT_WAIT.
+"""
+import time
+import traceback
+from contextlib import contextmanager
+from pathlib import Path
+
+from selenium.common.exceptions import NoSuchElementException
+from selenium.webdriver.remote.command import Command
+
+from config import TestConfig
+from helpers import run_metrics
+from helpers.event_log import get_logger
+
+log = get_logger("waits")
+
+FIND_COMMANDS = {
+    Command.FIND_ELEMENT,
+    Command.FIND_ELEMENTS,
+    Command.FIND_CHILD_ELEMENT,
+    Command.FIND_CHILD_ELEMENTS,
+}
+
+SUITE_ROOT = Path(__file__).resolve().parent.parent
+HELPERS_DIR = Path(__file__).resolve().parent
+
+
+def install_implicit_wait_tracking(driver):
+    """Wrap driver.implicitly_wait so the value in force is known without asking the browser"""
+    implicitly_wait = driver.implicitly_wait
+
+    def implicitly_wait_tracked(time_to_wait):
+        implicitly_wait(time_to_wait)
+        driver._implicit_wait = time_to_wait
+
+    driver.implicitly_wait = implicitly_wait_tracked
+    return True
+
+
+def current_implicit_wait(driver):
+    """Implicit wait in force on driver (TestConfig.IMPLICIT_WAIT for untracked drivers)"""
+    return getattr(driver, "_implicit_wait", TestConfig.IMPLICIT_WAIT)
+
+
+@contextmanager
+def no_implicit_wait(driver):
+    """Run lookups with the implicit wait set to zero, restoring the previous wait afterwards (re-entrant)"""
+    depth = getattr(driver, "_no_implicit_wait_depth", 0)
+    if depth == 0:
+        restore = current_implicit_wait(driver)
+        driver.implicitly_wait(0)
+    driver._no_implicit_wait_depth = depth + 1
+    try:
+        yield driver
+    finally:
+        driver._no_implicit_wait_depth = depth
+        if depth == 0:
+            driver.implicitly_wait(restore)
+
+
+def lookup_caller():
+    """First suite frame (page object or test) outside the helpers, as 'file:line function'"""
+    for frame in reversed(traceback.extract_stack()):
+        path = Path(frame.filename).resolve()
+        if SUITE_ROOT not in path.parents or HELPERS_DIR in path.parents:
+            continue
+        return f"{path.relative_to(SUITE_ROOT)}:{frame.lineno} {frame.name}"
+    return None
+
+
+def install_stall_detector(driver, threshold_ms=None):
+    """Wrap driver.execute so empty lookups slower than threshold_ms are recorded as stalls"""
+    if not TestConfig.IMPLICIT_WAIT_STALL_DETECTION or not hasattr(driver, "execute"):
+        return False
+    threshold_ms = TestConfig.IMPLICIT_WAIT_STALL_MS if threshold_ms is None else threshold_ms
+    execute = driver.execute
+
+    def execute_with_stall_detection(driver_command, params=None):
+        if driver_command not in FIND_COMMANDS:
+            return execute(driver_command, params)
+        start = time.perf_counter()
+        try:
+            response = execute(driver_command, params)
+        except NoSuchElementException:
+            _record_stall(params, start, threshold_ms)
+            raise
+        if not (response or {}).get("value"):
+            _record_stall(params, start, threshold_ms)
+        return response
+
+    driver.execute = execute_with_stall_detection
+    return True
+
+
+def _record_stall(params, start, threshold_ms):
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    if elapsed_ms < threshold_ms:
+        return
+    params = params or {}
+    stall = {
+        'locator': f"{params.get('using')}={params.get('value')}",
+        'ms': round(elapsed_ms, 1),
+        'caller': lookup_caller(),
+    }
+    run_metrics.increment('implicitWaitStalls')
+    run_metrics.increment('implicitWaitStallMs', stall['ms'])
+    run_metrics.append('implicitWaitStallLookups', stall)
+    log.warning("🐢 Lookup %s stalled %.0fms on implicit wait (%s)", stall['locator'], stall['ms'], stall['caller'])
@@ -0,0 +1,143 @@
+/*
+ * Idle tracker for the E2E prototypes
+ * Injected before page scripts run. Wraps setTimeout/setInterval/requestAnimationFrame
+ * so tests can ask whether the page still has deferred work pending.
+ */
+(function () {
+    if (window.__e2eIdle) {
+        return;
+    }
+
+    // Poll with real timers even if the virtual clock was installed first
+    var realTimers = window.__e2eClock ? window.__e2eClock.real : null;
+    var nativeSetTimeout = window.setTimeout;
+    var nativeClearTimeout = window.clearTimeout;
+    var nativeSetInterval = window.setInterval;
+    var nativeClearInterval = window.clearInterval;
+    var nativeRequestAnimationFrame = window.requestAnimationFrame;
+    var nativeCancelAnimationFrame = window.cancelAnimationFrame;
+    var nativeNow = performance.now.bind(performance);
+    var pollTimeout = realTimers ? realTimers.setTimeout : nativeSetTimeout;
+    var pollNow = realTimers ? realTimers.now : nativeNow;
+
+    var timeouts = new Map();   // timer id -> delay in ms
+    var intervals = new Map();  // timer id -> period in ms
+    var frames = new Set();
+
+    function invoke(callback, args) {
+        if (typeof callback === 'function') {
+            callback.apply(window, args);
+        } else {
+            (0, eval)(String(callback));
+        }
+    }
+
+    window.setTimeout = function (callback, delay) {
+        var args = Array.prototype.slice.call(arguments, 2);
+        var id = nativeSetTimeout.call(window, function () {
+            try {
+                invoke(callback, args);
+            } finally {
+                timeouts.delete(id);
+            }
+        }, delay);
+        timeouts.set(id, Number(delay) || 0);
+        return id;
+    };
+
+    window.setInterval = function (callback, delay) {
+        var args = Array.prototype.slice.call(arguments, 2);
+        var id = nativeSetInterval.call(window, function () {
+            invoke(callback, args);
+        }, delay);
+        intervals.set(id, Number(delay) || 0);
+        return id;
+    };
+
+    // Browsers treat clearTimeout and clearInterval as interchangeable
+    window.clearTimeout = function (id) {
+        timeouts.delete(id);
+        intervals.delete(id);
+        return nativeClearTimeout.call(window, id);
+    };
+
+    window.clearInterval = function (id) {
+        timeouts.delete(id);
+        intervals.delete(id);
+        return nativeClearInterval.call(window, id);
+    };
+
+    if (nativeRequestAnimationFrame) {
+        window.requestAnimationFrame = function (callback) {
+            var id = nativeRequestAnimationFrame.call(window, function (timestamp) {
+                try {
+                    callback(timestamp);
+                } finally {
+                    frames.delete(id);
+                }
+            });
+            frames.add(id);
+            return id;
+        };
+
+        window.cancelAnimationFrame = function (id) {
+            frames.delete(id);
+            return nativeCancelAnimationFrame.call(window, id);
+        };
+    }
+
+    function countTimers(timers, maxTimerMs) {
+        var count = 0;
+        timers.forEach(function (delay) {
+            if (maxTimerMs == null || delay <= maxTimerMs) {
+                count += 1;
+            }
+        });
+        return count;
+    }
+
+    // Finite CSS transitions and animations (infinite spinners never finish)
+    function runningAnimations() {
+        if (!document.getAnimations) {
+            return 0;
+        }
+        return document.getAnimations().filter(function (animation) {
+            var timing = animation.effect ? animation.effect.getComputedTiming() : {};
+            return animation.playState === 'running' && timing.iterations !== Infinity;
+        }).length;
+    }
+
+    window.__e2eIdle = {
+        pending: function (maxTimerMs) {
+            return {
+                timeouts: countTimers(timeouts, maxTimerMs),
+                intervals: countTimers(intervals, maxTimerMs),
+                frames: frames.size,
+                animations: runningAnimations(),
+                loading: document.readyState === 'complete' ? 0 : 1
+            };
+        },
+
+        isIdle: function (maxTimerMs) {
+            var pending = this.pending(maxTimerMs);
+            return pending.timeouts + pending.intervals + pending.frames +
+                pending.animations + pending.loading === 0;
+        },
+
+        // Calls done({idle, elapsedMs, pending}) as soon as nothing is pending,
+        // or with idle=false once timeoutMs has elapsed
+        whenIdle: function (timeoutMs, maxTimerMs, done) {
+            var tracker = this;
+            var start = pollNow();
+            (function check() {
+                var elapsed = pollNow() - start;
+                var idle = tracker.isIdle(maxTimerMs);
+                if (idle || elapsed >= timeoutMs) {
+                    done({idle: idle, elapsedMs: elapsed, pending: tracker.pending(maxTimerMs)});
+                    return;
+                }
+                pollTimeout.call(window, check, 10);
+            })();
+        }
+    };
+})();
@@ -0,0 +1,146 @@
+/*
+ * Virtual clock for the E2E prototypes
+ * Injected before page scripts run. Replaces Date, setTimeout/setInterval and
+ * performance.now with a controllable clock so tests can jump through
+ * success banners, upload progress and modal close delays with advance(ms).
+ */
+(function () {
+    if (window.__e2eClock) {
+        return;
+    }
+
+    var NativeDate = window.Date;
+    var real = {
+        setTimeout: window.setTimeout.bind(window),
+        clearTimeout: window.clearTimeout.bind(window),
+        now: performance.now.bind(performance)
+    };
+
+    var startEpoch = NativeDate.now();
+    var startPerformance = real.now();
+    var elapsed = 0;
+    var nextId = 1;
+    var timers = new Map();  // id -> {callback, args, delay, due, interval}
+
+    function invoke(timer) {
+        if (typeof timer.callback === 'function') {
+            timer.callback.apply(window, timer.args);
+        } else {
+            (0, eval)(String(timer.callback));
+        }
+    }
+
+    function schedule(callback, delay, args, interval) {
+        var id = nextId++;
+        delay = Math.max(0, Number(delay) || 0);
+        timers.set(id, {callback: callback, args: args, delay: delay, due: elapsed + delay, interval: interval});
+        return id;
+    }
+
+    // Earliest due timer (ties broken by scheduling order), optionally limited
+    function nextTimer(limitDue, maxDelay) {
+        var next = null;
+        timers.forEach(function (timer, id) {
+            if (limitDue != null && timer.due > limitDue) { return; }
+            if (maxDelay != null && timer.delay > maxDelay) { return; }
+            if (next === null || timer.due < next.timer.due || (timer.due === next.timer.due && id < next.id)) {
+                next = {id: id, timer: timer};
+            }
+        });
+        return next;
+    }
+
+    function fire(next) {
+        elapsed = Math.max(elapsed, next.timer.due);
+        if (next.timer.interval) {
+            next.timer.due = elapsed + Math.max(next.timer.delay, 1);
+        } else {
+            timers.delete(next.id);
+        }
+        invoke(next.timer);
+    }
+
+    // Moves finite CSS transitions/animations forward by the same amount of time
+    function advanceAnimations(ms) {
+        if (!document.getAnimations) { return; }
+        document.getAnimations().forEach(function (animation) {
+            var timing = animation.effect ? animation.effect.getComputedTiming() : {};
+            if (animation.playState !== 'running' || timing.iterations === Infinity) { return; }
+            var remaining = timing.endTime - (animation.currentTime || 0);
+            if (remaining <= ms) {
+                animation.finish();
+            } else {
+                animation.currentTime = (animation.currentTime || 0) + ms;
+            }
+        });
+    }
+
+    function FakeDate() {
+        if (!(this instanceof FakeDate)) {
+            return new NativeDate(startEpoch + elapsed).toString();
+        }
+        if (arguments.length === 0) {
+            return new NativeDate(startEpoch + elapsed);
+        }
+        var args = [null].concat(Array.prototype.slice.call(arguments));
+        return new (Function.prototype.bind.apply(NativeDate, args))();
+    }
+    FakeDate.prototype = NativeDate.prototype;
+    FakeDate.now = function () { return startEpoch + elapsed; };
+    FakeDate.parse = NativeDate.parse;
+    FakeDate.UTC = NativeDate.UTC;
+
+    window.Date = FakeDate;
+    window.setTimeout = function (callback, delay) {
+        return schedule(callback, delay, Array.prototype.slice.call(arguments, 2), false);
+    };
+    window.setInterval = function (callback, delay) {
+        return schedule(callback, delay, Array.prototype.slice.call(arguments, 2), true);
+    };
+    window.clearTimeout = window.clearInterval = function (id) {
+        timers.delete(id);
+    };
+    performance.now = function () { return startPerformance + elapsed; };
+
+    window.__e2eClock = {
+        real: real,
+
+        now: function () { return elapsed; },
+
+        // Run every timer due within the next ms milliseconds; returns the number fired
+        advance: function (ms) {
+            var target = elapsed + Math.max(0, Number(ms) || 0);
+            var fired = 0;
+            var next;
+            while ((next = nextTimer(target, null)) !== null) {
+                fire(next);
+                fired += 1;
+            }
+            advanceAnimations(target - elapsed);
+            elapsed = target;
+            return fired;
+        },
+
+        // Run pending timers whose delay is at most maxDelay (long auto-hide timers are left alone)
+        flush: function (maxDelay, limit) {
+            var start = elapsed;
+            var fired = 0;
+            var next;
+            limit = limit || 1000;
+            while (fired < limit && (next = nextTimer(null, maxDelay)) !== null) {
+                fire(next);
+                fired += 1;
+            }
+            advanceAnimations(elapsed - start);
+            return fired;
+        },
+
+        pending: function (maxDelay) {
+            var count = 0;
+            timers.forEach(function (timer) {
+                if (maxDelay == null || timer.delay <= maxDelay) { count += 1; }
+            });
+            return count;
+        }
+    };
+})();
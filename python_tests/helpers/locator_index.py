@@ -0,0 +1,476 @@
+"""
+Static locator index for the prototype pages
+Parses the prototype HTML files once into an index of their ids, classes, names,
+tags and attributes, plus the identifiers their inline scripts use (for elements
+that are rendered at runtime). The index is cached in LOCATOR_INDEX_PATH and
+rebuilt only for files whose content hash changed.
+
+At collection time every page-object locator is checked against the index of its
+page (PAGE_FILE), and tests that reach a missing locator, directly or through
+page-object methods, are marked `missing_locators` before any browser starts.
+LOCATOR_CHECK (or --locator-check) decides what happens to them: "mark" only
+marks and reports, "skip" skips them, "fail" fails them without running, "off"
+disables the check. Under the DOM mock, which resolves locators against the same
+HTML, "mark" also expects them to fail (non-strict xfail).
+
+Usage:
+    # List the missing (and with --all, every) page-object locator
+    python python_tests/helpers/locator_index.py [--all] [--rebuild]
+"""
+import argparse
+import ast
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import pkgutil
+import re
+import sys
+import tempfile
+import textwrap
+from pathlib import Path
+
+import pytest
+from selenium.common.exceptions import InvalidSelectorException
+from selenium.webdriver.common.by import By
+
+# Add the parent directory to Python path for imports when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TestConfig
+from helpers.mock_dom import DomDocument, parse_selector
+from helpers.mock_driver import driver_mode
+
+INDEX_VERSION = 1
+
+PROTOTYPE_FILES = ["admin-prototype.html", "notification-management.html",
+                   "template-management.html", "outage-history.html"]
+
+# Attribute values longer than this (inline styles, handlers) are not indexed
+MAX_ATTRIBUTE_VALUE = 100
+
+SCRIPT_TOKEN = re.compile(r"[\w-]+")
+
+FOUND, DYNAMIC, MISSING, UNCHECKED = "found", "dynamic", "missing", "unchecked"
+STATUS_ORDER = [FOUND, DYNAMIC, MISSING]
+
+
+def file_hash(path):
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_page_index(path):
+    """Index of one HTML file: static markup plus identifiers used by its inline scripts"""
+    document = DomDocument(path.read_text(encoding="utf-8"))
+    ids, classes, names, tags, attributes, values, scripts = set(), set(), set(), set(), set(), set(), []
+    for node in document.root.iter_descendants():
+        tags.add(node.tag)
+        classes.update(node.classes)
+        for name, value in node.attrs.items():
+            attributes.add(name)
+            if len(value) <= MAX_ATTRIBUTE_VALUE:
+                values.add(f"{name}={value}")
+            if name == "id":
+                ids.add(value)
+            elif name == "name":
+                names.add(value)
+        if node.tag == "script":
+            scripts.extend(child for child in node.children if isinstance(child, str))
+    return {
+        "sha256": file_hash(path),
+        "ids": sorted(ids),
+        "classes": sorted(classes),
+        "names": sorted(names),
+        "tags": sorted(tags),
+        "attributes": sorted(attributes),
+        "attributeValues": sorted(values),
+        "scriptTokens": sorted(set(SCRIPT_TOKEN.findall("\n".join(scripts)))),
+    }
+
+
+class PageIndex:
+    """Lookup side of one page's index"""
+
+    def __init__(self, entry):
+        self.ids = set(entry["ids"])
+        self.classes = set(entry["classes"])
+        self.names = set(entry["names"])
+        self.tags = set(entry["tags"])
+        self.attributes = set(entry["attributes"])
+        self.attribute_values = set(entry["attributeValues"])
+        self.script_tokens = set(entry["scriptTokens"])
+
+    def _status(self, static, value):
+        if value in static:
+            return FOUND
+        tokens = SCRIPT_TOKEN.findall(value)
+        return DYNAMIC if tokens and all(token in self.script_tokens for token in tokens) else MISSING
+
+    def locator_status(self, locator):
+        """found (in the markup), dynamic (only named by page scripts), missing or unchecked"""
+        by, value = locator
+        if by == By.ID:
+            return self._status(self.ids, value)
+        if by == By.CLASS_NAME:
+            return self._status(self.classes, value)
+        if by == By.NAME:
+            return self._status(self.names, value)
+        if by == By.TAG_NAME:
+            return self._status(self.tags, value.lower())
+        if by == By.CSS_SELECTOR:
+            try:
+                groups = parse_selector(value)
+            except InvalidSelectorException:
+                return UNCHECKED
+            # A selector list matches if any of its selectors can
+            return min((self._chain_status(chain) for chain in groups), key=STATUS_ORDER.index)
+        return UNCHECKED
+
+    def _chain_status(self, chain):
+        statuses = [FOUND]
+        for _, compound in chain:
+            statuses += [self._status(self.ids, element_id) for element_id in compound.ids]
+            statuses += [self._status(self.classes, name) for name in compound.classes]
+            if compound.tag not in (None, "*"):
+                statuses.append(self._status(self.tags, compound.tag))
+            for name, op, value in compound.attributes:
+                statuses.append(self._status(self.attributes, name))
+                if op == "=":
+                    statuses.append(self._status(self.attribute_values, f"{name}={value}"))
+        return max(statuses, key=STATUS_ORDER.index)
+
+
+def load_index(rebuild=False):
+    """{file name: PageIndex}, rebuilding (and re-caching) the entries of changed files"""
+    path = Path(TestConfig.LOCATOR_INDEX_PATH)
+    cached = {}
+    if not rebuild:
+        try:
+            cached = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            cached = {}
+    pages = cached.get("pages", {}) if cached.get("version") == INDEX_VERSION else {}
+
+    changed = False
+    for name in PROTOTYPE_FILES:
+        html_path = Path(TestConfig.HTML_FILES_PATH) / name
+        if not html_path.exists():
+            changed |= pages.pop(name, None) is not None
+            continue
+        if pages.get(name, {}).get("sha256") != file_hash(html_path):
+            pages[name] = build_page_index(html_path)
+            changed = True
+
+    if changed:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write then rename, so concurrent xdist workers never read a partial index
+        handle, staging = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+        with os.fdopen(handle, "w", encoding="utf-8") as staged:
+            json.dump({"version": INDEX_VERSION, "pages": pages}, staged)
+        os.replace(staging, path)
+    return {name: PageIndex(entry) for name, entry in pages.items()}
+
+
+# --- Page objects --------------------------------------------------------------------------
+
+def page_object_classes():
+    """Every page-object class that declares the prototype file it drives (PAGE_FILE)"""
+    import page_objects
+    classes = {}
+    for module_info in pkgutil.iter_modules(page_objects.__path__):
+        module = importlib.import_module(f"page_objects.{module_info.name}")
+        for cls in vars(module).values():
+            if inspect.isclass(cls) and cls.__module__ == module.__name__ and getattr(cls, "PAGE_FILE", None):
+                classes[cls.__name__] = cls
+    return classes
+
+
+def class_locators(cls):
+    """{NAME: (by, value)} locator constants of a page-object class"""
+    return {name: value for name, value in inspect.getmembers(cls)
+            if name.isupper() and isinstance(value, tuple) and len(value) == 2 and isinstance(value[1], str)}
+
+
+# Lookup failures a page-object method may catch to report "not there" instead of failing
+LOOKUP_ERRORS = {"TimeoutException", "NoSuchElementException"}
+
+# Strength of a reference, weakest first
+OPTIONAL, REQUIRED, ASSERTED = 0, 1, 2
+
+
+def _tolerates_lookup_failure(node):
+    """True for a try block that catches a failed lookup without re-raising it"""
+    if not isinstance(node, ast.Try):
+        return False
+    for handler in node.handlers:
+        types = handler.type.elts if isinstance(handler.type, ast.Tuple) else [handler.type]
+        caught = LOOKUP_ERRORS if handler.type is None else {getattr(t, "id", getattr(t, "attr", None)) for t in types}
+        if caught & LOOKUP_ERRORS and not any(isinstance(n, ast.Raise) for n in ast.walk(handler)):
+            return True
+    return False
+
+
+def _asserted_calls(tree):
+    """ids of the calls whose result is asserted, directly or through the variable it was assigned to"""
+    tests = [node.test for node in ast.walk(tree) if isinstance(node, ast.Assert)]
+    names = {n.id for test in tests for n in ast.walk(test) if isinstance(n, ast.Name)}
+    calls = {id(n) for test in tests for n in ast.walk(test) if isinstance(n, ast.Call)}
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call) and \
+                any(isinstance(target, ast.Name) and target.id in names for target in node.targets):
+            calls.add(id(node.value))
+    return calls
+
+
+def _references(tree, is_receiver, tolerant):
+    """
+    {(name, called): strength} of the attributes read and methods called on a receiver.
+    References inside a try that tolerates lookup failures, or passed to a tolerant method
+    whose result is not asserted, are OPTIONAL; calls whose result is asserted are ASSERTED.
+    """
+    asserted = _asserted_calls(tree)
+    references = {}
+
+    def add(key, strength):
+        references[key] = max(strength, references.get(key, OPTIONAL))
+
+    def visit(node, optional):
+        if _tolerates_lookup_failure(node):
+            for child in node.body:
+                visit(child, True)
+            for child in node.handlers + node.orelse + node.finalbody:
+                visit(child, optional)
+            return
+        if isinstance(node, ast.Call) and isinstance(node.func, ast.Attribute) and is_receiver(node.func.value):
+            name = node.func.attr
+            strength = OPTIONAL if optional else ASSERTED if id(node) in asserted else REQUIRED
+            add((name, True), strength)
+            visit(node.func.value, optional)
+            for argument in node.args + [keyword.value for keyword in node.keywords]:
+                visit(argument, optional or (name in tolerant and strength != ASSERTED))
+            return
+        if isinstance(node, ast.Attribute) and is_receiver(node.value):
+            add((node.attr, False), OPTIONAL if optional else REQUIRED)
+        for child in ast.iter_child_nodes(node):
+            visit(child, optional)
+
+    visit(tree, False)
+    return references
+
+
+def _is_self(node):
+    return isinstance(node, ast.Name) and node.id == "self"
+
+
+def method_locators(cls):
+    """
+    ({method name: (locators it must resolve, every locator it can reach)}, tolerant method names),
+    following calls to other methods of the class. A tolerant method catches a failed lookup and
+    reports it through its result (None, False, 0) instead of failing.
+    """
+    locators = class_locators(cls)
+    nodes = {}
+    for klass in reversed(cls.__mro__):
+        if klass is object:
+            continue
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(klass)))
+        except (OSError, TypeError):
+            continue
+        for node in tree.body[0].body:
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                nodes[node.name] = node
+
+    # Tolerant: catches lookup failures itself, or returns what a tolerant method returned
+    tolerant = {name for name, node in nodes.items() if any(_tolerates_lookup_failure(n) for n in ast.walk(node))}
+    while True:
+        wrappers = {name for name, node in nodes.items() if name not in tolerant and any(
+            isinstance(n, ast.Return) and isinstance(n.value, ast.Call) and isinstance(n.value.func, ast.Attribute)
+            and _is_self(n.value.func.value) and n.value.func.attr in tolerant for n in ast.walk(node))}
+        if not wrappers:
+            break
+        tolerant |= wrappers
+
+    direct = {name: _references(node, _is_self, tolerant) for name, node in nodes.items()}
+    resolved = {}
+
+    def resolve(method, seen):
+        if method in resolved:
+            return resolved[method]
+        required, reachable = set(), set()
+        for (name, called), strength in direct.get(method, {}).items():
+            if name in locators:
+                reachable.add(name)
+                if strength >= REQUIRED:
+                    required.add(name)
+            elif called and name in direct and name not in seen:
+                inner_required, inner_reachable = resolve(name, seen | {name})
+                reachable |= inner_reachable
+                if strength >= REQUIRED:
+                    required |= inner_reachable if strength == ASSERTED else inner_required
+        resolved[method] = (required, reachable)
+        return resolved[method]
+
+    for method in direct:
+        resolve(method, {method})
+    return resolved, tolerant
+
+
+class LocatorCheck:
+    """Page-object locators checked against the index, and the tests that depend on missing ones"""
+
+    def __init__(self, index=None):
+        self.index = load_index() if index is None else index
+        self.classes = page_object_classes()
+        self.statuses = {}  # {(class, locator name): status}
+        self._methods = {}
+        for class_name, cls in self.classes.items():
+            page = self.index.get(cls.PAGE_FILE)
+            for name, locator in class_locators(cls).items():
+                self.statuses[(class_name, name)] = page.locator_status(locator) if page else UNCHECKED
+
+    def missing(self):
+        return sorted(key for key, status in self.statuses.items() if status == MISSING)
+
+    def describe(self, key):
+        class_name, name = key
+        by, value = getattr(self.classes[class_name], name)
+        return f"{class_name}.{name} ({by}={value})"
+
+    def methods(self, class_name):
+        if class_name not in self._methods:
+            self._methods[class_name] = method_locators(self.classes[class_name])
+        return self._methods[class_name]
+
+    def test_dependencies(self, function):
+        """
+        (class, locator name) pairs a test function must resolve, for the page objects it uses.
+        Locators the test only reaches through a lookup it tolerates (a try catching the failure,
+        or a tolerant method such as wait_for_success_message whose result it does not assert)
+        are left out. Calls under an if are still counted, so a branch the test never takes can
+        make it depend on a locator it would not use.
+        """
+        try:
+            tree = ast.parse(textwrap.dedent(inspect.getsource(function)))
+        except (OSError, TypeError, SyntaxError):
+            return set()
+        used_names = {node.id for node in ast.walk(tree) if isinstance(node, ast.Name)}
+        classes = [name for name in self.classes if name in used_names]
+        if not classes:
+            # Page object handed in by a fixture: consider the ones the test module imports
+            module_names = vars(inspect.getmodule(function) or object)
+            classes = [name for name in self.classes if name in module_names]
+        bound = {target.id: node.value.func.id for node in ast.walk(tree)
+                 if isinstance(node, ast.Assign) and isinstance(node.value, ast.Call)
+                 and isinstance(node.value.func, ast.Name) and node.value.func.id in self.classes
+                 for target in node.targets if isinstance(target, ast.Name)}
+        dependencies = set()
+        for class_name in classes:
+            receivers = {class_name} | {name for name, bound_class in bound.items() if bound_class == class_name}
+            if len(receivers) > 1:
+                def is_receiver(node, receivers=receivers):
+                    return isinstance(node, ast.Name) and node.id in receivers
+            else:
+                def is_receiver(node):
+                    return True  # Page object from a fixture: any receiver may be it
+            locators = class_locators(self.classes[class_name])
+            methods, tolerant = self.methods(class_name)
+            for (name, called), strength in _references(tree, is_receiver, tolerant).items():
+                if strength < REQUIRED:
+                    continue
+                if name in locators:
+                    dependencies.add((class_name, name))
+                elif called and name in methods:
+                    required, reachable = methods[name]
+                    dependencies.update((class_name, locator) for locator in
+                                        (reachable if strength == ASSERTED else required))
+        return dependencies
+
+    def missing_for(self, function):
+        return sorted(key for key in self.test_dependencies(function) if self.statuses.get(key) == MISSING)
+
+
+# --- pytest plugin ---------------------------------------------------------------------------
+
+class LocatorCheckPlugin:
+    """Marks, skips or fails tests that depend on locators missing from the prototype HTML"""
+
+    def __init__(self, mode):
+        self.mode = mode
+        self.check = LocatorCheck()
+        self.affected = []
+
+    def pytest_collection_modifyitems(self, config, items):
+        for item in items:
+            function = getattr(item, "function", None)
+            missing = self.check.missing_for(function) if function is not None else []
+            if not missing:
+                continue
+            self.affected.append(item.nodeid)
+            described = [self.check.describe(key) for key in missing]
+            item.add_marker(pytest.mark.missing_locators(*described))
+            if self.mode == "skip":
+                item.add_marker(pytest.mark.skip(reason=f"Missing from the prototype HTML: {', '.join(described)}"))
+            elif self.mode == "mark" and driver_mode() == "dom":
+                # The DOM mock raises NoSuchElementException for them; a branch not taken still passes
+                item.add_marker(pytest.mark.xfail(reason=f"Missing from the prototype HTML: {', '.join(described)}",
+                                                  strict=False))
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_setup(self, item):
+        """Fail before any fixture (and so any browser) is set up"""
+        marker = item.get_closest_marker("missing_locators")
+        if self.mode == "fail" and marker is not None:
+            pytest.fail(f"Depends on locators missing from the prototype HTML: {', '.join(marker.args)}", pytrace=False)
+
+    def pytest_terminal_summary(self, terminalreporter):
+        missing = self.check.missing()
+        if not missing:
+            terminalreporter.write_line(f"🔎 Locator check: all {len(self.check.statuses)} page-object locators resolve")
+            return
+        tests = f", {len(self.affected)} tests depend on them ({self.mode})" if self.affected else ""
+        terminalreporter.write_line(
+            f"⚠️  Locator check: {len(missing)} of {len(self.check.statuses)} page-object locators are missing "
+            f"from the prototype HTML{tests}", yellow=True)
+        for key in missing:
+            terminalreporter.write_line(f"   {self.check.describe(key)}")
+
+
+def pytest_configure(config):
+    """Register the locator check unless it is turned off"""
+    config.addinivalue_line("markers", "missing_locators(*locators): Test depends on page-object locators "
+                                       "missing from the prototype HTML (set by the locator check)")
+    mode = config.getoption("locator_check") or TestConfig.LOCATOR_CHECK
+    if mode != "off":
+        config.pluginmanager.register(LocatorCheckPlugin(mode), "locator_check")
+
+
+def pytest_addoption(parser):
+    """Add command line options"""
+    parser.addoption(
+        '--locator-check',
+        choices=["off", "mark", "skip", "fail"],
+        default=None,
+        help='What to do with tests that depend on page-object locators missing from the prototype HTML '
+             '(default: TestConfig.LOCATOR_CHECK)'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--all", action="store_true", help="List every locator with its status, not only missing ones")
+    parser.add_argument("--rebuild", action="store_true", help="Ignore the cached index and parse every page again")
+    args = parser.parse_args()
+
+    check = LocatorCheck(load_index(rebuild=args.rebuild))
+    for key, status in sorted(check.statuses.items()):
+        if args.all or status == MISSING:
+            print(f"{status:>9}  {check.describe(key)}")
+    missing = check.missing()
+    print(f"{'❌' if missing else '✅'} {len(missing)} of {len(check.statuses)} page-object locators missing")
+    return 1 if missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
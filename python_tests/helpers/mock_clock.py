@@ -0,0 +1,73 @@
+"""
+Virtual time for mock-driver runs
+With no browser behind the driver there is nothing to wait for, yet slow-motion
+pauses, explicit-wait polling and wait timeouts still sleep for real. While the
+mock driver is active the clock replaces time.sleep and time.monotonic (which
+Selenium's WebDriverWait and AdaptiveWait use): a sleep on the test thread
+advances virtual time instantly and is reported per test as
+metrics.simulatedWaitMs, the time the test would have waited in a real run.
+Only the thread that installed the clock sees virtual time; other threads
+(browser pool warm-up, I/O) keep real sleeps and real monotonic time.
+"""
+import threading
+import time
+
+from helpers import run_metrics
+
+
+class MockClock:
+    """Process-wide virtual clock patched over time.sleep/time.monotonic"""
+
+    _active = None
+
+    def __init__(self):
+        self.offset = 0.0
+        self._owner = threading.current_thread()
+        self._real_sleep = time.sleep
+        self._real_monotonic = time.monotonic
+
+    @classmethod
+    def install(cls):
+        """Patch the time module (idempotent); returns the active clock"""
+        if cls._active is None:
+            clock = cls()
+            time.sleep = clock.sleep
+            time.monotonic = clock.monotonic
+            cls._active = clock
+        return cls._active
+
+    @classmethod
+    def active(cls):
+        return cls._active
+
+    def uninstall(self):
+        """Restore the real time functions"""
+        time.sleep = self._real_sleep
+        time.monotonic = self._real_monotonic
+        if MockClock._active is self:
+            MockClock._active = None
+
+    def monotonic(self):
+        """Virtual time on the test thread, real time elsewhere (timeouts there are measured with real sleeps)"""
+        if threading.current_thread() is not self._owner:
+            return self._real_monotonic()
+        return self._real_monotonic() + self.offset
+
+    def sleep(self, seconds):
+        """Advance virtual time on the test thread; other threads (browser pool, I/O) sleep for real"""
+        if threading.current_thread() is not self._owner:
+            self._real_sleep(seconds)
+            return
+        self.advance(seconds)
+
+    def advance(self, seconds):
+        if seconds > 0:
+            self.offset += seconds
+            run_metrics.increment('simulatedWaitMs', seconds * 1000)
+
+
+def simulate_wait(seconds):
+    """Account for a wait a real browser would have spent (e.g. an implicit wait on a missing element)"""
+    clock = MockClock.active()
+    if clock is not None:
+        clock.advance(seconds)
@@ -0,0 +1,622 @@
+"""
+DOM-backed mock WebDriver
+Parses the prototype HTML (html.parser) into an in-memory DOM and resolves
+locators against the real markup: missing ids raise NoSuchElementException,
+form fields keep their values, checkboxes/radios their checked state and
+selects only accept options that exist. Page scripts are not run, so state
+that JavaScript would render or toggle (modals, generated rows) is only what
+the static markup contains.
+Enable with --mock-dom (or TestConfig.MOCK_DRIVER = "dom").
+"""
+import os
+import re
+from html.parser import HTMLParser
+from urllib.parse import unquote, urlparse
+from urllib.request import url2pathname
+
+from selenium.common.exceptions import (
+    ElementNotInteractableException,
+    InvalidSelectorException,
+    NoSuchElementException,
+)
+from selenium.webdriver.common.by import By
+
+from helpers.mock_clock import simulate_wait
+from helpers.mock_driver import MockWebDriver, MockWebElement, log
+
+VOID_ELEMENTS = {"area", "base", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "track", "wbr"}
+
+# Elements whose open tag implicitly closes an open sibling (e.g. <option> ... <option>)
+IMPLICIT_END = {
+    "option": {"option"},
+    "li": {"li"},
+    "p": {"p"},
+    "tr": {"tr", "td", "th"},
+    "td": {"td", "th"},
+    "th": {"td", "th"},
+}
+
+RAW_TEXT_ELEMENTS = {"script", "style"}
+TEXT_INPUT_TYPES = {"text", "email", "password", "search", "tel", "url", "number", "date", "time",
+                    "datetime-local", "month", "week", "color"}
+
+# Parsed documents by (path, mtime); documents are never mutated, form state lives on the driver
+_document_cache = {}
+
+
+class DomNode:
+    """Element of the parsed document; text children are plain strings"""
+
+    def __init__(self, tag, attrs, parent=None):
+        self.tag = tag
+        self.attrs = attrs
+        self.parent = parent
+        self.children = []
+
+    @property
+    def element_children(self):
+        return [child for child in self.children if isinstance(child, DomNode)]
+
+    def iter_descendants(self):
+        for child in self.children:
+            if isinstance(child, DomNode):
+                yield child
+                yield from child.iter_descendants()
+
+    def ancestors(self):
+        node = self.parent
+        while node is not None:
+            yield node
+            node = node.parent
+
+    def text_content(self):
+        parts = []
+        for child in self.children:
+            if isinstance(child, DomNode):
+                if child.tag not in RAW_TEXT_ELEMENTS:
+                    parts.append(child.text_content())
+            else:
+                parts.append(child)
+        return "".join(parts)
+
+    @property
+    def classes(self):
+        return self.attrs.get("class", "").split()
+
+    def __repr__(self):
+        return f"<{self.tag}{' id=' + self.attrs['id'] if 'id' in self.attrs else ''}>"
+
+
+class DomBuilder(HTMLParser):
+    """Builds a DomNode tree, tolerating unclosed and stray end tags"""
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.root = DomNode("#document", {})
+        self._stack = [self.root]
+
+    def handle_starttag(self, tag, attrs):
+        closes = IMPLICIT_END.get(tag)
+        if closes and self._stack[-1].tag in closes:
+            self._stack.pop()
+        node = DomNode(tag, {name: value if value is not None else "" for name, value in attrs}, self._stack[-1])
+        self._stack[-1].children.append(node)
+        if tag not in VOID_ELEMENTS:
+            self._stack.append(node)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in VOID_ELEMENTS:
+            self._stack.pop()
+
+    def handle_endtag(self, tag):
+        for index in range(len(self._stack) - 1, 0, -1):
+            if self._stack[index].tag == tag:
+                del self._stack[index:]
+                return
+
+    def handle_data(self, data):
+        self._stack[-1].children.append(data)
+
+
+class DomDocument:
+    """Parsed page with an id index"""
+
+    def __init__(self, source):
+        builder = DomBuilder()
+        builder.feed(source)
+        builder.close()
+        self.source = source
+        self.root = builder.root
+        self.ids = {}
+        for node in self.root.iter_descendants():
+            if "id" in node.attrs:
+                self.ids.setdefault(node.attrs["id"], node)
+        title = next((node for node in self.root.iter_descendants() if node.tag == "title"), None)
+        self.title = " ".join(title.text_content().split()) if title else ""
+
+
+def load_document(url):
+    """Parsed document for a file:// URL (cached per file version); other URLs load an empty page"""
+    parsed = urlparse(url)
+    if parsed.scheme != "file":
+        return DomDocument("")
+    path = url2pathname(unquote(parsed.path))
+    try:
+        key = (path, os.path.getmtime(path))
+    except OSError:
+        return DomDocument("")
+    if key not in _document_cache:
+        with open(path, encoding="utf-8") as source:
+            _document_cache[key] = DomDocument(source.read())
+    return _document_cache[key]
+
+
+# --- CSS selector subset ---------------------------------------------------------------
+
+SELECTOR_TOKEN = re.compile(r"""
+    (?P<comma>\s*,\s*)
+  | (?P<combinator>\s*[>+~]\s*)
+  | (?P<space>\s+)
+  | \#(?P<id>[\w-]+)
+  | \.(?P<cls>[\w-]+)
+  | \[\s*(?P<attr>[\w:-]+)\s*(?:(?P<op>[~|^$*]?=)\s*(?:"(?P<dq>[^"]*)"|'(?P<sq>[^']*)'|(?P<bare>[^\]\s]+)))?\s*\]
+  | :(?P<pseudo>[\w-]+)
+  | (?P<tag>\*|[\w-]+)
+""", re.X)
+
+SUPPORTED_PSEUDOS = {"first-child", "last-child", "checked", "disabled", "enabled"}
+
+
+class Compound:
+    """One compound selector: tag, #id, .classes, [attributes], :pseudo-classes"""
+
+    def __init__(self):
+        self.tag = None
+        self.ids = []
+        self.classes = []
+        self.attributes = []
+        self.pseudos = []
+
+    def is_empty(self):
+        return not (self.tag or self.ids or self.classes or self.attributes or self.pseudos)
+
+
+def parse_selector(selector):
+    """[[(combinator, Compound), ...] per comma group]; the first combinator is None"""
+    groups, chain, compound, combinator = [], [], Compound(), None
+    position = 0
+    while position < len(selector):
+        match = SELECTOR_TOKEN.match(selector, position)
+        if match is None:
+            raise InvalidSelectorException(f"DOM mock cannot parse selector {selector!r} at {selector[position:]!r}")
+        position = match.end()
+        kind = match.lastgroup if match.lastgroup not in ("dq", "sq", "bare", "op") else "attr"
+        if kind in ("comma", "combinator", "space"):
+            if not compound.is_empty():
+                chain.append((combinator, compound))
+                compound = Compound()
+                combinator = " "
+            if kind == "comma":
+                groups.append(chain)
+                chain, combinator = [], None
+            elif kind == "combinator":
+                combinator = match.group("combinator").strip()
+        elif kind == "id":
+            compound.ids.append(match.group("id"))
+        elif kind == "cls":
+            compound.classes.append(match.group("cls"))
+        elif kind == "attr":
+            value = next((v for v in (match.group("dq"), match.group("sq"), match.group("bare")) if v is not None), None)
+            compound.attributes.append((match.group("attr").lower(), match.group("op"), value))
+        elif kind == "pseudo":
+            if match.group("pseudo") not in SUPPORTED_PSEUDOS:
+                raise InvalidSelectorException(f"DOM mock does not support ':{match.group('pseudo')}' in {selector!r}")
+            compound.pseudos.append(match.group("pseudo"))
+        else:
+            compound.tag = match.group("tag").lower()
+    if not compound.is_empty():
+        chain.append((combinator, compound))
+    if chain:
+        groups.append(chain)
+    if not groups or any(not group for group in groups):
+        raise InvalidSelectorException(f"DOM mock cannot parse selector {selector!r}")
+    return groups
+
+
+def _attribute_matches(node, name, op, value):
+    if name not in node.attrs:
+        return False
+    actual = node.attrs[name]
+    if op is None:
+        return True
+    if op == "=":
+        return actual == value
+    if op == "~=":
+        return value in actual.split()
+    if op == "|=":
+        return actual == value or actual.startswith(value + "-")
+    if op == "^=":
+        return bool(value) and actual.startswith(value)
+    if op == "$=":
+        return bool(value) and actual.endswith(value)
+    return bool(value) and value in actual
+
+
+def _compound_matches(node, compound, state):
+    if compound.tag not in (None, "*") and node.tag != compound.tag:
+        return False
+    if any(node.attrs.get("id") != element_id for element_id in compound.ids):
+        return False
+    if compound.classes and not set(compound.classes) <= set(node.classes):
+        return False
+    if not all(_attribute_matches(node, *attribute) for attribute in compound.attributes):
+        return False
+    for pseudo in compound.pseudos:
+        siblings = node.parent.element_children if node.parent else [node]
+        if pseudo == "first-child" and siblings[0] is not node:
+            return False
+        if pseudo == "last-child" and siblings[-1] is not node:
+            return False
+        if pseudo == "checked" and not state.is_selected(node):
+            return False
+        if pseudo == "disabled" and "disabled" not in node.attrs:
+            return False
+        if pseudo == "enabled" and "disabled" in node.attrs:
+            return False
+    return True
+
+
+def _chain_matches(node, chain, index, state):
+    combinator, compound = chain[index]
+    if not _compound_matches(node, compound, state):
+        return False
+    if index == 0:
+        return True
+    if combinator == ">":
+        return node.parent is not None and _chain_matches(node.parent, chain, index - 1, state)
+    if combinator in ("+", "~"):
+        siblings = node.parent.element_children if node.parent else []
+        before = siblings[:siblings.index(node)] if node in siblings else []
+        candidates = before[-1:] if combinator == "+" else reversed(before)
+        return any(_chain_matches(sibling, chain, index - 1, state) for sibling in candidates)
+    return any(_chain_matches(ancestor, chain, index - 1, state) for ancestor in node.ancestors())
+
+
+def select_nodes(scope, selector, state):
+    """Descendants of scope matching a CSS selector, in document order"""
+    groups = parse_selector(selector)
+    return [node for node in scope.iter_descendants()
+            if any(_chain_matches(node, chain, len(chain) - 1, state) for chain in groups)]
+
+
+def find_nodes(document, scope, using, value, state):
+    """Resolve a Selenium locator strategy against the DOM"""
+    if using == By.ID:
+        if scope is document.root:
+            node = document.ids.get(value)
+            return [node] if node is not None else []
+        return [node for node in scope.iter_descendants() if node.attrs.get("id") == value]
+    if using == By.CSS_SELECTOR:
+        return select_nodes(scope, value, state)
+    if using == By.NAME:
+        return [node for node in scope.iter_descendants() if node.attrs.get("name") == value]
+    if using == By.CLASS_NAME:
+        return [node for node in scope.iter_descendants() if value in node.classes]
+    if using == By.TAG_NAME:
+        return [node for node in scope.iter_descendants() if node.tag == value.lower()]
+    if using in (By.LINK_TEXT, By.PARTIAL_LINK_TEXT):
+        links = [node for node in scope.iter_descendants() if node.tag == "a"]
+        if using == By.LINK_TEXT:
+            return [node for node in links if normalize_text(node.text_content()) == value]
+        return [node for node in links if value in normalize_text(node.text_content())]
+    raise InvalidSelectorException(f"DOM mock does not support locator strategy {using!r} ({value})")
+
+
+def normalize_text(text):
+    return " ".join(text.split())
+
+
+def strip_special_keys(text):
+    """Drop WebDriver special keys (Keys.ENTER etc. live in the private-use area)"""
+    return "".join(character for character in text if not "\ue000" <= character <= "\uf8ff")
+
+
+# --- Form state --------------------------------------------------------------------------
+
+class FormState:
+    """Values, checked and selected state of one loaded page, initialised from the markup on first use"""
+
+    def __init__(self):
+        self._values = {}
+        self._checked = {}
+        self._selections = {}
+
+    def value(self, node):
+        if node.tag == "select":
+            selected = self.selected_options(node)
+            return option_value(selected[0]) if selected else ""
+        if node not in self._values:
+            self._values[node] = node.text_content() if node.tag == "textarea" else node.attrs.get("value", "")
+        return self._values[node]
+
+    def set_value(self, node, value):
+        self._values[node] = value
+
+    def is_checked(self, node):
+        return self._checked.get(node, "checked" in node.attrs)
+
+    def set_checked(self, node, checked):
+        self._checked[node] = checked
+
+    def selected_options(self, select):
+        if select not in self._selections:
+            options = select_options(select)
+            selected = [option for option in options if "selected" in option.attrs]
+            if not selected and options and "multiple" not in select.attrs:
+                selected = options[:1]
+            self._selections[select] = selected if "multiple" in select.attrs else selected[-1:]
+        return self._selections[select]
+
+    def select_option(self, select, option, selected=True):
+        current = self.selected_options(select)
+        if "multiple" not in select.attrs:
+            self._selections[select] = [option]
+        elif selected and option not in current:
+            current.append(option)
+        elif not selected and option in current:
+            current.remove(option)
+
+    def is_selected(self, node):
+        if node.tag == "option":
+            select = owning_select(node)
+            return select is not None and node in self.selected_options(select)
+        return self.is_checked(node)
+
+
+def select_options(select):
+    return [node for node in select.iter_descendants() if node.tag == "option"]
+
+
+def option_value(option):
+    return option.attrs.get("value", normalize_text(option.text_content()))
+
+
+def owning_select(option):
+    return next((ancestor for ancestor in option.ancestors() if ancestor.tag == "select"), None)
+
+
+def is_hidden(node):
+    """Hidden by the markup itself; display state toggled by page scripts is not modelled"""
+    if node.tag == "input" and node.attrs.get("type", "").lower() == "hidden":
+        return True
+    return any("hidden" in element.attrs or element.tag in ("head", "template")
+               for element in [node, *node.ancestors()])
+
+
+# --- WebDriver --------------------------------------------------------------------------
+
+class DomWebElement(MockWebElement):
+    """WebElement backed by a DomNode of the driver's current document"""
+
+    def __init__(self, node, parent):
+        self._node = node
+        self._parent = parent
+
+    @property
+    def _state(self):
+        return self._parent._form_state
+
+    @property
+    def tag_name(self):
+        return self._node.tag
+
+    @property
+    def text(self):
+        if is_hidden(self._node):
+            return ""
+        return normalize_text(self._node.text_content())
+
+    @property
+    def value(self):
+        return self._state.value(self._node)
+
+    @property
+    def locator(self):
+        return repr(self._node)
+
+    def _input_type(self):
+        return self._node.attrs.get("type", "text").lower() if self._node.tag == "input" else None
+
+    def _is_text_field(self):
+        return self._node.tag == "textarea" or self._input_type() in TEXT_INPUT_TYPES
+
+    def _click(self):
+        node = self._node
+        if "disabled" in node.attrs:
+            return
+        if node.tag == "label" and node.attrs.get("for") in self._parent._document.ids:
+            node = self._parent._document.ids[node.attrs["for"]]
+        input_type = node.attrs.get("type", "").lower() if node.tag == "input" else None
+        if input_type == "checkbox":
+            self._state.set_checked(node, not self._state.is_checked(node))
+        elif input_type == "radio":
+            name = node.attrs.get("name")
+            if name:
+                for other in self._parent._document.root.iter_descendants():
+                    if other.tag == "input" and other.attrs.get("type") == "radio" and other.attrs.get("name") == name:
+                        self._state.set_checked(other, False)
+            self._state.set_checked(node, True)
+        elif node.tag == "option":
+            select = owning_select(node)
+            if select is not None:
+                selected = "multiple" not in select.attrs or not self._state.is_selected(node)
+                self._state.select_option(select, node, selected)
+
+    def _send_keys(self, text):
+        if not self._is_text_field() or "disabled" in self._node.attrs or "readonly" in self._node.attrs:
+            raise ElementNotInteractableException(f"element not interactable: {self._node!r}")
+        value = self._state.value(self._node) + strip_special_keys(text)
+        max_length = self._node.attrs.get("maxlength", "")
+        if max_length.isdigit():
+            value = value[:int(max_length)]
+        self._state.set_value(self._node, value)
+
+    def _clear(self):
+        if not self._is_text_field():
+            raise ElementNotInteractableException(f"element not editable: {self._node!r}")
+        self._state.set_value(self._node, "")
+
+    def submit(self):
+        return self
+
+    def get_attribute(self, name):
+        node = self._node
+        if name == "value" and (node.tag in ("input", "textarea", "select", "option")):
+            return option_value(node) if node.tag == "option" else self._state.value(node)
+        if name in ("checked", "selected"):
+            return "true" if self._state.is_selected(node) else None
+        if name in ("innerText", "textContent"):
+            return self.text if name == "innerText" else node.text_content()
+        if name in ("disabled", "readonly", "required", "multiple", "hidden"):
+            return "true" if name in node.attrs else None
+        if name == "className":
+            name = "class"
+        return node.attrs.get(name)
+
+    def get_dom_attribute(self, name):
+        return self._node.attrs.get(name)
+
+    def get_property(self, name):
+        if name in ("checked", "selected"):
+            return self._state.is_selected(self._node)
+        return self.get_attribute(name)
+
+    def set_attribute(self, name, value):
+        self._node.attrs[name] = value
+        return self
+
+    def is_displayed(self):
+        return not is_hidden(self._node)
+
+    def is_enabled(self):
+        return "disabled" not in self._node.attrs
+
+    def is_selected(self):
+        return self._state.is_selected(self._node)
+
+    def _find_elements(self, using, value):
+        nodes = find_nodes(self._parent._document, self._node, using, value, self._state)
+        if not nodes:
+            simulate_wait(self._parent.implicit_wait)
+        return self._parent._elements_for(nodes)
+
+    def _find_element(self, using, value):
+        found = self._find_elements(using, value)
+        if not found:
+            raise NoSuchElementException(f"no such element: Unable to locate element: {using}={value} in {self._node!r}")
+        return found[0]
+
+    def __eq__(self, other):
+        return isinstance(other, DomWebElement) and other._node is self._node
+
+    def __hash__(self):
+        return id(self._node)
+
+    def __repr__(self):
+        return f"DomWebElement({self._node!r})"
+
+
+class DomSelect:
+    """Select helper for DOM-backed <select> elements; choosing an option clicks it"""
+
+    def __init__(self, element):
+        if element.tag_name != "select":
+            raise ValueError(f"Select only works on <select> elements, not on <{element.tag_name}>")
+        self._element = element
+        self.is_multiple = "multiple" in element._node.attrs
+
+    @property
+    def options(self):
+        return self._element.find_elements(By.TAG_NAME, "option")
+
+    @property
+    def all_selected_options(self):
+        return [option for option in self.options if option.is_selected()]
+
+    @property
+    def first_selected_option(self):
+        for option in self.options:
+            if option.is_selected():
+                return option
+        raise NoSuchElementException("No options are selected")
+
+    def _choose(self, options, description):
+        if not options:
+            raise NoSuchElementException(f"Cannot locate option with {description}")
+        for option in options if self.is_multiple else options[:1]:
+            if not option.is_selected():
+                option.click()
+
+    def select_by_visible_text(self, text):
+        self._choose([option for option in self.options if option.text == normalize_text(text)],
+                     f"visible text: {text}")
+
+    def select_by_value(self, value):
+        self._choose([option for option in self.options if option.get_attribute("value") == value],
+                     f"value: {value}")
+
+    def select_by_index(self, index):
+        options = self.options
+        self._choose(options[index:index + 1] if 0 <= index < len(options) else [], f"index: {index}")
+
+
+class DomMockWebDriver(MockWebDriver):
+    """Mock WebDriver that loads the prototype HTML into an in-memory DOM"""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._document = DomDocument("")
+        self._form_state = FormState()
+        self._element_cache = {}
+
+    def _get(self, url):
+        self._document = load_document(url)
+        self._form_state = FormState()
+        self._element_cache = {}
+        self.current_url = url
+        self.title = self._document.title
+        self._page_source = self._document.source
+        log.debug("Loaded DOM for: %s", url)
+
+    @property
+    def page_source(self):
+        return self._page_source
+
+    def _elements_for(self, nodes):
+        elements = []
+        for node in nodes:
+            if node not in self._element_cache:
+                self._element_cache[node] = DomWebElement(node, self)
+            elements.append(self._element_cache[node])
+        return elements
+
+    def _find_elements(self, using, value):
+        nodes = find_nodes(self._document, self._document.root, using, value, self._form_state)
+        log.debug("Found %d elements: %s=%s", len(nodes), using, value)
+        if not nodes:
+            # A browser would block for the implicit wait before giving up
+            simulate_wait(self.implicit_wait)
+        return self._elements_for(nodes)
+
+    def _find_element(self, using, value):
+        found = self._find_elements(using, value)
+        if not found:
+            raise NoSuchElementException(f"no such element: Unable to locate element: {using}={value}")
+        return found[0]
+
+    def _execute_script(self, script, args):
+        return None
+
+    def _execute_async_script(self, script, args):
+        return None
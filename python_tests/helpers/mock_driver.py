@@ -4,14 +4,30 @@ Allows E2E tests to run without a real browser
 """
 from unittest.mock import Mock, MagicMock, patch
 from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.support.ui import Select
+from selenium.common.exceptions import NoAlertPresentException
 import os
 
+from config import TestConfig
+from helpers.event_log import get_logger
+
+log = get_logger("mock")
+
+# Driver mode recorded with each run (results store, perf baseline) per MOCK_DRIVER
+DRIVER_MODES = {"placeholder": "mock", "dom": "dom", "replay": "replay"}
+
+_mocks_applied = False
+
+# Select as shipped by Selenium (apply_mocks patches the class), for the real elements of the replay driver
+RealSelect = type("RealSelect", (), {k: v for k, v in vars(Select).items() if k not in ("__dict__", "__weakref__")})
+
 
 class MockWebElement:
     """Mock Selenium WebElement"""
     
-    def __init__(self, tag_name="div", text="Mock Element", locator=None):
+    def __init__(self, tag_name="div", text="Mock Element", locator=None, parent=None):
         self.tag_name = tag_name
         self.text = text
         self.locator = locator
@@ -19,24 +35,39 @@ class MockWebElement:
         self._enabled = True
         self.value = ""
         self._attributes = {}
+        self._parent = parent
+    
+    def _execute(self, command, handler, params=None):
+        """Route an element command through the owning driver's execute() when there is one"""
+        if self._parent is None:
+            return handler(**(params or {}))
+        return self._parent.execute(command, {"element": self, "handler": handler, **(params or {})})["value"]
     
     def click(self):
-        print(f"  [MOCK] Clicked element: {self.text}")
+        self._execute(Command.CLICK_ELEMENT, self._click)
         return self
     
+    def _click(self):
+        log.debug("Clicked element: %s", self.text)
+    
     def send_keys(self, *keys):
-        text = "".join(str(k) for k in keys)
-        self.value = text
-        print(f"  [MOCK] Sent keys to element: {text}")
+        self._execute(Command.SEND_KEYS_TO_ELEMENT, self._send_keys, {"text": "".join(str(k) for k in keys)})
         return self
     
+    def _send_keys(self, text):
+        self.value = text
+        log.debug("Sent keys to element: %s", text)
+    
     def clear(self):
-        self.value = ""
-        print(f"  [MOCK] Cleared element")
+        self._execute(Command.CLEAR_ELEMENT, self._clear)
         return self
     
+    def _clear(self):
+        self.value = ""
+        log.debug("Cleared element")
+    
     def submit(self):
-        print(f"  [MOCK] Submitted form")
+        log.debug("Submitted form")
         return self
     
     def get_attribute(self, name):
@@ -64,17 +95,23 @@ class MockWebElement:
 
     def find_elements(self, by=By.ID, value=None):
         """Find elements within this element (returns mock child elements)"""
-        print(f"    [MOCK] Found child elements: {by}={value} (returning 3 mock elements)")
+        return self._execute(Command.FIND_CHILD_ELEMENTS, self._find_elements, {"using": by, "value": value})
+
+    def _find_elements(self, using, value):
+        log.debug("Found child elements: %s=%s (returning 3 mock elements)", using, value)
         return [
-            MockWebElement("td", f"Cell 1"),
-            MockWebElement("td", f"Cell 2"),
-            MockWebElement("td", f"Cell 3"),
+            MockWebElement("td", f"Cell 1", parent=self._parent),
+            MockWebElement("td", f"Cell 2", parent=self._parent),
+            MockWebElement("td", f"Cell 3", parent=self._parent),
         ]
 
     def find_element(self, by=By.ID, value=None):
         """Find single element within this element"""
-        print(f"    [MOCK] Found child element: {by}={value}")
-        return MockWebElement(locator=f"{by}:{value}")
+        return self._execute(Command.FIND_CHILD_ELEMENT, self._find_element, {"using": by, "value": value})
+
+    def _find_element(self, using, value):
+        log.debug("Found child element: %s=%s", using, value)
+        return MockWebElement(locator=f"{using}:{value}", parent=self._parent)
 class MockSelect:
     """Mock Selenium Select"""
     
@@ -87,15 +124,15 @@ class MockSelect:
         ]
     
     def select_by_value(self, value):
-        print(f"  [MOCK] Selected option by value: {value}")
+        log.debug("Selected option by value: %s", value)
         return self
     
     def select_by_visible_text(self, text):
-        print(f"  [MOCK] Selected option by text: {text}")
+        log.debug("Selected option by text: %s", text)
         return self
     
     def select_by_index(self, index):
-        print(f"  [MOCK] Selected option by index: {index}")
+        log.debug("Selected option by index: %s", index)
         return self
     
     @property
@@ -107,11 +144,26 @@ class MockSelect:
         return self.options[0] if self.options else None
 
 
+class MockSwitchTo:
+    """Mock Selenium SwitchTo"""
+    
+    def __init__(self, driver):
+        self._driver = driver
+    
+    def window(self, handle):
+        self._driver.current_window_handle = handle
+        log.debug("Switched to window: %s", handle)
+    
+    @property
+    def alert(self):
+        raise NoAlertPresentException("[MOCK] No alert present")
+
+
 class MockWebDriver:
     """Mock Selenium WebDriver for headless testing"""
     
     def __init__(self, *args, **kwargs):
-        print("[MOCK] Initializing WebDriver (headless mock)")
+        log.debug("Initializing WebDriver (headless mock)")
         self.current_url = "about:blank"
         self.title = "Mock Browser"
         self.window_handles = ["mock_handle_1"]
@@ -121,68 +173,129 @@ class MockWebDriver:
         self._page_source = "<html><body>Mock Page</body></html>"
         self.page_load_timeout = 30
         self.implicit_wait = 10
+        self.switch_to = MockSwitchTo(self)
+    
+    def execute(self, driver_command, params=None):
+        """
+        Run a command like RemoteWebDriver.execute() and return {"value": result}.
+        Every mock command goes through here so driver wrappers (instrumentation,
+        stall detection) see the same command stream as with a real browser.
+        """
+        params = dict(params or {})
+        handler = params.pop("handler")
+        params.pop("element", None)
+        return {"value": handler(**params)}
+    
+    def _command(self, driver_command, handler, **params):
+        return self.execute(driver_command, {"handler": handler, **params})["value"]
     
     def get(self, url):
         """Navigate to URL"""
-        self.current_url = url
-        print(f"[MOCK] Navigated to: {url}")
+        self._command(Command.GET, self._get, url=url)
         return self
     
+    def _get(self, url):
+        self.current_url = url
+        log.debug("Navigated to: %s", url)
+    
     def find_element(self, by=By.ID, value=None):
         """Find single element"""
-        key = f"{by}:{value}"
+        return self._command(Command.FIND_ELEMENT, self._find_element, using=by, value=value)
+    
+    def _find_element(self, using, value):
+        key = f"{using}:{value}"
         if key not in self._elements:
-            self._elements[key] = MockWebElement(locator=key)
+            self._elements[key] = MockWebElement(locator=key, parent=self)
         element = self._elements[key]
-        print(f"  [MOCK] Found element: {by}={value}")
+        log.debug("Found element: %s=%s", using, value)
         return element
     
     def find_elements(self, by=By.ID, value=None):
         """Find multiple elements"""
-        print(f"  [MOCK] Found elements: {by}={value} (returning 3 mock elements)")
+        return self._command(Command.FIND_ELEMENTS, self._find_elements, using=by, value=value)
+    
+    def _find_elements(self, using, value):
+        log.debug("Found elements: %s=%s (returning 3 mock elements)", using, value)
         return [
-            MockWebElement("div", f"Element 1"),
-            MockWebElement("div", f"Element 2"),
-            MockWebElement("div", f"Element 3"),
+            MockWebElement("div", f"Element 1", parent=self),
+            MockWebElement("div", f"Element 2", parent=self),
+            MockWebElement("div", f"Element 3", parent=self),
         ]
     
     def execute_script(self, script, *args):
         """Execute JavaScript"""
-        print(f"  [MOCK] Executed script: {script[:50]}...")
+        return self._command(Command.W3C_EXECUTE_SCRIPT, self._execute_script, script=script, args=list(args))
+    
+    def _execute_script(self, script, args):
+        log.debug("Executed script: %.50s...", script)
         return None
     
     def execute_async_script(self, script, *args):
         """Execute async JavaScript"""
-        print(f"  [MOCK] Executed async script: {script[:50]}...")
+        return self._command(Command.W3C_EXECUTE_SCRIPT_ASYNC, self._execute_async_script, script=script, args=list(args))
+    
+    def _execute_async_script(self, script, args):
+        log.debug("Executed async script: %.50s...", script)
         return None
     
     def implicitly_wait(self, time_to_wait):
         """Set implicit wait"""
-        self.implicit_wait = time_to_wait
-        print(f"[MOCK] Set implicit wait: {time_to_wait}s")
+        self._command(Command.SET_TIMEOUTS, self._implicitly_wait, implicit=time_to_wait)
         return self
     
+    def _implicitly_wait(self, implicit):
+        self.implicit_wait = implicit
+        log.debug("Set implicit wait: %ss", implicit)
+    
     def set_page_load_timeout(self, time_to_wait):
         """Set page load timeout"""
-        self.page_load_timeout = time_to_wait
-        print(f"[MOCK] Set page load timeout: {time_to_wait}s")
+        self._command(Command.SET_TIMEOUTS, self._set_page_load_timeout, pageLoad=time_to_wait)
         return self
     
+    def _set_page_load_timeout(self, pageLoad):
+        self.page_load_timeout = pageLoad
+        log.debug("Set page load timeout: %ss", pageLoad)
+    
     def maximize_window(self):
         """Maximize window"""
-        print("[MOCK] Maximized window")
+        self._command(Command.W3C_MAXIMIZE_WINDOW, self._maximize_window)
         return self
     
+    def _maximize_window(self):
+        log.debug("Maximized window")
+    
     def save_screenshot(self, filename):
         """Save screenshot"""
-        print(f"[MOCK] Screenshot saved to: {filename}")
+        return self._command(Command.SCREENSHOT, self._save_screenshot, filename=filename)
+    
+    def _save_screenshot(self, filename):
+        log.debug("Screenshot saved to: %s", filename)
         return True
     
+    def delete_all_cookies(self):
+        """Delete all cookies"""
+        self._command(Command.DELETE_ALL_COOKIES, self._delete_all_cookies)
+    
+    def _delete_all_cookies(self):
+        log.debug("Deleted all cookies")
+    
+    def close(self):
+        """Close current window"""
+        self._command(Command.CLOSE, self._close)
+    
+    def _close(self):
+        if self.current_window_handle in self.window_handles and len(self.window_handles) > 1:
+            self.window_handles.remove(self.current_window_handle)
+        log.debug("Window closed")
+    
     def quit(self):
         """Quit driver"""
-        print("[MOCK] WebDriver quit")
+        self._command(Command.QUIT, self._quit)
         return self
     
+    def _quit(self):
+        log.debug("WebDriver quit")
+    
     @property
     def name(self):
         return "mock"
@@ -198,7 +311,7 @@ class MockEdgeChromiumDriverManager:
     """Mock EdgeChromiumDriverManager"""
     
     def install(self):
-        print("[MOCK] EdgeChromiumDriverManager.install() - returning mock path")
+        log.debug("EdgeChromiumDriverManager.install() - returning mock path")
         return "/mock/path/to/edge_driver"
 
 
@@ -206,7 +319,7 @@ class MockChromeDriverManager:
     """Mock ChromeDriverManager"""
     
     def install(self):
-        print("[MOCK] ChromeDriverManager.install() - returning mock path")
+        log.debug("ChromeDriverManager.install() - returning mock path")
         return "/mock/path/to/chrome_driver"
 
 
@@ -215,7 +328,7 @@ class MockService:
     
     def __init__(self, executable_path):
         self.executable_path = executable_path
-        print(f"[MOCK] Service initialized with: {executable_path}")
+        log.debug("Service initialized with: %s", executable_path)
 
 
 def is_headless_environment():
@@ -243,14 +356,44 @@ def is_headless_environment():
     return False
 
 
+def create_mock_driver(*args, **kwargs):
+    """webdriver.Edge/Chrome replacement; MOCK_DRIVER = "dom" selects the DOM-backed mock, "replay" the cassette player"""
+    if TestConfig.MOCK_DRIVER == "replay":
+        from helpers.cassette import ReplayWebDriver
+        return ReplayWebDriver(*args, **kwargs)
+    if TestConfig.MOCK_DRIVER == "dom":
+        from helpers.mock_dom import DomMockWebDriver
+        return DomMockWebDriver(*args, **kwargs)
+    return MockWebDriver(*args, **kwargs)
+
+
+def mock_select(element):
+    """Select implementation for a mock element: real option handling for DOM-backed and replayed elements"""
+    from helpers.mock_dom import DomSelect, DomWebElement
+    if isinstance(element, DomWebElement):
+        return DomSelect(element)
+    if isinstance(element, WebElement):
+        return RealSelect(element)
+    return MockSelect(element)
+
+
+def driver_mode():
+    """What answers WebDriver commands in this process: real, mock, dom or replay"""
+    if not _mocks_applied:
+        return "real"
+    return DRIVER_MODES.get(TestConfig.MOCK_DRIVER, "mock")
+
+
 def apply_mocks():
     """Apply mock patches for webdriver and webdriver_manager"""
+    global _mocks_applied
+    _mocks_applied = True
     print("\n[MOCK] Applying webdriver mocks for headless environment...\n")
     
     # Patch Selenium webdriver
     import selenium.webdriver as webdriver
-    webdriver.Edge = MockWebDriver
-    webdriver.Chrome = MockWebDriver
+    webdriver.Edge = create_mock_driver
+    webdriver.Chrome = create_mock_driver
     
     # Patch webdriver Service
     from selenium.webdriver.edge.service import Service as EdgeService
@@ -266,9 +409,12 @@ def apply_mocks():
     
     # Patch Select
     from selenium.webdriver.support.ui import Select
-    Select.__init__ = lambda self, element: setattr(self, 'element', element)
-    Select.select_by_value = MockSelect(None).select_by_value
-    Select.select_by_visible_text = MockSelect(None).select_by_visible_text
-    Select.select_by_index = MockSelect(None).select_by_index
+    Select.__init__ = lambda self, element: setattr(self, 'element', mock_select(element))
+    Select.select_by_value = lambda self, value: self.element.select_by_value(value)
+    Select.select_by_visible_text = lambda self, text: self.element.select_by_visible_text(text)
+    Select.select_by_index = lambda self, index: self.element.select_by_index(index)
+    Select.options = property(lambda self: self.element.options)
+    Select.all_selected_options = property(lambda self: self.element.all_selected_options)
+    Select.first_selected_option = property(lambda self: self.element.first_selected_option)
     
     print("[MOCK] Webdriver mocks applied successfully\n")
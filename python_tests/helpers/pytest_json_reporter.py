@@ -1,99 +1,165 @@
 """
 Custom Pytest Plugin for JSON Performance Reporting
-Generates JSON output compatible with Playwright performance comparison
+Generates JSON output compatible with Playwright performance comparison.
+Under pytest-xdist each worker attaches its per-test data to the reports it sends
+to the controller, which writes the single merged report. Results are streamed to
+test_results/pytest-results.jsonl as tests finish; the JSON summary is built from it.
 """
-import json
-import time
+import sqlite3
+from datetime import datetime
 from pathlib import Path
 import pytest
 
+from config import TestConfig
+from helpers import run_metrics
+from helpers.event_log import get_logger
+from helpers.mock_driver import driver_mode
+from helpers.results_store import ResultsStore
+from helpers.results_stream import ResultsStream, finalize, iter_tests
+from helpers.workers import is_xdist_worker, worker_id
+
+log = get_logger("reporter")
+
 class PerformanceReporter:
     """Custom reporter to capture test execution times"""
     
     def __init__(self):
-        self.test_results = []
-        self.suite_start_time = None
-        self.suite_end_time = None
-        self.total_tests = 0
-        self.passed_tests = 0
-        self.failed_tests = 0
-        self.skipped_tests = 0
+        self.stream_path = Path(TestConfig.JSON_REPORT_PATH).with_suffix('.jsonl')
+        self.stream = None
+        self.in_progress = {}  # nodeid -> phases seen so far (only tests currently running)
     
     @pytest.hookimpl(tryfirst=True)
     def pytest_sessionstart(self, session):
         """Called before test session starts"""
-        self.suite_start_time = time.time() * 1000  # Convert to milliseconds
+        if not is_xdist_worker():
+            self.stream = ResultsStream(self.stream_path)
+            self.stream.write('sessionStart', timestamp=datetime.now().isoformat(),
+                              browser=TestConfig.BROWSER.lower(), driverMode=driver_mode())
         print("\n🐍 Starting Pytest test suite execution...")
     
     @pytest.hookimpl(hookwrapper=True)
     def pytest_runtest_makereport(self, item, call):
-        """Capture test results"""
+        """Attach the test's metadata and metrics to its report (serialized to the xdist controller)"""
         outcome = yield
         report = outcome.get_result()
-        
+        report.perf_worker = worker_id()
         if report.when == 'call':
-            self.total_tests += 1
-            
-            test_result = {
+            report.perf_test = {
                 'title': item.name,
-                'fullTitle': item.nodeid,
                 'file': str(Path(item.fspath).relative_to(Path.cwd())),
+                'metrics': run_metrics.snapshot()
+            }
+        elif report.when == 'teardown':
+            metrics = run_metrics.snapshot()
+            report.perf_fixtures = {
+                'setup': metrics.get('fixtureSetupMs', {}),
+                'teardown': metrics.get('fixtureTeardownMs', {})
+            }
+    
+    def pytest_runtest_logreport(self, report):
+        """Stream each test once its teardown is done (single process, or on the xdist controller)"""
+        if is_xdist_worker():
+            return
+        phases = self.in_progress.setdefault(report.nodeid, {
+            'worker': getattr(report, 'perf_worker', worker_id()), 'busyMs': 0.0, 'start': None, 'stop': None,
+            'phases': {}
+        })
+        phases['busyMs'] += report.duration * 1000
+        phases['phases'][report.when] = report.duration * 1000
+        if getattr(report, 'start', None) is not None:
+            phases['start'] = phases['start'] or report.start
+            phases['stop'] = report.stop
+        
+        perf_test = getattr(report, 'perf_test', None)
+        if report.when == 'call' and perf_test is not None:
+            phases['result'] = {
+                'title': perf_test['title'],
+                'fullTitle': report.nodeid,
+                'file': perf_test['file'],
                 'duration': report.duration * 1000,  # Convert to milliseconds
                 'status': report.outcome,
-                'error': str(report.longrepr) if report.failed else None
+                'error': str(report.longrepr) if report.failed else None,
+                'worker': phases['worker'],
+                'metrics': perf_test['metrics']
             }
-            
             if report.passed:
-                self.passed_tests += 1
-                print(f"✅ {item.name} ({test_result['duration']:.0f}ms)")
+                log.info("✅ %s (%.0fms)", perf_test['title'], phases['result']['duration'])
             elif report.failed:
-                self.failed_tests += 1
-                print(f"❌ {item.name} ({test_result['duration']:.0f}ms)")
+                log.warning("❌ %s (%.0fms)", perf_test['title'], phases['result']['duration'])
             elif report.skipped:
-                self.skipped_tests += 1
-                print(f"⏭️ {item.name} (skipped)")
-            
-            self.test_results.append(test_result)
+                log.info("⏭️ %s (skipped)", perf_test['title'])
+        
+        if report.when == 'teardown':
+            phases = self.in_progress.pop(report.nodeid)
+            phases['fixtures'] = getattr(report, 'perf_fixtures', {})
+            result = phases.pop('result', None)
+            if result is not None:
+                result['phases'] = phases['phases']
+                self.stream.write('test', result=result, **phases)
+            else:
+                self.stream.write('usage', **phases)
     
     @pytest.hookimpl(trylast=True)
     def pytest_sessionfinish(self, session, exitstatus):
         """Called after test session ends"""
-        self.suite_end_time = time.time() * 1000
-        total_duration = self.suite_end_time - self.suite_start_time
+        if is_xdist_worker():
+            return
+        self.stream.write('sessionEnd')
+        self.stream.close()
+        report_path = self.stream_path.with_suffix('.json')
+        summary = finalize(self.stream_path, report_path)
+        total_duration = summary['totalDuration']
         
         print('\n📊 Test Execution Summary:')
-        print(f'   Total: {self.total_tests}')
-        print(f'   Passed: {self.passed_tests} ✅')
-        print(f'   Failed: {self.failed_tests} ❌')
-        print(f'   Skipped: {self.skipped_tests} ⏭️')
+        print(f"   Total: {summary['totalTests']}")
+        print(f"   Passed: {summary['passed']} ✅")
+        print(f"   Failed: {summary['failed']} ❌")
+        print(f"   Skipped: {summary['skipped']} ⏭️")
         print(f'   Duration: {total_duration:.0f}ms ({total_duration / 1000:.2f}s)')
-        
-        # Save results to JSON
-        self.save_results(total_duration)
-    
-    def save_results(self, total_duration):
-        """Save test results to JSON file"""
-        from datetime import datetime
-        
-        report_data = {
-            'framework': 'Pytest',
-            'timestamp': datetime.now().isoformat(),
-            'totalDuration': total_duration,
-            'totalTests': self.total_tests,
-            'passed': self.passed_tests,
-            'failed': self.failed_tests,
-            'skipped': self.skipped_tests,
-            'tests': self.test_results
-        }
-        
-        # Save to test_results directory
-        report_path = Path.cwd() / 'test_results' / 'pytest-results.json'
-        report_path.parent.mkdir(parents=True, exist_ok=True)
-        
-        with open(report_path, 'w') as f:
-            json.dump(report_data, f, indent=2)
+        if summary['sleepRemovedMs']:
+            print(f"   Sleep removed by turbo mode: {summary['sleepRemovedMs'] / 1000:.2f}s")
+        if summary['simulatedWaitMs']:
+            print(f"   Waiting simulated by the mock clock: {summary['simulatedWaitMs'] / 1000:.2f}s")
+        if len(summary['workers']) > 1:
+            for worker, usage in summary['workers'].items():
+                print(f"   Worker {worker}: {usage['tests']} tests, busy {usage['busyMs'] / 1000:.2f}s "
+                      f"({(usage['utilisation'] or 0) * 100:.0f}%)")
+        commands_by_type = summary['commandsByType']
+        if commands_by_type:
+            command_count = sum(timing['count'] for timing in commands_by_type.values())
+            command_ms = sum(timing['ms'] for timing in commands_by_type.values())
+            print(f'   WebDriver commands: {command_count} ({command_ms / 1000:.2f}s)')
+            for command, timing in sorted(commands_by_type.items(), key=lambda c: c[1]['ms'], reverse=True)[:5]:
+                print(f"      {command}: {timing['count']} calls, {timing['ms']:.0f}ms")
+        phase_totals = summary['phases']
+        busy_ms = sum(phase_totals.values())
+        if busy_ms:
+            print('   Time by phase: ' + ', '.join(
+                f"{phase} {ms / 1000:.2f}s ({ms / busy_ms:.0%})" for phase, ms in phase_totals.items()))
+            fixtures = sorted(summary['fixtures'].items(), key=lambda f: f[1]['setupMs'] + f[1]['teardownMs'], reverse=True)
+            for name, cost in fixtures[:5]:
+                print(f"      {name}: setup {cost['setupMs'] / 1000:.2f}s, teardown {cost['teardownMs'] / 1000:.2f}s "
+                      f"({cost['share']:.0%} of test time)")
+        stalls = summary['implicitWaitStalls']
+        if stalls:
+            stalled_ms = sum(stall['ms'] for stall in stalls)
+            print(f'   Implicit-wait stalls: {len(stalls)} lookups, {stalled_ms / 1000:.2f}s')
+            for stall in sorted(stalls, key=lambda s: s['ms'], reverse=True)[:5]:
+                print(f"      {stall['ms']:.0f}ms {stall['locator']} ({stall['caller']})")
         
         print(f'\n💾 Results saved to: {report_path}')
+        self.save_to_store(summary)
+    
+    def save_to_store(self, summary):
+        """Append the run to the SQLite results history, streaming the tests from the JSONL file"""
+        if not TestConfig.RESULTS_STORE_ENABLED:
+            return
+        try:
+            with ResultsStore() as store:
+                run_id = store.record_run({**summary, 'tests': iter_tests(self.stream_path)})
+            print(f'🗄️  Run #{run_id} appended to: {store.path}')
+        except sqlite3.Error as e:
+            print(f'⚠️  Could not append run to results store: {e}')
 
 # Plugin instance
 _reporter = None
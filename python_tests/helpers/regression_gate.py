@@ -0,0 +1,308 @@
+"""
+Performance regression gate
+Compares per-test durations and WebDriver command counts against a stored
+baseline built from several runs, and fails when a test regresses beyond the
+threshold. A test only counts as slower when its median exceeds both the
+relative threshold and the baseline's own run-to-run noise (median + k * MAD).
+A baseline holds runs of one driver mode and browser (real Edge by default) and
+only gates runs of that same mode and browser.
+
+Usage:
+    # Build a baseline from the last 10 runs in the results store (or from JSON reports)
+    python python_tests/helpers/regression_gate.py baseline --runs 10 [--mode real] [--browser edge]
+    python python_tests/helpers/regression_gate.py baseline --reports run1.json run2.json run3.json
+    # Check one or more JSON reports against it (exit code 1 on regression)
+    python python_tests/helpers/regression_gate.py check --reports test_results/pytest-results.json
+    # Or gate a pytest session directly (against TestConfig.PERF_BASELINE_PATH, or --perf-baseline-path=PATH)
+    pytest --json-report --perf-baseline
+"""
+import argparse
+import json
+import os
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+# Add the parent directory to Python path for imports when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TestConfig
+from helpers.results_store import DRIVER_MODES, ResultsStore, current_commit
+from helpers.workers import is_xdist_worker
+
+# Scale factor turning the median absolute deviation into a standard-deviation estimate
+MAD_TO_SIGMA = 1.4826
+
+
+def baseline_key(nodeid):
+    """Node id without the xdist group suffix"""
+    return nodeid.split('@')[0]
+
+
+def samples_from_reports(reports):
+    """{nodeid: {'durations': [...], 'commandCounts': [...]}} from passed tests of JSON reports"""
+    samples = {}
+    for report in reports:
+        for test in report.get('tests', []):
+            if test.get('status') != 'passed':
+                continue
+            entry = samples.setdefault(baseline_key(test['fullTitle']), {'durations': [], 'commandCounts': []})
+            entry['durations'].append(test['duration'])
+            command_count = (test.get('metrics') or {}).get('commandCount')
+            if command_count is not None:
+                entry['commandCounts'].append(command_count)
+    return samples
+
+
+def samples_from_store(store, runs, driver_mode, browser):
+    """Same shape as samples_from_reports, from the last `runs` runs of one driver mode and browser"""
+    run_ids = store.recent_runs(runs, driver_mode=driver_mode, browser=browser)
+    samples = {}
+    if not run_ids:
+        return samples
+    rows = store.connection.execute(
+        "SELECT test_id, duration_ms, command_count FROM results"
+        f" WHERE status = 'passed' AND run_id IN ({','.join('?' * len(run_ids))})", run_ids
+    )
+    for test_id, duration, command_count in rows:
+        entry = samples.setdefault(test_id, {'durations': [], 'commandCounts': []})
+        entry['durations'].append(duration)
+        if command_count is not None:
+            entry['commandCounts'].append(command_count)
+    return samples
+
+
+def build_baseline(samples, source, driver_mode, browser):
+    """Baseline document: per-test samples plus where they came from"""
+    return {
+        'createdAt': datetime.now().isoformat(),
+        'commit': current_commit(),
+        'driverMode': driver_mode,
+        'browser': browser,
+        'source': source,
+        'tests': samples,
+    }
+
+
+def run_kind(driver_mode, browser):
+    """Readable driver mode and browser of a baseline or run, e.g. real edge"""
+    return f"{driver_mode or 'unknown mode'} {browser or 'unknown browser'}"
+
+
+def mode_mismatch(baseline, driver_mode, browser):
+    """Why runs of this driver mode and browser cannot be gated by the baseline, or None"""
+    expected = (baseline.get('driverMode'), baseline.get('browser'))
+    if expected == (driver_mode, browser):
+        return None
+    if expected[0] is None:
+        return "the baseline records no driver mode; rebuild it with the baseline command"
+    return f"the baseline holds {run_kind(*expected)} runs, this is a {run_kind(driver_mode, browser)} run"
+
+
+def noise_bound(values, k):
+    """median + k * sigma (estimated from the MAD); just the median for a single sample"""
+    median = statistics.median(values)
+    if len(values) < 3:
+        return median
+    mad = statistics.median(abs(value - median) for value in values)
+    return median + k * MAD_TO_SIGMA * mad
+
+
+def find_regressions(baseline, current, threshold=None, min_delta_ms=None, noise_k=None):
+    """
+    Compare current samples with the baseline.
+    Returns [{'test', 'metric', 'baseline', 'current', 'change'}] for every metric that regressed.
+    """
+    threshold = TestConfig.PERF_REGRESSION_THRESHOLD if threshold is None else threshold
+    min_delta_ms = TestConfig.PERF_REGRESSION_MIN_DELTA_MS if min_delta_ms is None else min_delta_ms
+    noise_k = TestConfig.PERF_REGRESSION_NOISE_K if noise_k is None else noise_k
+    regressions = []
+    for test_id, now in current.items():
+        before = baseline['tests'].get(test_id)
+        if not before:
+            continue
+        if before['durations'] and now['durations']:
+            base = statistics.median(before['durations'])
+            value = statistics.median(now['durations'])
+            limit = max(base * (1 + threshold), noise_bound(before['durations'], noise_k))
+            if value > limit and value - base >= min_delta_ms:
+                regressions.append({'test': test_id, 'metric': 'durationMs', 'baseline': base,
+                                    'current': value, 'change': value / base - 1 if base else None})
+        if before['commandCounts'] and now['commandCounts']:
+            base = statistics.median(before['commandCounts'])
+            value = statistics.median(now['commandCounts'])
+            if value > base * (1 + threshold):
+                regressions.append({'test': test_id, 'metric': 'commandCount', 'baseline': base,
+                                    'current': value, 'change': value / base - 1 if base else None})
+    return sorted(regressions, key=lambda regression: regression['change'] or 0, reverse=True)
+
+
+def format_regression(regression):
+    """One-line description of a regression"""
+    unit = 'ms' if regression['metric'] == 'durationMs' else ' commands'
+    change = f"+{regression['change']:.0%}" if regression['change'] is not None else "new cost"
+    return (f"{regression['test']}: {regression['metric']} {regression['baseline']:.0f}{unit} → "
+            f"{regression['current']:.0f}{unit} ({change})")
+
+
+def load_json(path):
+    """Parse a baseline or JSON performance report"""
+    return json.loads(Path(path).read_text(encoding='utf-8'))
+
+
+class RegressionGatePlugin:
+    """Collects this session's per-test samples and fails the session on regression"""
+
+    def __init__(self, baseline_path, threshold):
+        self.baseline_path = baseline_path
+        self.baseline = load_json(baseline_path)
+        if not isinstance(self.baseline, dict) or 'tests' not in self.baseline:
+            raise ValueError("no 'tests' entry")
+        self.threshold = threshold
+        self.current = {}
+        self.regressions = []
+
+    def pytest_runtest_logreport(self, report):
+        if is_xdist_worker() or report.when != 'call' or not report.passed:
+            return
+        entry = self.current.setdefault(baseline_key(report.nodeid), {'durations': [], 'commandCounts': []})
+        entry['durations'].append(report.duration * 1000)
+        command_count = (getattr(report, 'perf_test', None) or {}).get('metrics', {}).get('commandCount')
+        if command_count is not None:
+            entry['commandCounts'].append(command_count)
+
+    def check_mode(self, driver_mode, browser):
+        """Refuse to gate a session whose driver mode or browser differs from the baseline's"""
+        mismatch = mode_mismatch(self.baseline, driver_mode, browser)
+        if mismatch:
+            raise ValueError(mismatch)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self, session, exitstatus):
+        if is_xdist_worker():
+            return
+        self.regressions = find_regressions(self.baseline, self.current, self.threshold)
+        if self.regressions and session.exitstatus == pytest.ExitCode.OK:
+            session.exitstatus = pytest.ExitCode.TESTS_FAILED
+
+    def pytest_terminal_summary(self, terminalreporter):
+        compared = sum(1 for test_id in self.current if test_id in self.baseline['tests'])
+        if not self.regressions:
+            terminalreporter.write_line(f"✅ Performance gate: {compared} tests within baseline ({self.baseline_path})")
+            return
+        terminalreporter.write_line(f"❌ Performance gate: {len(self.regressions)} regressions against {self.baseline_path}",
+                                    red=True)
+        for regression in self.regressions:
+            terminalreporter.write_line(f"   {format_regression(regression)}")
+
+
+@pytest.hookimpl(trylast=True)
+def pytest_configure(config):
+    """Register the gate when --perf-baseline is given (after conftest has chosen the driver mode)"""
+    if not config.getoption('perf_baseline'):
+        return
+    from helpers.mock_driver import driver_mode
+    baseline_path = config.getoption('perf_baseline_path') or str(TestConfig.PERF_BASELINE_PATH)
+    try:
+        plugin = RegressionGatePlugin(baseline_path, config.getoption('perf_threshold'))
+    except OSError as e:
+        raise pytest.UsageError(f"--perf-baseline: cannot read baseline {baseline_path} ({e.strerror})")
+    except ValueError as e:
+        raise pytest.UsageError(f"--perf-baseline: {baseline_path} is not a valid baseline file ({e})")
+    try:
+        plugin.check_mode(driver_mode(), TestConfig.BROWSER.lower())
+    except ValueError as e:
+        raise pytest.UsageError(f"--perf-baseline: cannot gate this session against {baseline_path}: {e}")
+    config.pluginmanager.register(plugin, 'regression_gate')
+
+
+def pytest_addoption(parser):
+    """Add command line options"""
+    parser.addoption(
+        '--perf-baseline',
+        action='store_true',
+        default=False,
+        help='Fail the session when tests regress against the baseline. Command counts are compared when '
+             '--json-report is on'
+    )
+    parser.addoption(
+        '--perf-baseline-path',
+        default=None,
+        help='Baseline file for --perf-baseline (default: TestConfig.PERF_BASELINE_PATH)'
+    )
+    parser.addoption(
+        '--perf-threshold',
+        type=float,
+        default=None,
+        help='Relative slowdown that counts as a regression (default: TestConfig.PERF_REGRESSION_THRESHOLD)'
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    commands = parser.add_subparsers(dest="command", required=True)
+    baseline_parser = commands.add_parser("baseline", help="Write a baseline from the results store or JSON reports")
+    baseline_parser.add_argument("--reports", nargs="+", help="JSON reports to use instead of the results store")
+    baseline_parser.add_argument("--runs", type=int, default=TestConfig.PERF_BASELINE_RUNS,
+                                 help="Most recent store runs to use")
+    baseline_parser.add_argument("--db", default=None, help="Results store path")
+    baseline_parser.add_argument("--mode", choices=DRIVER_MODES, default="real",
+                                 help="Driver mode of the runs to use (default: real browsers)")
+    baseline_parser.add_argument("--browser", default=TestConfig.BROWSER.lower(),
+                                 help="Browser of the runs to use (default: TestConfig.BROWSER)")
+    baseline_parser.add_argument("-o", "--output", default=str(TestConfig.PERF_BASELINE_PATH))
+    check_parser = commands.add_parser("check", help="Compare JSON reports with a baseline")
+    check_parser.add_argument("--reports", nargs="+", required=True, help="JSON reports of the run(s) under test")
+    check_parser.add_argument("--baseline", default=str(TestConfig.PERF_BASELINE_PATH))
+    check_parser.add_argument("--threshold", type=float, default=None)
+    args = parser.parse_args()
+
+    if args.command == "baseline":
+        browser = args.browser.lower()
+        if args.reports:
+            reports = []
+            for path in args.reports:
+                report = load_json(path)
+                if (report.get('driverMode'), report.get('browser')) != (args.mode, browser):
+                    print(f"⏭️  Skipping {path}: {run_kind(report.get('driverMode'), report.get('browser'))} run")
+                    continue
+                reports.append(report)
+            samples = samples_from_reports(reports)
+            source = {'reports': args.reports}
+        else:
+            with ResultsStore(args.db) as store:
+                samples = samples_from_store(store, args.runs, args.mode, browser)
+            source = {'store': str(args.db or TestConfig.RESULTS_STORE_PATH), 'runs': args.runs}
+        if not samples:
+            print(f"❌ No passed {run_kind(args.mode, browser)} test results to build a baseline from")
+            return 1
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        Path(args.output).write_text(json.dumps(build_baseline(samples, source, args.mode, browser), indent=2),
+                                     encoding='utf-8')
+        print(f"💾 Baseline of {len(samples)} tests ({run_kind(args.mode, browser)}) saved to: {args.output}")
+        return 0
+
+    baseline = load_json(args.baseline)
+    reports = [load_json(path) for path in args.reports]
+    for path, report in zip(args.reports, reports):
+        mismatch = mode_mismatch(baseline, report.get('driverMode'), report.get('browser'))
+        if mismatch:
+            print(f"❌ Cannot check {path}: {mismatch}")
+            return 2
+    current = samples_from_reports(reports)
+    regressions = find_regressions(baseline, current, args.threshold)
+    compared = sum(1 for test_id in current if test_id in baseline['tests'])
+    if not regressions:
+        print(f"✅ {compared} tests within baseline")
+        return 0
+    print(f"❌ {len(regressions)} regressions:")
+    for regression in regressions:
+        print(f"   {format_regression(regression)}")
+    return 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,289 @@
+"""
+Historical results store
+Appends every JSON performance report to a local SQLite database (one row per
+run, one row per test result) and answers trend questions across runs:
+per-test p50/p95 over time, the slowest movers and flake rates. Each run records
+its driver mode (real browser, placeholder mock, DOM mock or cassette replay) and
+every query is limited to one mode, real browsers unless --mode says otherwise.
+
+Usage:
+    python python_tests/helpers/results_store.py runs [--limit 20] [--mode real|mock|dom|replay|all]
+    python python_tests/helpers/results_store.py trend test_ep23_add_new_user_valid_data [--bucket day]
+    python python_tests/helpers/results_store.py movers [--window 10] [--limit 10]
+    python python_tests/helpers/results_store.py flaky [--runs 50] [--limit 10]
+"""
+import argparse
+import os
+import sqlite3
+import subprocess
+import sys
+from datetime import datetime
+
+# Add the parent directory to Python path for imports when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TestConfig
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    commit_sha TEXT,
+    browser TEXT,
+    driver_mode TEXT,
+    framework TEXT,
+    total_duration_ms REAL,
+    total_tests INTEGER,
+    passed INTEGER,
+    failed INTEGER,
+    skipped INTEGER
+);
+CREATE TABLE IF NOT EXISTS results (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    test_id TEXT NOT NULL,
+    title TEXT,
+    worker TEXT,
+    status TEXT NOT NULL,
+    duration_ms REAL NOT NULL,
+    command_count INTEGER
+);
+CREATE INDEX IF NOT EXISTS idx_runs_started_at ON runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_runs_commit ON runs(commit_sha);
+CREATE INDEX IF NOT EXISTS idx_results_test_run ON results(test_id, run_id);
+CREATE INDEX IF NOT EXISTS idx_results_title ON results(title);
+CREATE INDEX IF NOT EXISTS idx_results_run ON results(run_id);
+"""
+
+# Driver modes a run can be recorded with (helpers.mock_driver.driver_mode)
+DRIVER_MODES = ('real', 'mock', 'dom', 'replay')
+
+# strftime formats used to bucket runs for trend queries
+TREND_BUCKETS = {'run': None, 'day': '%Y-%m-%d', 'week': '%Y-W%W', 'month': '%Y-%m'}
+
+
+def percentile(values, fraction):
+    """Linear-interpolated percentile of a non-empty list (fraction in 0..1)"""
+    ordered = sorted(values)
+    position = (len(ordered) - 1) * fraction
+    lower = int(position)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (position - lower)
+
+
+def current_commit():
+    """Commit under test: CI variables first, then git; None outside a repository"""
+    for var in ("GIT_COMMIT", "GITHUB_SHA", "CI_COMMIT_SHA", "BUILD_SOURCEVERSION"):
+        if os.environ.get(var):
+            return os.environ[var]
+    try:
+        result = subprocess.run(["git", "rev-parse", "HEAD"], capture_output=True, text=True,
+                                cwd=TestConfig.PROJECT_ROOT, timeout=5)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return result.stdout.strip() or None
+
+
+class ResultsStore:
+    """SQLite-backed history of JSON performance reports"""
+
+    def __init__(self, path=None):
+        self.path = path or TestConfig.RESULTS_STORE_PATH
+        self.connection = sqlite3.connect(str(self.path))
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA foreign_keys=ON")
+        self.connection.executescript(SCHEMA)
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(runs)")}
+        if 'driver_mode' not in columns:
+            # Stores written before driver modes were recorded: their runs match no mode
+            self.connection.execute("ALTER TABLE runs ADD COLUMN driver_mode TEXT")
+        self.connection.execute("CREATE INDEX IF NOT EXISTS idx_runs_mode ON runs(driver_mode, browser)")
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def record_run(self, report, commit_sha=None, browser=None, driver_mode=None):
+        """Append a JSON performance report (as written by PerformanceReporter); returns the run id"""
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started_at, commit_sha, browser, driver_mode, framework, total_duration_ms,"
+                " total_tests, passed, failed, skipped) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (report.get('timestamp') or datetime.now().isoformat(),
+                 commit_sha if commit_sha is not None else current_commit(),
+                 (browser or report.get('browser') or TestConfig.BROWSER).lower(),
+                 driver_mode or report.get('driverMode'), report.get('framework'), report.get('totalDuration'),
+                 report.get('totalTests'), report.get('passed'), report.get('failed'), report.get('skipped'))
+            )
+            run_id = cursor.lastrowid
+            self.connection.executemany(
+                "INSERT INTO results (run_id, test_id, title, worker, status, duration_ms, command_count)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(run_id, test['fullTitle'].split('@')[0], test.get('title'), test.get('worker'),
+                  test['status'], test['duration'], (test.get('metrics') or {}).get('commandCount'))
+                 for test in report.get('tests', [])]
+            )
+        return run_id
+
+    @staticmethod
+    def _run_filter(driver_mode, browser=None, alias=''):
+        """SQL condition and parameters selecting runs of one driver mode (None: any) and browser"""
+        conditions, params = ['1 = 1'], []
+        if driver_mode is not None:
+            conditions.append(f"{alias}driver_mode = ?")
+            params.append(driver_mode)
+        if browser is not None:
+            conditions.append(f"{alias}browser = ?")
+            params.append(browser.lower())
+        return ' AND '.join(conditions), params
+
+    def runs(self, limit=20, driver_mode='real'):
+        """Most recent runs of a driver mode (None: every mode), newest first"""
+        condition, params = self._run_filter(driver_mode)
+        return self.connection.execute(
+            "SELECT id, started_at, commit_sha, browser, driver_mode, total_tests, passed, failed, skipped,"
+            f" total_duration_ms FROM runs WHERE {condition} ORDER BY id DESC LIMIT ?", (*params, limit)
+        ).fetchall()
+
+    def resolve_test(self, name):
+        """Full test id for a node id or a bare test name (most recently run match)"""
+        row = self.connection.execute(
+            "SELECT test_id FROM results WHERE test_id = ? OR title = ? ORDER BY run_id DESC LIMIT 1",
+            (name, name)
+        ).fetchone()
+        return row[0] if row else None
+
+    def trend(self, test_id, bucket='day', statuses=('passed',), driver_mode='real'):
+        """[(period, samples, p50, p95)] for one test, oldest period first"""
+        condition, params = self._run_filter(driver_mode, alias='r.')
+        rows = self.connection.execute(
+            "SELECT r.id, r.started_at, s.duration_ms FROM results s JOIN runs r ON r.id = s.run_id"
+            f" WHERE s.test_id = ? AND s.status IN ({','.join('?' * len(statuses))}) AND {condition} ORDER BY r.id",
+            (test_id, *statuses, *params)
+        ).fetchall()
+        periods = {}
+        fmt = TREND_BUCKETS[bucket]
+        for run_id, started_at, duration in rows:
+            period = datetime.fromisoformat(started_at).strftime(fmt) if fmt else f"run {run_id}"
+            periods.setdefault(period, []).append(duration)
+        return [(period, len(values), percentile(values, 0.5), percentile(values, 0.95))
+                for period, values in periods.items()]
+
+    def recent_runs(self, count, offset=0, driver_mode='real', browser=None):
+        """Ids of the most recent runs of a driver mode (None: any) and browser (None: any), newest first"""
+        condition, params = self._run_filter(driver_mode, browser)
+        return [row[0] for row in self.connection.execute(
+            f"SELECT id FROM runs WHERE {condition} ORDER BY id DESC LIMIT ? OFFSET ?", (*params, count, offset)
+        )]
+
+    def _durations_by_test(self, run_ids):
+        durations = {}
+        if not run_ids:
+            return durations
+        rows = self.connection.execute(
+            "SELECT test_id, duration_ms FROM results"
+            f" WHERE status = 'passed' AND run_id IN ({','.join('?' * len(run_ids))})", run_ids
+        )
+        for test_id, duration in rows:
+            durations.setdefault(test_id, []).append(duration)
+        return durations
+
+    def slowest_movers(self, window=10, limit=10, driver_mode='real'):
+        """
+        Tests whose median duration over the last `window` runs moved most against
+        the `window` runs before: [(test_id, previous p50, recent p50, change ms, change ratio)]
+        """
+        recent = self._durations_by_test(self.recent_runs(window, driver_mode=driver_mode))
+        previous = self._durations_by_test(self.recent_runs(window, offset=window, driver_mode=driver_mode))
+        movers = []
+        for test_id, values in recent.items():
+            if test_id not in previous:
+                continue
+            before = percentile(previous[test_id], 0.5)
+            after = percentile(values, 0.5)
+            movers.append((test_id, before, after, after - before, after / before if before else None))
+        movers.sort(key=lambda mover: mover[3], reverse=True)
+        return movers[:limit]
+
+    def flake_rates(self, runs=50, limit=10, driver_mode='real'):
+        """
+        Tests with mixed outcomes over the last `runs` runs:
+        [(test_id, runs, failures, flake rate)] where the flake rate is the share of
+        consecutive runs in which the outcome flipped between passed and failed
+        """
+        run_ids = self.recent_runs(runs, driver_mode=driver_mode)
+        if not run_ids:
+            return []
+        rows = self.connection.execute(
+            "SELECT test_id, status FROM results"
+            f" WHERE status IN ('passed', 'failed') AND run_id IN ({','.join('?' * len(run_ids))})"
+            " ORDER BY test_id, run_id", run_ids
+        )
+        outcomes = {}
+        for test_id, status in rows:
+            outcomes.setdefault(test_id, []).append(status)
+        flaky = []
+        for test_id, statuses in outcomes.items():
+            flips = sum(1 for before, after in zip(statuses, statuses[1:]) if before != after)
+            if flips:
+                flaky.append((test_id, len(statuses), statuses.count('failed'), flips / (len(statuses) - 1)))
+        flaky.sort(key=lambda entry: entry[3], reverse=True)
+        return flaky[:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--db", default=None, help="Store path (default: TestConfig.RESULTS_STORE_PATH)")
+    mode_parser = argparse.ArgumentParser(add_help=False)
+    mode_parser.add_argument("--mode", choices=DRIVER_MODES + ('all',), default="real",
+                             help="Only runs with this driver (default: real browsers)")
+    commands = parser.add_subparsers(dest="command", required=True)
+    runs_parser = commands.add_parser("runs", help="List recent runs", parents=[mode_parser])
+    runs_parser.add_argument("--limit", type=int, default=20)
+    trend_parser = commands.add_parser("trend", help="p50/p95 of one test over time", parents=[mode_parser])
+    trend_parser.add_argument("test", help="Test name or node id")
+    trend_parser.add_argument("--bucket", choices=sorted(TREND_BUCKETS), default="day")
+    movers_parser = commands.add_parser("movers", help="Tests that slowed down the most", parents=[mode_parser])
+    movers_parser.add_argument("--window", type=int, default=10, help="Runs per comparison window")
+    movers_parser.add_argument("--limit", type=int, default=10)
+    flaky_parser = commands.add_parser("flaky", help="Tests whose outcome flips between runs", parents=[mode_parser])
+    flaky_parser.add_argument("--runs", type=int, default=50)
+    flaky_parser.add_argument("--limit", type=int, default=10)
+    args = parser.parse_args()
+    mode = None if args.mode == "all" else args.mode
+
+    with ResultsStore(args.db) as store:
+        if args.command == "runs":
+            print(f"{'run':>5}  {'started':<19}  {'commit':<8}  {'browser':<7}  {'mode':<6}  {'tests':>5}  "
+                  f"{'failed':>6}  {'duration':>9}")
+            for run_id, started, commit, browser, run_mode, total, passed, failed, skipped, duration in \
+                    store.runs(args.limit, mode):
+                print(f"{run_id:>5}  {started[:19]:<19}  {(commit or '-')[:8]:<8}  {browser or '-':<7}  "
+                      f"{run_mode or '-':<6}  {total or 0:>5}  {failed or 0:>6}  {(duration or 0) / 1000:>8.2f}s")
+        elif args.command == "trend":
+            test_id = store.resolve_test(args.test)
+            if test_id is None:
+                print(f"❌ No results for {args.test}")
+                return 1
+            print(f"📈 {test_id}")
+            print(f"{'period':<12}  {'runs':>4}  {'p50':>9}  {'p95':>9}")
+            for period, samples, p50, p95 in store.trend(test_id, args.bucket, driver_mode=mode):
+                print(f"{period:<12}  {samples:>4}  {p50:>7.0f}ms  {p95:>7.0f}ms")
+        elif args.command == "movers":
+            print(f"{'before':>9}  {'after':>9}  {'change':>9}  test")
+            for test_id, before, after, change, ratio in store.slowest_movers(args.window, args.limit, mode):
+                ratio_text = f" (x{ratio:.2f})" if ratio else ""
+                print(f"{before:>7.0f}ms  {after:>7.0f}ms  {change:>+7.0f}ms  {test_id}{ratio_text}")
+        elif args.command == "flaky":
+            print(f"{'runs':>4}  {'failed':>6}  {'flake':>6}  test")
+            for test_id, runs, failures, rate in store.flake_rates(args.runs, args.limit, mode):
+                print(f"{runs:>4}  {failures:>6}  {rate:>6.0%}  {test_id}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,182 @@
+"""
+Streaming JSONL results
+PerformanceReporter appends one JSON line per finished test to
+test_results/pytest-results.jsonl (fsync'd in batches), so a killed or hung run
+still leaves its completed results on disk. The finalizer builds the summary
+pytest-results.json from the stream in two passes without holding the tests in memory.
+
+Usage (rebuild the summary of a run that never finished):
+    python python_tests/helpers/results_stream.py [test_results/pytest-results.jsonl]
+"""
+import argparse
+import json
+import os
+import sys
+import textwrap
+import time
+from pathlib import Path
+
+# Add the parent directory to Python path for imports when run as a script
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import TestConfig
+
+DEFAULT_STREAM_PATH = Path(TestConfig.JSON_REPORT_PATH).with_suffix('.jsonl')
+
+
+class ResultsStream:
+    """Append-only JSONL writer that fsyncs every N records or T seconds"""
+
+    def __init__(self, path, fsync_every=None, fsync_seconds=None):
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.fsync_every = TestConfig.RESULTS_STREAM_FSYNC_EVERY if fsync_every is None else fsync_every
+        self.fsync_seconds = TestConfig.RESULTS_STREAM_FSYNC_SECONDS if fsync_seconds is None else fsync_seconds
+        self._file = open(self.path, 'w', encoding='utf-8')
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def write(self, record_type, **fields):
+        """Append one record; it reaches the OS immediately and the disk within the fsync batch"""
+        record = {'type': record_type, 'time': time.time() * 1000, **fields}
+        self._file.write(json.dumps(record) + '\n')
+        self._file.flush()
+        self._unsynced += 1
+        if self._unsynced >= self.fsync_every or time.monotonic() - self._last_sync >= self.fsync_seconds:
+            self.sync()
+
+    def sync(self):
+        os.fsync(self._file.fileno())
+        self._unsynced = 0
+        self._last_sync = time.monotonic()
+
+    def close(self):
+        if not self._file.closed:
+            self.sync()
+            self._file.close()
+
+
+def read_records(stream_path):
+    """Records of a stream, skipping a line truncated by a crash"""
+    with open(stream_path, encoding='utf-8') as stream:
+        for line in stream:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
+
+
+def iter_tests(stream_path):
+    """Test results of a stream, in the order they finished"""
+    for record in read_records(stream_path):
+        if record['type'] == 'test':
+            yield record['result']
+
+
+def summarize(stream_path):
+    """Run-level summary of a stream (everything in the JSON report except 'tests')"""
+    summary = {
+        'framework': 'Pytest', 'timestamp': None, 'browser': None, 'driverMode': None,
+        'complete': False, 'totalDuration': 0,
+        'totalTests': 0, 'passed': 0, 'failed': 0, 'skipped': 0, 'sleepRemovedMs': 0, 'simulatedWaitMs': 0,
+        'waitLatencyHistogram': {}, 'implicitWaitStalls': [], 'commandsByType': {}, 'workers': {},
+        'phases': {'setup': 0.0, 'call': 0.0, 'teardown': 0.0}, 'fixtures': {},
+    }
+    start = last = None
+    usage = {}
+    for record in read_records(stream_path):
+        last = record['time']
+        if record['type'] == 'sessionStart':
+            start = record['time']
+            summary['timestamp'] = record['timestamp']
+            summary['browser'] = record.get('browser')
+            summary['driverMode'] = record.get('driverMode')
+        elif record['type'] == 'sessionEnd':
+            summary['complete'] = True
+        elif record['type'] in ('test', 'usage'):
+            worker = usage.setdefault(record['worker'], {'tests': 0, 'busyMs': 0.0, 'firstStart': None, 'lastStop': None})
+            worker['busyMs'] += record['busyMs']
+            _count_phases(summary, record)
+            if record.get('start') is not None:
+                worker['firstStart'] = min(filter(None, [worker['firstStart'], record['start']]))
+                worker['lastStop'] = max(filter(None, [worker['lastStop'], record['stop']]))
+            if record['type'] == 'test':
+                worker['tests'] += 1
+                _count_test(summary, record['result'])
+    busy_ms = sum(summary['phases'].values())
+    for cost in summary['fixtures'].values():
+        cost['share'] = (cost['setupMs'] + cost['teardownMs']) / busy_ms if busy_ms else 0
+    summary['totalDuration'] = (last - start) if start is not None else 0
+    total_duration = summary['totalDuration']
+    summary['workers'] = {
+        name: {
+            'tests': worker['tests'],
+            'busyMs': worker['busyMs'],
+            'activeMs': (worker['lastStop'] - worker['firstStart']) * 1000 if worker['firstStart'] is not None else None,
+            'utilisation': worker['busyMs'] / total_duration if total_duration else None
+        }
+        for name, worker in sorted(usage.items())
+    }
+    return summary
+
+
+def _count_phases(summary, record):
+    for phase, ms in record.get('phases', {}).items():
+        summary['phases'][phase] += ms
+    fixtures = record.get('fixtures') or {}
+    for stage, key in (('setup', 'setupMs'), ('teardown', 'teardownMs')):
+        for name, timing in fixtures.get(stage, {}).items():
+            cost = summary['fixtures'].setdefault(name, {'setupMs': 0.0, 'teardownMs': 0.0, 'setups': 0})
+            cost[key] += timing['ms']
+            if stage == 'setup':
+                cost['setups'] += timing['count']
+
+
+def _count_test(summary, result):
+    summary['totalTests'] += 1
+    summary[result['status']] += 1
+    metrics = result.get('metrics') or {}
+    summary['sleepRemovedMs'] += metrics.get('sleepRemovedMs', 0)
+    summary['simulatedWaitMs'] += metrics.get('simulatedWaitMs', 0)
+    for bucket, count in metrics.get('waitLatencyHistogram', {}).items():
+        summary['waitLatencyHistogram'][bucket] = summary['waitLatencyHistogram'].get(bucket, 0) + count
+    for stall in metrics.get('implicitWaitStallLookups', []):
+        summary['implicitWaitStalls'].append({'test': result['fullTitle'], **stall})
+    for command, timing in metrics.get('commandsByType', {}).items():
+        total = summary['commandsByType'].setdefault(command, {'count': 0, 'ms': 0.0})
+        total['count'] += timing['count']
+        total['ms'] += timing['ms']
+
+
+def finalize(stream_path, report_path=None):
+    """
+    Write the summary JSON report next to the stream (tests streamed into it one by one)
+    and return the summary without the tests
+    """
+    stream_path = Path(stream_path)
+    report_path = Path(report_path) if report_path else stream_path.with_suffix('.json')
+    summary = summarize(stream_path)
+    header = json.dumps(summary, indent=2)[:-2]  # drop the closing "\n}" to append the tests array
+    with open(report_path, 'w', encoding='utf-8') as report:
+        report.write(header + ',\n  "tests": [')
+        for index, result in enumerate(iter_tests(stream_path)):
+            report.write(',\n' if index else '\n')
+            report.write(textwrap.indent(json.dumps(result, indent=2), '    '))
+        report.write('\n  ]\n}\n')
+    return summary
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build pytest-results.json from a (possibly partial) results stream")
+    parser.add_argument("stream", nargs="?", default=str(DEFAULT_STREAM_PATH))
+    parser.add_argument("-o", "--output", default=None, help="Report path (default: stream path with .json)")
+    args = parser.parse_args()
+    summary = finalize(args.stream, args.output)
+    state = "complete" if summary['complete'] else "partial"
+    print(f"💾 Summary of {summary['totalTests']} tests ({state} run) saved to: "
+          f"{args.output or Path(args.stream).with_suffix('.json')}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
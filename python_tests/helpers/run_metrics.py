@@ -0,0 +1,79 @@
+"""
+Per-test metrics collector
+Fixtures and helpers record measurements here while a test runs;
+the JSON performance reporter attaches a snapshot to each test result
+"""
+import copy
+import threading
+import time
+from contextlib import contextmanager
+
+_current_metrics = {}
+
+# Per-thread redirection of metrics (see collecting())
+_local = threading.local()
+
+
+def _metrics():
+    collected = getattr(_local, 'metrics', None)
+    return _current_metrics if collected is None else collected
+
+
+def reset():
+    """Start a fresh metrics set for the next test"""
+    _current_metrics.clear()
+
+
+@contextmanager
+def collecting():
+    """Record this thread's metrics into a separate dict (yielded) instead of the current test's"""
+    previous = getattr(_local, 'metrics', None)
+    _local.metrics = {}
+    try:
+        yield _local.metrics
+    finally:
+        _local.metrics = previous
+
+
+def record(name, value):
+    """Set a metric value, replacing any previous value"""
+    _metrics()[name] = value
+
+
+def increment(name, amount=1):
+    """Add to a numeric metric, starting from zero"""
+    metrics = _metrics()
+    metrics[name] = metrics.get(name, 0) + amount
+
+
+def increment_bucket(name, bucket, amount=1):
+    """Count an observation in a histogram metric ({bucket: count})"""
+    histogram = _metrics().setdefault(name, {})
+    histogram[bucket] = histogram.get(bucket, 0) + amount
+
+
+@contextmanager
+def timed(name):
+    """Add the wall-clock ms spent in the with-block to a numeric metric"""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        increment(name, (time.perf_counter() - start) * 1000)
+
+
+def add_timing(name, key, ms):
+    """Count and time an occurrence of key in a timing-table metric ({key: {count, ms}})"""
+    entry = _metrics().setdefault(name, {}).setdefault(key, {'count': 0, 'ms': 0.0})
+    entry['count'] += 1
+    entry['ms'] += ms
+
+
+def append(name, value):
+    """Add an entry to a list metric"""
+    _metrics().setdefault(name, []).append(value)
+
+
+def snapshot():
+    """Return a copy of the metrics recorded for the current test"""
+    return copy.deepcopy(_current_metrics)
@@ -0,0 +1,85 @@
+"""
+Settle waits for turbo execution mode
+Replaces fixed slow-motion sleeps with waits for the page to actually settle:
+the DOM has stopped changing and no finite CSS transition/animation is running
+"""
+import time
+
+from selenium.common.exceptions import WebDriverException
+
+from config import TestConfig
+from helpers import run_metrics
+from helpers.event_log import get_logger
+from helpers.mock_clock import MockClock
+
+log = get_logger("waits")
+
+# Resolves once the DOM has been quiet for quietMs and no finite animation
+# (modal slide-in, fade, progress bar) is running, or when timeoutMs elapses
+SETTLE_SCRIPT = """
+var quietMs = arguments[0];
+var timeoutMs = arguments[1];
+var done = arguments[arguments.length - 1];
+var clock = window.__e2eClock;
+var now = clock ? clock.real.now : performance.now.bind(performance);
+var later = clock ? clock.real.setTimeout : setTimeout;
+var start = now();
+var lastMutation = start;
+var observer = new MutationObserver(function () { lastMutation = now(); });
+observer.observe(document, {subtree: true, childList: true, attributes: true, characterData: true});
+
+function runningAnimations() {
+    if (!document.getAnimations) { return 0; }
+    return document.getAnimations().filter(function (animation) {
+        var timing = animation.effect ? animation.effect.getComputedTiming() : {};
+        return animation.playState === 'running' && timing.iterations !== Infinity;
+    }).length;
+}
+
+(function check() {
+    var current = now();
+    var settled = current - lastMutation >= quietMs && runningAnimations() === 0;
+    if (settled || current - start >= timeoutMs) {
+        observer.disconnect();
+        done(settled);
+        return;
+    }
+    later(check, 16);
+})();
+"""
+
+
+def wait_for_settle(driver, quiet_ms=None, timeout=None):
+    """
+    Wait until the page stops changing.
+    Returns True when settled, False on timeout and None when the driver cannot report it.
+    """
+    quiet_ms = TestConfig.SETTLE_QUIET_MS if quiet_ms is None else quiet_ms
+    timeout = TestConfig.SETTLE_TIMEOUT if timeout is None else timeout
+    try:
+        settled = driver.execute_async_script(SETTLE_SCRIPT, quiet_ms, timeout * 1000)
+    except WebDriverException as e:
+        log.warning("⚠️  Settle wait failed: %s", str(e).splitlines()[0])
+        return None
+    return settled if isinstance(settled, bool) else None
+
+
+def action_pause(driver, seconds=None):
+    """
+    Pause after a UI action: settle wait in turbo mode, fixed sleep in slow motion.
+    The sleep is only counted as removed when a browser ran the settle check; otherwise
+    (mock or replayed driver, script failure) the slow-motion sleep still applies and
+    the mock clock reports it as simulated waiting.
+    """
+    delay = seconds if seconds else TestConfig.SLOW_MOTION_DELAY
+
+    if TestConfig.TURBO_MODE and driver is not None:
+        start = time.perf_counter()
+        settled = wait_for_settle(driver)
+        run_metrics.increment('settleWaitMs', round((time.perf_counter() - start) * 1000, 1))
+        if settled is not None and MockClock.active() is None:
+            if TestConfig.SLOW_MOTION:
+                run_metrics.increment('sleepRemovedMs', delay * 1000)
+            return
+    if TestConfig.SLOW_MOTION:
+        time.sleep(delay)
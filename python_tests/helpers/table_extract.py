@@ -0,0 +1,55 @@
+"""
+Batched table extraction
+Reads table headers and cell text for several tables in a single execute_script
+call instead of one WebDriver round trip per row and per cell
+"""
+from selenium.webdriver.common.by import By
+
+# arguments[0]: list of {rows, cells, headers} CSS selectors.
+# Hidden cells read as '' to match WebElement.text for non-displayed elements.
+TABLE_SNAPSHOT_SCRIPT = """
+function cellText(element) {
+    if (!element.getClientRects().length) { return ''; }
+    return (element.innerText || '').replace(/\\u00a0/g, ' ').trim();
+}
+return arguments[0].map(function (spec) {
+    var headers = spec.headers ? Array.prototype.map.call(document.querySelectorAll(spec.headers), cellText) : [];
+    var rows = Array.prototype.map.call(document.querySelectorAll(spec.rows), function (row) {
+        return Array.prototype.map.call(row.querySelectorAll(spec.cells), cellText);
+    });
+    return {headers: headers, rows: rows};
+});
+"""
+
+
+def css_selector(locator):
+    """Convert an ID or CSS locator tuple to a CSS selector string"""
+    by, value = locator
+    if by == By.ID:
+        # Attribute form, as Selenium sends By.ID: ids starting with a digit or holding '.'/':' stay valid
+        escaped = value.replace('\\', '\\\\').replace('"', '\\"')
+        return f'[id="{escaped}"]'
+    if by == By.CSS_SELECTOR:
+        return value
+    raise ValueError(f"Locator cannot be used for batched extraction: {locator}")
+
+
+def read_tables(driver, specs):
+    """
+    Read several tables in one round trip.
+    specs: list of dicts with 'rows' and optional 'headers' locators and 'cells' CSS selector.
+    Returns a list of {'headers': [...], 'rows': [[cell, ...], ...]}, or None if the driver
+    cannot run scripts.
+    """
+    script_specs = [
+        {
+            'rows': css_selector(spec['rows']),
+            'cells': spec.get('cells', 'td'),
+            'headers': css_selector(spec['headers']) if spec.get('headers') else None,
+        }
+        for spec in specs
+    ]
+    result = driver.execute_script(TABLE_SNAPSHOT_SCRIPT, script_specs)
+    if not isinstance(result, list):
+        return None
+    return result
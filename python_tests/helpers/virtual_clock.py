@@ -0,0 +1,72 @@
+"""
+Virtual clock for prototype timers inside the real browser
+Installs helpers/js/virtual_clock.js before page scripts run so Date,
+setTimeout/setInterval and performance.now are driven by the test instead
+of wall-clock time
+"""
+from pathlib import Path
+
+from selenium.common.exceptions import WebDriverException
+
+from helpers import run_metrics
+
+VIRTUAL_CLOCK_SCRIPT = (Path(__file__).parent / "js" / "virtual_clock.js").read_text(encoding="utf-8")
+
+
+class VirtualClock:
+    """Controls the fake clock installed in the browser"""
+
+    def __init__(self, driver, script_identifier):
+        self.driver = driver
+        self._script_identifier = script_identifier
+        self.advanced_ms = 0
+
+    @classmethod
+    def install(cls, driver):
+        """
+        Register the fake clock for every new document and reload the current page under it.
+        Returns None when the driver cannot inject scripts before page load.
+        """
+        if not hasattr(driver, "execute_cdp_cmd"):
+            return None
+        try:
+            result = driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument",
+                                            {"source": VIRTUAL_CLOCK_SCRIPT})
+        except WebDriverException as e:
+            print(f"⚠️  Could not install virtual clock: {str(e).splitlines()[0]}")
+            return None
+
+        clock = cls(driver, result.get("identifier"))
+        driver.virtual_clock = clock
+        if driver.current_url.startswith(("file:", "http")):
+            driver.refresh()
+        return clock
+
+    def uninstall(self):
+        """Stop installing the clock on new documents (the current page keeps it until reloaded)"""
+        if getattr(self.driver, "virtual_clock", None) is self:
+            del self.driver.virtual_clock
+        if self._script_identifier is None:
+            return
+        try:
+            self.driver.execute_cdp_cmd("Page.removeScriptToEvaluateOnNewDocument",
+                                        {"identifier": self._script_identifier})
+        except WebDriverException:
+            pass
+        run_metrics.record('virtualTimeAdvancedMs', self.advanced_ms)
+
+    def advance(self, ms):
+        """Move time forward by ms, running every timer and transition due on the way"""
+        fired = self.driver.execute_script(
+            "return window.__e2eClock ? window.__e2eClock.advance(arguments[0]) : null;", ms)
+        self.advanced_ms += ms
+        return fired
+
+    def flush(self, max_timer_ms=None):
+        """Run pending timers whose delay is at most max_timer_ms, jumping time as needed"""
+        return self.driver.execute_script(
+            "return window.__e2eClock ? window.__e2eClock.flush(arguments[0]) : null;", max_timer_ms)
+
+    def now(self):
+        """Milliseconds of virtual time elapsed since the page loaded"""
+        return self.driver.execute_script("return window.__e2eClock ? window.__e2eClock.now() : null;")
@@ -0,0 +1,81 @@
+"""
+Adaptive polling wait engine
+A WebDriverWait that polls quickly at first and backs off towards the Selenium
+default interval, so satisfied waits no longer overshoot by ~250 ms on average.
+Every wait's latency is recorded as a histogram in the per-test metrics.
+"""
+import time
+
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.support.ui import WebDriverWait
+
+from config import TestConfig
+from helpers import run_metrics
+
+# Upper bounds (ms) of the wait latency histogram buckets
+LATENCY_BUCKETS_MS = [10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000]
+
+
+def latency_bucket(latency_ms):
+    """Histogram bucket label for a wait latency"""
+    for bound in LATENCY_BUCKETS_MS:
+        if latency_ms <= bound:
+            return f"<={bound}ms"
+    return f">{LATENCY_BUCKETS_MS[-1]}ms"
+
+
+class AdaptiveWait(WebDriverWait):
+    """WebDriverWait with exponential poll backoff and latency recording"""
+
+    def __init__(self, driver, timeout, initial_poll=None, max_poll=None, backoff=None, ignored_exceptions=None):
+        super().__init__(driver, timeout, ignored_exceptions=ignored_exceptions)
+        self._initial_poll = TestConfig.WAIT_POLL_INITIAL if initial_poll is None else initial_poll
+        self._max_poll = TestConfig.WAIT_POLL_MAX if max_poll is None else max_poll
+        self._backoff = TestConfig.WAIT_POLL_BACKOFF if backoff is None else backoff
+
+    def until(self, method, message="", timeout=None):
+        """Call method until it returns a truthy value; timeout overrides the default for this wait"""
+        return self._poll_until(method, message, timeout, lambda value: bool(value), until_not=False)
+
+    def until_not(self, method, message="", timeout=None):
+        """Call method until it returns a falsy value (or raises an ignored exception)"""
+        return self._poll_until(method, message, timeout, lambda value: not value, until_not=True)
+
+    def _poll_until(self, method, message, timeout, satisfied, until_not):
+        timeout = self._timeout if timeout is None else float(timeout)
+        screen = None
+        stacktrace = None
+        poll = self._initial_poll
+        polls = 0
+        start = time.monotonic()
+        end_time = start + timeout
+        while True:
+            polls += 1
+            try:
+                value = method(self._driver)
+                if satisfied(value):
+                    self._record(start, polls, timed_out=False)
+                    return value
+            except self._ignored_exceptions as exc:
+                if until_not:
+                    self._record(start, polls, timed_out=False)
+                    return True
+                screen = getattr(exc, "screen", None)
+                stacktrace = getattr(exc, "stacktrace", None)
+            remaining = end_time - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(poll, remaining))
+            poll = min(poll * self._backoff, self._max_poll)
+        self._record(start, polls, timed_out=True)
+        raise TimeoutException(message, screen, stacktrace)
+
+    @staticmethod
+    def _record(start, polls, timed_out):
+        latency_ms = (time.monotonic() - start) * 1000
+        run_metrics.increment_bucket('waitLatencyHistogram', latency_bucket(latency_ms))
+        run_metrics.increment('waitCount')
+        run_metrics.increment('waitPolls', polls)
+        run_metrics.increment('waitTotalMs', round(latency_ms, 1))
+        if timed_out:
+            run_metrics.increment('waitTimeouts')
@@ -0,0 +1,64 @@
+"""
+pytest-xdist worker helpers
+Each xdist worker is its own process with its own browser pool; these helpers
+give every worker separate artifact paths so parallel runs never overwrite
+each other's files
+"""
+import os
+import re
+from contextlib import contextmanager
+
+if os.name == "nt":
+    import msvcrt
+else:
+    import fcntl
+
+# Name used for artifacts when the suite runs in a single process
+MAIN_PROCESS = "main"
+
+
+def worker_id():
+    """xdist worker id (e.g. 'gw0'), or 'main' when not running under xdist"""
+    return os.environ.get("PYTEST_XDIST_WORKER", MAIN_PROCESS)
+
+
+def is_xdist_worker():
+    """Whether this process is an xdist worker (as opposed to the controller or a plain run)"""
+    return "PYTEST_XDIST_WORKER" in os.environ
+
+
+def worker_artifact_dir(base_dir):
+    """Per-worker subdirectory of base_dir (base_dir itself outside xdist), created if missing"""
+    path = base_dir / worker_id() if is_xdist_worker() else base_dir
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+def artifact_name(nodeid, suffix):
+    """File name derived from a test node id, unique across modules and parametrizations"""
+    return re.sub(r"[^\w.-]+", "_", nodeid).strip("_") + suffix
+
+
+@contextmanager
+def interprocess_lock(path):
+    """Exclusive lock on a lock file, held across xdist workers (and threads) until the block exits"""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "a+b") as handle:
+        if os.name == "nt":
+            handle.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(handle.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue  # LK_LOCK gives up after ~10s; keep waiting for the holder
+        else:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+        try:
+            yield
+        finally:
+            if os.name == "nt":
+                handle.seek(0)
+                msvcrt.locking(handle.fileno(), msvcrt.LK_UNLCK, 1)
+            else:
+                fcntl.flock(handle, fcntl.LOCK_UN)
@@ -0,0 +1 @@
+# Outage history tests package
\ No newline at end of file
@@ -0,0 +1,78 @@
+"""
+Test cases for Outage History functionality
+Verifies filters and search across every page of the history table using the
+paginated table reader (one browser round trip per page)
+
+Test Coverage:
+- Display outage history table
+- Filter outages by incident status
+- Filter outages by district
+- Search outages by incident ID
+"""
+import pytest
+import sys
+import os
+
+# Add the parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_objects.outage_history_page import OutageHistoryPage
+
+@pytest.mark.outage_history
+class TestOutageHistory:
+    """Test suite for Outage History functionality"""
+    
+    def test_display_history_table(self, outage_history_page):
+        """Verify outage history is displayed in tabular format"""
+        page = OutageHistoryPage(outage_history_page)
+        
+        reader = page.history_table()
+        first_page = next(reader.pages(), None)
+        if first_page is None:
+            pytest.skip("Driver cannot read tables in the browser")
+        
+        assert len(first_page.headers) > 0, "History table should have headers"
+        print(f"✅ Table headers found: {first_page.headers}")
+        print(f"📊 Found {len(first_page.rows)} outage rows on page 1")
+    
+    def test_filter_by_status_all_pages(self, outage_history_page):
+        """Filter outages by status and verify every page"""
+        page = OutageHistoryPage(outage_history_page)
+        
+        page.filter_by_status("Closed")
+        
+        reader = page.history_table()
+        mismatch = reader.first_mismatch(lambda record: record.get('Incident Status') == "Closed")
+        if reader.pages_read == 0:
+            pytest.skip("Driver cannot read tables in the browser")
+        assert reader.rows_read > 0, "Status filter should leave at least one outage row to verify"
+        assert mismatch is None, f"Outage {mismatch} should have status Closed"
+        print(f"✅ Status filter verified across {reader.pages_read} page(s)")
+    
+    def test_filter_by_district_all_pages(self, outage_history_page):
+        """Filter outages by district and verify every page"""
+        page = OutageHistoryPage(outage_history_page)
+        
+        page.filter_by_district("Wan Chai")
+        
+        reader = page.history_table()
+        mismatch = reader.first_mismatch(lambda record: record.get('District') == "Wan Chai")
+        if reader.pages_read == 0:
+            pytest.skip("Driver cannot read tables in the browser")
+        assert reader.rows_read > 0, "District filter should leave at least one outage row to verify"
+        assert mismatch is None, f"Outage {mismatch} should be in Wan Chai"
+        print(f"✅ District filter verified across {reader.pages_read} page(s)")
+    
+    def test_search_by_incident_id(self, outage_history_page):
+        """Search outages by incident ID and verify every page only shows matches"""
+        page = OutageHistoryPage(outage_history_page)
+        
+        page.search_incidents("OUT-2025-0001")
+        
+        reader = page.history_table()
+        mismatch = reader.first_mismatch(lambda record: "OUT-2025-0001" in record.get('Incident ID', ''))
+        if reader.pages_read == 0:
+            pytest.skip("Driver cannot read tables in the browser")
+        assert reader.rows_read > 0, "Search should leave at least one outage row to verify"
+        assert mismatch is None, f"Outage {mismatch} should match the search term"
+        print(f"🔍 Search verified across {reader.pages_read} page(s)")
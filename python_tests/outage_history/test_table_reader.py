@@ -0,0 +1,140 @@
+"""
+Test cases for the paginated table reader
+Runs PaginatedTableReader against a fake driver holding a paginated table, so
+paging, early stopping and unresponsive pagination are verified without a browser
+
+Test Coverage:
+- Rows and records across every page
+- find() stops at the page with the first match
+- first_mismatch() reads every page
+- Next button that does not change the table
+- Drivers that cannot run the page script
+"""
+import pytest
+import sys
+import os
+
+# Add the parent directory to Python path for imports
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from page_objects import table_reader
+from page_objects.outage_history_page import OutageHistoryPage
+from page_objects.table_reader import PaginatedTableReader
+
+HEADERS = ["Incident ID ⇅", "District", "Incident Status"]
+PAGES = [
+    [["OUT-0001", "Wan Chai", "Closed"], ["OUT-0002", "Wan Chai", "Closed"]],
+    [["OUT-0003", "Central", "Closed"], ["OUT-0004", "Wan Chai", "Open"]],
+    [["OUT-0005", "Wan Chai", "Closed"]],
+]
+
+
+class FakePagedDriver:
+    """Answers READ_PAGE_SCRIPT from in-memory pages; counts the Next clicks it receives"""
+
+    def __init__(self, pages, paginates=True):
+        self.pages = pages
+        self.paginates = paginates
+        self.current = 0
+        self.clicks = 0
+
+    def execute_async_script(self, script, spec, advance, timeout_ms):
+        assert script == table_reader.READ_PAGE_SCRIPT
+        has_next = self.current < len(self.pages) - 1
+        advanced = False
+        if advance and has_next:
+            self.clicks += 1
+            if self.paginates:
+                self.current += 1
+                advanced = True
+        return {'headers': HEADERS, 'rows': self.pages[self.current],
+                'hasNext': self.current < len(self.pages) - 1, 'advanced': advanced}
+
+
+def history_reader(driver):
+    return OutageHistoryPage(driver).history_table()
+
+
+@pytest.fixture(autouse=True)
+def _forget_unresponsive_tables():
+    table_reader._unresponsive_next.clear()
+    yield
+    table_reader._unresponsive_next.clear()
+
+
+@pytest.mark.outage_history
+class TestPaginatedTableReader:
+    """Test suite for PaginatedTableReader"""
+
+    def test_rows_across_all_pages(self):
+        """Verify rows are streamed from every page in order"""
+        reader = history_reader(FakePagedDriver(PAGES))
+
+        rows = list(reader.rows())
+
+        assert rows == [row for page in PAGES for row in page]
+        assert reader.pages_read == 3
+        assert reader.rows_read == 5
+
+    def test_records_keyed_by_header(self):
+        """Verify records use the header text without sort arrows as keys"""
+        reader = history_reader(FakePagedDriver(PAGES))
+
+        first = next(reader.records())
+
+        assert first == {"Incident ID": "OUT-0001", "District": "Wan Chai", "Incident Status": "Closed"}
+
+    def test_find_stops_at_matching_page(self):
+        """Verify find() does not request pages after the one with the match"""
+        driver = FakePagedDriver(PAGES)
+        reader = history_reader(driver)
+
+        record = reader.find(lambda r: r["District"] == "Central")
+
+        assert record["Incident ID"] == "OUT-0003"
+        assert reader.pages_read == 2
+        assert driver.clicks == 1
+
+    def test_first_mismatch_reads_every_page(self):
+        """Verify first_mismatch() returns None only after reading every page"""
+        reader = history_reader(FakePagedDriver(PAGES))
+        assert reader.first_mismatch(lambda r: r["Incident ID"].startswith("OUT-")) is None
+        assert reader.pages_read == 3
+
+        reader = history_reader(FakePagedDriver(PAGES))
+        mismatch = reader.first_mismatch(lambda r: r["District"] == "Wan Chai")
+        assert mismatch["Incident ID"] == "OUT-0003"
+
+    def test_max_pages_limits_reading(self):
+        """Verify reading stops at max_pages"""
+        driver = FakePagedDriver(PAGES)
+        reader = PaginatedTableReader(driver, OutageHistoryPage.HISTORY_TABLE_ROWS,
+                                      next_locator=OutageHistoryPage.NEXT_PAGE_BTN, max_pages=2)
+
+        assert len(list(reader.pages())) == 2
+
+    def test_unresponsive_next_is_clicked_once(self, caplog):
+        """Verify a Next button that does not change the rows ends the table and is not clicked again"""
+        driver = FakePagedDriver(PAGES, paginates=False)
+
+        with caplog.at_level("WARNING", logger="e2e.tables"):
+            first = history_reader(driver)
+            assert len(list(first.rows())) == 2
+            second = history_reader(driver)
+            assert len(list(second.rows())) == 2
+
+        assert first.pages_read == second.pages_read == 1
+        assert driver.clicks == 1, "Later readers should not wait on the unresponsive Next button"
+        warnings = [record for record in caplog.records if record.name == "e2e.tables"]
+        assert len(warnings) == 1, "Unresponsive pagination should be logged once"
+
+    def test_driver_without_script_support(self):
+        """Verify a driver that cannot run the page script yields no pages"""
+        class NoScriptDriver:
+            def execute_async_script(self, *args):
+                return None
+
+        reader = history_reader(NoScriptDriver())
+
+        assert list(reader.records()) == []
+        assert reader.pages_read == 0
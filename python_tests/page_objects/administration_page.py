@@ -3,20 +3,19 @@ Page Object Model for Administration Prototype Page
 Provides methods to interact with UI elements in the admin-prototype.html page
 """
 from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from selenium.webdriver.common.keys import Keys
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-import time
 from config import TestConfig
+from helpers.implicit_wait import no_implicit_wait
+from helpers.table_extract import read_tables
+from page_objects.base_page import BasePage
 
-class AdministrationPage:
+class AdministrationPage(BasePage):
     """Page Object for Administration prototype page"""
     
-    def __init__(self, driver):
-        self.driver = driver
-        self.wait = WebDriverWait(driver, TestConfig.IMPLICIT_WAIT)
+    PAGE_FILE = "admin-prototype.html"
     
     # ===== NAVIGATION SELECTORS =====
     NAV_USER_MANAGEMENT = (By.ID, "nav-users")
@@ -59,6 +58,7 @@ class AdministrationPage:
     # Role table
     ROLE_TABLE = (By.ID, "roleTable")
     ROLE_TABLE_ROWS = (By.CSS_SELECTOR, "#roleTable tbody tr")
+    ROLE_TABLE_HEADERS = (By.CSS_SELECTOR, "#roleTable thead th")
     
     # Role actions
     ADD_ROLE_BTN = (By.ID, "addRoleBtn")
@@ -101,12 +101,6 @@ class AdministrationPage:
     CONFIRM_YES_BTN = (By.ID, "confirmYes")
     CONFIRM_NO_BTN = (By.ID, "confirmNo")
     
-    def slow_action(self, seconds=None):
-        """Add delay between actions for visibility"""
-        if TestConfig.SLOW_MOTION:
-            delay = seconds if seconds else TestConfig.SLOW_MOTION_DELAY
-            time.sleep(delay)
-    
     # ===== NAVIGATION METHODS =====
     def click_user_management_nav(self):
         """Click on User Management navigation"""
@@ -135,40 +129,84 @@ class AdministrationPage:
     def get_user_table_rows_count(self):
         """Get number of rows in user table"""
         try:
-            rows = self.driver.find_elements(*self.USER_TABLE_ROWS)
-            return len(rows)
+            return len(self.find_elements_now(self.USER_TABLE_ROWS))
         except NoSuchElementException:
             return 0
     
     def get_user_table_data(self):
         """Get all user data from table"""
+        snapshot = self.get_tables_snapshot()
+        if snapshot is None:
+            return self.get_user_table_data_per_cell()
+        return snapshot['users']
+    
+    def get_tables_snapshot(self):
+        """Get user/role table headers and rows in a single browser round trip"""
+        tables = read_tables(self.driver, [
+            {'rows': self.USER_TABLE_ROWS, 'headers': self.USER_TABLE_HEADERS},
+            {'rows': self.ROLE_TABLE_ROWS, 'headers': self.ROLE_TABLE_HEADERS},
+        ])
+        if tables is None:
+            return None
+        user_table, role_table = tables
+        users = [self._user_row_to_dict(cells) for cells in user_table['rows'] if len(cells) >= 6]
+        return {
+            'user_headers': user_table['headers'],
+            'users': users,
+            'role_headers': role_table['headers'],
+            'roles': role_table['rows'],
+        }
+    
+    def get_user_table_data_per_cell(self):
+        """
+        Get all user data with one WebDriver call per row and cell.
+        Fallback of get_user_table_data() for drivers without script support, and the reference
+        the batched read is checked against.
+        """
         users = []
         try:
             rows = self.driver.find_elements(*self.USER_TABLE_ROWS)
             for row in rows:
                 cells = row.find_elements(By.TAG_NAME, "td")
                 if len(cells) >= 6:  # Assuming 6+ columns
-                    user_data = {
-                        'id': cells[1].text,  # Skip checkbox column
-                        'name': cells[2].text,
-                        'email': cells[3].text,
-                        'department': cells[4].text,
-                        'role': cells[5].text,
-                        'status': cells[6].text if len(cells) > 6 else ''
-                    }
-                    users.append(user_data)
+                    users.append(self._user_row_to_dict([cell.text for cell in cells]))
         except NoSuchElementException:
             pass
         return users
     
+    @staticmethod
+    def _user_row_to_dict(cells):
+        """Map user table cell texts to a user record"""
+        return {
+            'id': cells[1],  # Skip checkbox column
+            'name': cells[2],
+            'email': cells[3],
+            'department': cells[4],
+            'role': cells[5],
+            'status': cells[6] if len(cells) > 6 else ''
+        }
+    
     def click_add_user_button(self):
         """Click Add User button"""
         self.wait.until(EC.element_to_be_clickable(self.ADD_USER_BTN)).click()
         self.slow_action()
         return self
     
-    def fill_user_form(self, user_id=None, name=None, email=None, department=None, role=None, status=None, location=None):
-        """Fill user form fields"""
+    def fill_user_form(self, user_id=None, name=None, email=None, department=None, role=None, status=None, location=None, mode=None):
+        """Fill user form fields (mode: 'bulk' or 'keystroke', defaults to TestConfig.FORM_FILL_MODE)"""
+        if self.use_bulk_fill(mode):
+            values = {
+                'user_id': (self.USER_ID_INPUT, user_id),
+                'name': (self.USER_NAME_INPUT, name),
+                'email': (self.USER_EMAIL_INPUT, email),
+                'department': (self.USER_DEPARTMENT_SELECT, department),
+                'role': (self.USER_ROLE_SELECT, role),
+                'status': (self.USER_STATUS_SELECT, status),
+                'location': (self.USER_LOCATION_SELECT, location),
+            }
+            if self._bulk_fill_form(values):
+                return self
+        
         if user_id:
             self.wait.until(EC.presence_of_element_located(self.USER_ID_INPUT)).clear()
             self.driver.find_element(*self.USER_ID_INPUT).send_keys(user_id)
@@ -272,8 +310,7 @@ class AdministrationPage:
     def get_role_table_rows_count(self):
         """Get number of rows in role table"""
         try:
-            rows = self.driver.find_elements(*self.ROLE_TABLE_ROWS)
-            return len(rows)
+            return len(self.find_elements_now(self.ROLE_TABLE_ROWS))
         except NoSuchElementException:
             return 0
     
@@ -283,8 +320,17 @@ class AdministrationPage:
         self.slow_action()
         return self
     
-    def fill_role_form(self, role_name=None, description=None, permissions=None):
-        """Fill role form fields"""
+    def fill_role_form(self, role_name=None, description=None, permissions=None, mode=None):
+        """Fill role form fields (mode: 'bulk' or 'keystroke', defaults to TestConfig.FORM_FILL_MODE)"""
+        if self.use_bulk_fill(mode):
+            values = {
+                'role_name': (self.ROLE_NAME_INPUT, role_name),
+                'description': (self.ROLE_DESCRIPTION_INPUT, description),
+                'permissions': (self.PERMISSIONS_CHECKBOXES, list(permissions) if permissions else None),
+            }
+            if self._bulk_fill_form(values):
+                return self
+        
         if role_name:
             self.wait.until(EC.presence_of_element_located(self.ROLE_NAME_INPUT)).clear()
             self.driver.find_element(*self.ROLE_NAME_INPUT).send_keys(role_name)
@@ -310,6 +356,23 @@ class AdministrationPage:
         
         return self
     
+    def _bulk_fill_form(self, values):
+        """Bulk-fill the provided values; returns False if the driver needs the keystroke path"""
+        fields = {field: entry for field, entry in values.items() if entry[1]}
+        if not fields:
+            return True
+        first_locator = next(iter(fields.values()))[0]
+        self.wait.until(EC.presence_of_element_located(first_locator))
+        if self.bulk_fill(fields) is None:
+            return False
+        self.slow_action()
+        return True
+    
+    def get_selected_permissions(self):
+        """Values of the checked permission checkboxes in the role form"""
+        return [checkbox.get_attribute('value') for checkbox in self.driver.find_elements(*self.PERMISSIONS_CHECKBOXES)
+                if checkbox.is_selected()]
+    
     def save_role(self):
         """Click Save Role button"""
         self.wait.until(EC.element_to_be_clickable(self.SAVE_ROLE_BTN)).click()
@@ -364,20 +427,21 @@ class AdministrationPage:
     # ===== COMMON METHODS =====
     def wait_for_success_message(self, timeout=10):
         """Wait for success message to appear"""
-        try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(self.SUCCESS_MESSAGE)
-            )
-            return element.text
-        except TimeoutException:
-            return None
+        return self._wait_for_message(self.SUCCESS_MESSAGE, timeout)
     
     def wait_for_error_message(self, timeout=10):
         """Wait for error message to appear"""
+        return self._wait_for_message(self.ERROR_MESSAGE, timeout)
+    
+    def _wait_for_message(self, locator, timeout):
+        """Wait for the page to go idle, then read the message without a fixed timeout"""
+        # Once the page is idle its deferred updates have run, so the message is either shown or not coming.
+        # A timed-out idle wait or an unsupported driver falls back to the normal explicit wait.
+        if self.wait_until_idle(timeout):
+            timeout = 0
         try:
-            element = WebDriverWait(self.driver, timeout).until(
-                EC.presence_of_element_located(self.ERROR_MESSAGE)
-            )
+            with no_implicit_wait(self.driver):
+                element = self.wait.until(EC.presence_of_element_located(locator), timeout=timeout)
             return element.text
         except TimeoutException:
             return None
@@ -396,17 +460,19 @@ class AdministrationPage:
         return self
     
     def is_element_present(self, locator, timeout=5):
-        """Check if element is present on page"""
+        """Check if element is present on page (the explicit timeout replaces the implicit wait)"""
         try:
-            WebDriverWait(self.driver, timeout).until(EC.presence_of_element_located(locator))
+            with no_implicit_wait(self.driver):
+                self.wait.until(EC.presence_of_element_located(locator), timeout=timeout)
             return True
         except TimeoutException:
             return False
     
     def is_element_visible(self, locator, timeout=5):
-        """Check if element is visible on page"""
+        """Check if element is visible on page (the explicit timeout replaces the implicit wait)"""
         try:
-            WebDriverWait(self.driver, timeout).until(EC.visibility_of_element_located(locator))
+            with no_implicit_wait(self.driver):
+                self.wait.until(EC.visibility_of_element_located(locator), timeout=timeout)
             return True
         except TimeoutException:
             return False
\ No newline at end of file
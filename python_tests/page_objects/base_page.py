@@ -0,0 +1,72 @@
+"""
+Base Page Object shared by all prototype page objects
+Holds the driver, the default wait and the pacing/idle helpers every page needs
+"""
+import time
+
+from selenium.common.exceptions import TimeoutException
+
+from config import TestConfig
+from helpers.form_fill import bulk_fill
+from helpers.idle_tracker import wait_until_idle
+from helpers.implicit_wait import no_implicit_wait
+from helpers.settle import action_pause
+from helpers.waits import AdaptiveWait
+
+
+class BasePage:
+    """Common behaviour for prototype page objects"""
+
+    def __init__(self, driver):
+        self.driver = driver
+        # One adaptive wait per page object; pass timeout= to until() for shorter waits
+        self.wait = AdaptiveWait(driver, TestConfig.IMPLICIT_WAIT)
+        self.last_form_state = None
+
+    def slow_action(self, seconds=None):
+        """Let the page settle after an action (turbo) or add a visible delay (slow motion)"""
+        action_pause(self.driver, seconds)
+
+    def wait_until_idle(self, timeout=None, max_timer_ms=None):
+        """Wait until the page has no pending timers, animation frames or transitions"""
+        return wait_until_idle(self.driver, timeout, max_timer_ms)
+
+    def bulk_fill(self, fields):
+        """
+        Set {name: (locator, value)} in one browser call, firing input/change events.
+        Returns the post-fill state per field, or None if the driver cannot run scripts.
+        """
+        self.last_form_state = bulk_fill(self.driver, fields)
+        return self.last_form_state
+
+    def use_bulk_fill(self, mode=None):
+        """Whether a form fill should use the bulk path ('bulk') or type keystrokes ('keystroke')"""
+        return (mode or TestConfig.FORM_FILL_MODE) == "bulk"
+
+    def find_elements_now(self, locator):
+        """Elements currently matching locator, without blocking on the implicit wait"""
+        with no_implicit_wait(self.driver):
+            return self.driver.find_elements(*locator)
+
+    def is_element_absent(self, locator, timeout=0):
+        """True if no element matches locator (within timeout seconds), without paying the implicit wait"""
+        with no_implicit_wait(self.driver):
+            try:
+                self.wait.until(lambda driver: not driver.find_elements(*locator), timeout=timeout)
+                return True
+            except TimeoutException:
+                return False
+
+    def assert_absent(self, locator, timeout=0, message=None):
+        """Fail fast if an element matching locator is (still) on the page"""
+        assert self.is_element_absent(locator, timeout), message or f"Expected no element matching {locator}"
+        return self
+
+    def advance(self, ms):
+        """Let ms of page time pass: instant under the virtual clock, a real sleep otherwise"""
+        clock = getattr(self.driver, "virtual_clock", None)
+        if clock is not None:
+            clock.advance(ms)
+        else:
+            time.sleep(ms / 1000)
+        return self
@@ -0,0 +1,91 @@
+"""
+Page Object Model for Notification Management Prototype Page
+Provides methods to interact with UI elements in the notification-management.html page
+"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+
+from page_objects.base_page import BasePage
+from page_objects.table_reader import PaginatedTableReader
+
+
+class NotificationManagementPage(BasePage):
+    """Page Object for Notification Management prototype page"""
+
+    PAGE_FILE = "notification-management.html"
+
+    # ===== TAB SELECTORS =====
+    NOTIFICATIONS_TAB = (By.CSS_SELECTOR, ".tab[onclick*=\"'notifications'\"]")
+    OPT_OUT_TAB = (By.CSS_SELECTOR, ".tab[onclick*=\"'opt-out'\"]")
+    HISTORY_TAB = (By.CSS_SELECTOR, ".tab[onclick*=\"'history'\"]")
+
+    # ===== NOTIFICATIONS TABLE SELECTORS =====
+    STATUS_FILTER = (By.ID, "statusFilter")
+    NOTIFICATION_TABLE_HEADERS = (By.CSS_SELECTOR, "#notificationsSection .notification-table thead th")
+    NOTIFICATION_TABLE_ROWS = (By.CSS_SELECTOR, "#notificationTableBody tr")
+    NOTIFICATION_NEXT_PAGE_BTN = (By.ID, "nextBtn")
+
+    # ===== OPT-OUT TABLE SELECTORS =====
+    OPT_OUT_TABLE_HEADERS = (By.CSS_SELECTOR, "#optOutSection thead th")
+    OPT_OUT_TABLE_ROWS = (By.CSS_SELECTOR, "#optOutTableBody tr")
+    OPT_OUT_NEXT_PAGE_BTN = (By.CSS_SELECTOR, "#optOutSection .pagination button:last-child")
+
+    # ===== HISTORY TABLE SELECTORS =====
+    HISTORY_INCIDENT_SEARCH = (By.ID, "historyIncidentSearch")
+    HISTORY_TABLE_HEADERS = (By.CSS_SELECTOR, "#historySection thead th")
+    HISTORY_TABLE_ROWS = (By.CSS_SELECTOR, "#historyTableBody tr")
+    HISTORY_NEXT_PAGE_BTN = (By.CSS_SELECTOR, "#historySection .pagination button:last-child")
+
+    # ===== NAVIGATION METHODS =====
+    def click_notifications_tab(self):
+        """Show the notifications list"""
+        self.wait.until(EC.element_to_be_clickable(self.NOTIFICATIONS_TAB)).click()
+        self.slow_action()
+        return self
+
+    def click_opt_out_tab(self):
+        """Show the opt-out records"""
+        self.wait.until(EC.element_to_be_clickable(self.OPT_OUT_TAB)).click()
+        self.slow_action()
+        return self
+
+    def click_history_tab(self):
+        """Show the notification history"""
+        self.wait.until(EC.element_to_be_clickable(self.HISTORY_TAB)).click()
+        self.slow_action()
+        return self
+
+    # ===== TABLE READERS =====
+    def notification_table(self):
+        """Reader streaming the notifications table page by page"""
+        return PaginatedTableReader(self.driver, self.NOTIFICATION_TABLE_ROWS,
+                                    next_locator=self.NOTIFICATION_NEXT_PAGE_BTN,
+                                    headers_locator=self.NOTIFICATION_TABLE_HEADERS)
+
+    def opt_out_table(self):
+        """Reader streaming the opt-out records table page by page"""
+        return PaginatedTableReader(self.driver, self.OPT_OUT_TABLE_ROWS,
+                                    next_locator=self.OPT_OUT_NEXT_PAGE_BTN,
+                                    headers_locator=self.OPT_OUT_TABLE_HEADERS)
+
+    def history_table(self):
+        """Reader streaming the notification history table page by page"""
+        return PaginatedTableReader(self.driver, self.HISTORY_TABLE_ROWS,
+                                    next_locator=self.HISTORY_NEXT_PAGE_BTN,
+                                    headers_locator=self.HISTORY_TABLE_HEADERS)
+
+    # ===== FILTER METHODS =====
+    def filter_notifications_by_status(self, status):
+        """Filter notifications by status"""
+        Select(self.driver.find_element(*self.STATUS_FILTER)).select_by_visible_text(status)
+        self.slow_action()
+        return self
+
+    def search_history_by_incident(self, incident_id):
+        """Search notification history by incident ID"""
+        search_input = self.wait.until(EC.presence_of_element_located(self.HISTORY_INCIDENT_SEARCH))
+        search_input.clear()
+        search_input.send_keys(incident_id)
+        self.slow_action()
+        return self
@@ -0,0 +1,56 @@
+"""
+Page Object Model for Outage History Prototype Page
+Provides methods to interact with UI elements in the outage-history.html page
+"""
+from selenium.webdriver.common.by import By
+from selenium.webdriver.support import expected_conditions as EC
+from selenium.webdriver.support.ui import Select
+
+from page_objects.base_page import BasePage
+from page_objects.table_reader import PaginatedTableReader
+
+
+class OutageHistoryPage(BasePage):
+    """Page Object for Outage History prototype page"""
+
+    PAGE_FILE = "outage-history.html"
+
+    # ===== FILTER SELECTORS =====
+    STATUS_FILTER = (By.ID, "statusFilter")
+    DISTRICT_FILTER = (By.ID, "districtFilter")
+    INCIDENT_SEARCH_INPUT = (By.ID, "incidentSearch")
+
+    # ===== HISTORY TABLE SELECTORS =====
+    HISTORY_TABLE = (By.ID, "historyTable")
+    HISTORY_TABLE_HEADERS = (By.CSS_SELECTOR, "#historyTable thead th")
+    HISTORY_TABLE_ROWS = (By.CSS_SELECTOR, "#historyTableBody tr")
+
+    # ===== PAGINATION SELECTORS =====
+    PREV_PAGE_BTN = (By.ID, "prevBtn")
+    NEXT_PAGE_BTN = (By.ID, "nextBtn")
+
+    def history_table(self):
+        """Reader streaming the outage history table page by page"""
+        return PaginatedTableReader(self.driver, self.HISTORY_TABLE_ROWS,
+                                    next_locator=self.NEXT_PAGE_BTN,
+                                    headers_locator=self.HISTORY_TABLE_HEADERS)
+
+    def search_incidents(self, search_term):
+        """Search outages by incident ID or address"""
+        search_input = self.wait.until(EC.presence_of_element_located(self.INCIDENT_SEARCH_INPUT))
+        search_input.clear()
+        search_input.send_keys(search_term)
+        self.slow_action()
+        return self
+
+    def filter_by_status(self, status):
+        """Filter outages by incident status"""
+        Select(self.driver.find_element(*self.STATUS_FILTER)).select_by_visible_text(status)
+        self.slow_action()
+        return self
+
+    def filter_by_district(self, district):
+        """Filter outages by district"""
+        Select(self.driver.find_element(*self.DISTRICT_FILTER)).select_by_visible_text(district)
+        self.slow_action()
+        return self
@@ -0,0 +1,155 @@
+"""
+Paginated table reader
+Streams table rows page by page. Each page is extracted (and the next page
+requested) in a single script call, so reading or verifying a whole table costs
+one round trip per page instead of one per cell.
+
+A Next button that is enabled but does not change the rows within
+TABLE_PAGE_CHANGE_TIMEOUT (pagination not wired up, as in the outage history
+prototype) ends the table at the current page. It is logged once, and later
+readers of the same table stop there without clicking it again.
+"""
+from config import TestConfig
+from helpers.event_log import get_logger
+from helpers.table_extract import css_selector
+
+log = get_logger("tables")
+
+# (rows selector, next selector) of tables whose Next button did not change the rows
+_unresponsive_next = set()
+
+# arguments: spec, advance (click next first), page change timeout in ms, done callback.
+# Uses the real timers when the virtual clock is installed.
+READ_PAGE_SCRIPT = """
+var spec = arguments[0];
+var advance = arguments[1];
+var timeoutMs = arguments[2];
+var done = arguments[arguments.length - 1];
+var clock = window.__e2eClock;
+var now = clock ? clock.real.now : performance.now.bind(performance);
+var later = clock ? clock.real.setTimeout : setTimeout;
+
+function visible(element) { return element.getClientRects().length > 0; }
+function cellText(element) {
+    if (!visible(element)) { return ''; }
+    return (element.innerText || '').replace(/\\u00a0/g, ' ').trim();
+}
+function rowElements() {
+    var rows = Array.prototype.slice.call(document.querySelectorAll(spec.rows));
+    return spec.visibleOnly ? rows.filter(visible) : rows;
+}
+function signature() {
+    return Array.prototype.map.call(document.querySelectorAll(spec.rows), function (row) {
+        return row.textContent;
+    }).join('\\u0001');
+}
+function nextButton() {
+    var button = spec.next ? document.querySelector(spec.next) : null;
+    if (!button || !visible(button) || button.disabled) { return null; }
+    if (button.getAttribute('aria-disabled') === 'true' || button.classList.contains('disabled')) { return null; }
+    return button;
+}
+function extract(advanced) {
+    return {
+        headers: spec.headers ? Array.prototype.map.call(document.querySelectorAll(spec.headers), cellText) : [],
+        rows: rowElements().map(function (row) {
+            return Array.prototype.map.call(row.querySelectorAll(spec.cells), cellText);
+        }),
+        hasNext: nextButton() !== null,
+        advanced: advanced
+    };
+}
+
+if (!advance) { done(extract(false)); return; }
+var button = nextButton();
+if (!button) { done(extract(false)); return; }
+var before = signature();
+var start = now();
+button.click();
+(function check() {
+    if (signature() !== before) { done(extract(true)); return; }
+    if (now() - start >= timeoutMs) { done(extract(false)); return; }
+    later(check, 10);
+})();
+"""
+
+
+class TablePage:
+    """One page of table rows"""
+
+    def __init__(self, number, headers, rows):
+        self.number = number
+        self.headers = headers
+        self.rows = rows
+
+    def __repr__(self):
+        return f"TablePage({self.number}: {len(self.rows)} rows)"
+
+
+class PaginatedTableReader:
+    """Reads a prev/next paginated table as a stream of pages and rows"""
+
+    def __init__(self, driver, rows_locator, next_locator=None, headers_locator=None,
+                 cells="td", visible_only=True, max_pages=None):
+        self.driver = driver
+        self._spec = {
+            'rows': css_selector(rows_locator),
+            'next': css_selector(next_locator) if next_locator else None,
+            'headers': css_selector(headers_locator) if headers_locator else None,
+            'cells': cells,
+            'visibleOnly': visible_only,
+        }
+        self.max_pages = max_pages or TestConfig.TABLE_MAX_PAGES
+        self.pages_read = 0
+        self.rows_read = 0
+
+    def pages(self):
+        """Yield TablePage objects, requesting the next page only when the caller asks for it"""
+        timeout_ms = TestConfig.TABLE_PAGE_CHANGE_TIMEOUT * 1000
+        table = (self._spec['rows'], self._spec['next'])
+        page = self.driver.execute_async_script(READ_PAGE_SCRIPT, self._spec, False, timeout_ms)
+        number = 1
+        while isinstance(page, dict):
+            self.pages_read += 1
+            yield TablePage(number, page['headers'], page['rows'])
+            if not page['hasNext'] or number >= self.max_pages or table in _unresponsive_next:
+                return
+            page = self.driver.execute_async_script(READ_PAGE_SCRIPT, self._spec, True, timeout_ms)
+            if not isinstance(page, dict):
+                return
+            if not page['advanced']:
+                # Next was enabled but the rows stayed the same: pagination is not wired up
+                _unresponsive_next.add(table)
+                log.warning("⚠️  %s did not change %s within %ss; reading only page %d of this table from now on",
+                            self._spec['next'], self._spec['rows'], TestConfig.TABLE_PAGE_CHANGE_TIMEOUT, number)
+                return
+            number += 1
+
+    def rows(self):
+        """Yield rows (lists of cell text) across all pages"""
+        for page in self.pages():
+            for row in page.rows:
+                self.rows_read += 1
+                yield row
+
+    def records(self):
+        """Yield rows as dicts keyed by header text (sort arrows stripped)"""
+        for page in self.pages():
+            keys = [header.replace("⇅", "").strip() or str(index) for index, header in enumerate(page.headers)]
+            for row in page.rows:
+                self.rows_read += 1
+                if keys:
+                    yield dict(zip(keys, row))
+                else:
+                    yield dict(enumerate(row))
+
+    def find(self, predicate):
+        """Return the first record matching predicate, stopping at the page that contains it"""
+        for record in self.records():
+            if predicate(record):
+                return record
+        return None
+
+    def first_mismatch(self, predicate):
+        """Return the first record that does not satisfy predicate (None when all rows match, after every page)"""
+        return self.find(lambda record: not predicate(record))